@@ -33,6 +33,8 @@ class ConfigManager:
         self._config: dict[str, Any] = {}
         self._config_path: Path = self._get_config_path()
         self._loaded = False
+        # Bumped on every successful (re)load so consumers can spot stale settings
+        self.generation = 0
 
     def _get_config_path(self) -> Path:
         """Get the path to the configuration file."""
@@ -70,6 +72,7 @@ class ConfigManager:
             # Validate configuration
             self._validate_config()
             self._loaded = True
+            self.generation += 1
 
             logger.info("Configuration loaded successfully")
 
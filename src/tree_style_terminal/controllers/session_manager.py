@@ -19,6 +19,7 @@ gi.require_version('Gtk', '3.0')
 gi.require_version('Vte', '2.91')
 from gi.repository import GLib
 
+from ..config import config_manager
 from ..models.session import TerminalSession
 from ..models.tree import SessionTree
 from ..widgets.terminal import VteTerminal
@@ -62,6 +63,12 @@ class SessionManager:
         # Current theme for terminals
         self._current_theme = "dark"
 
+        # One pre-built terminal widget kept ready for the next session
+        self._spare_terminal: VteTerminal | None = None
+        self._spare_terminal_source_id = 0
+        # Config generation the spare terminal was built with
+        self._spare_config_generation = 0
+
         logger.debug("SessionManager initialized")
 
     def new_session(
@@ -92,7 +99,7 @@ class SessionManager:
                 cwd = parent.cwd if parent and parent.cwd else os.path.expanduser("~")
 
             # Create VTE terminal widget
-            terminal_widget = VteTerminal()
+            terminal_widget = self._take_terminal_widget()
 
             # Apply current theme to the new terminal
             terminal_widget.apply_theme(self._current_theme)
@@ -135,12 +142,56 @@ class SessionManager:
                 self._session_created_callback(session, terminal_widget)
 
             logger.info(f"Created new session: {session.title}")
+            self._schedule_spare_terminal()
             return session
 
         except Exception as e:
             logger.error(f"Error creating session: {e}")
             return None
 
+    def _take_terminal_widget(self) -> VteTerminal:
+        """Return the pre-built spare terminal widget, or build a new one."""
+        if self._spare_config_generation != config_manager.generation:
+            # The spare was configured before the last config reload
+            self._discard_spare_terminal()
+        terminal_widget, self._spare_terminal = self._spare_terminal, None
+        if terminal_widget is not None:
+            return terminal_widget
+        return VteTerminal()
+
+    def _schedule_spare_terminal(self) -> None:
+        """Build the next session's terminal widget once the main loop is idle."""
+        if self._spare_terminal is not None or self._spare_terminal_source_id:
+            return
+        self._spare_terminal_source_id = GLib.idle_add(
+            self._build_spare_terminal,
+            priority=GLib.PRIORITY_LOW,
+        )
+
+    def _build_spare_terminal(self) -> bool:
+        """Idle callback that fills the spare terminal slot."""
+        self._spare_terminal_source_id = 0
+        if self._spare_terminal is None:
+            try:
+                self._spare_terminal = VteTerminal()
+                self._spare_config_generation = config_manager.generation
+            except Exception as e:
+                logger.debug(f"Failed to pre-build terminal widget: {e}")
+        return False
+
+    def _discard_spare_terminal(self) -> None:
+        """Destroy the spare terminal widget, if one was built."""
+        spare_terminal, self._spare_terminal = self._spare_terminal, None
+        if spare_terminal is not None:
+            spare_terminal.destroy()
+
+    def shutdown(self) -> None:
+        """Cancel the pending spare terminal build and destroy the spare."""
+        if self._spare_terminal_source_id:
+            GLib.source_remove(self._spare_terminal_source_id)
+            self._spare_terminal_source_id = 0
+        self._discard_spare_terminal()
+
     def create_workspace_trees(self, roots: list[WorkspaceNode]) -> list[TerminalSession]:
         """Create all roots from a validated profile, then apply its selection."""
         created_roots = []
@@ -466,9 +517,11 @@ class SessionManager:
         """
         self._current_theme = theme_name
 
-        # Apply theme to all existing terminals
+        # Apply theme to all existing terminals and the spare
         for terminal_widget in self._session_terminals.values():
             terminal_widget.apply_theme(theme_name)
+        if self._spare_terminal is not None:
+            self._spare_terminal.apply_theme(theme_name)
 
         logger.debug(f"Applied {theme_name} theme to all sessions")
 
@@ -40,6 +40,8 @@ class ShortcutController:
         self.session_manager = session_manager
         self.main_window = main_window
         self._actions: dict[str, Gio.SimpleAction] = {}
+        # Last enabled state set on each action, so unchanged states are skipped
+        self._enabled_states: dict[str, bool] = {}
         self._accel_group: Gtk.AccelGroup | None = None
 
         self._setup_actions()
@@ -140,6 +142,7 @@ class ShortcutController:
         action.connect("activate", callback)
         action.set_enabled(enabled)
         self._actions[name] = action
+        self._enabled_states[name] = enabled
         logger.debug(f"Created action: {name}")
 
     def _on_new_child(self, action: Gio.SimpleAction, parameter: GLib.Variant) -> None:
@@ -186,12 +189,8 @@ class ShortcutController:
     def _on_toggle_sidebar(self, action: Gio.SimpleAction, parameter: GLib.Variant) -> None:
         """Handle toggle_sidebar action activation."""
         try:
-            if self.main_window and hasattr(self.main_window, 'toggle_sidebar'):
+            if self.main_window:
                 self.main_window.toggle_sidebar()
-            elif self.main_window and hasattr(self.main_window, 'sidebar_revealer'):
-                current_state = self.main_window.sidebar_revealer.get_reveal_child()
-                self.main_window.sidebar_revealer.set_reveal_child(not current_state)
-                logger.debug(f"Sidebar {'shown' if not current_state else 'hidden'}")
         except Exception as e:
             logger.error(f"Error toggling sidebar: {e}")
 
@@ -215,11 +214,7 @@ class ShortcutController:
     def _on_focus_sidebar(self, action: Gio.SimpleAction, parameter: GLib.Variant) -> None:
         """Handle focus_sidebar action activation."""
         try:
-            if (
-                self.main_window
-                and hasattr(self.main_window, 'session_sidebar')
-                and hasattr(self.main_window.session_sidebar, 'grab_focus')
-            ):
+            if self.main_window and self.main_window.session_sidebar is not None:
                 self.main_window.session_sidebar.grab_focus()
                 logger.debug("Focused sidebar")
         except Exception as e:
@@ -280,10 +275,7 @@ class ShortcutController:
     ) -> None:
         """Ask the main window to draft a command for the active terminal."""
         try:
-            if self.main_window and hasattr(
-                self.main_window,
-                "request_ai_command_draft",
-            ):
+            if self.main_window:
                 self.main_window.request_ai_command_draft()
         except Exception as e:
             logger.error("Failed to start AI command drafting: %s", type(e).__name__)
@@ -324,7 +316,10 @@ class ShortcutController:
         """
         action = self._actions.get(name)
         if action:
+            if self._enabled_states.get(name) == enabled:
+                return
             action.set_enabled(enabled)
+            self._enabled_states[name] = enabled
             logger.debug(f"Action {name} {'enabled' if enabled else 'disabled'}")
         else:
             logger.warning(f"Action not found: {name}")
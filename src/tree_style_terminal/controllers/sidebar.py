@@ -8,6 +8,7 @@ synchronization between the SessionTree domain model and the GTK tree view.
 from __future__ import annotations
 
 import logging
+from collections import deque
 
 import gi
 
@@ -59,13 +60,16 @@ class SidebarController:
         self.tree_store.clear()
         self._session_to_iter.clear()
 
-        # Add all root nodes and their children recursively
+        # Add all root nodes together with their subtrees
         for root_session in self.session_tree.get_roots():
-            self._add_session_recursive(root_session, None)
+            self._add_session_subtree(root_session, None)
 
-    def _add_session_recursive(self, session: TerminalSession, parent_iter: Gtk.TreeIter | None) -> Gtk.TreeIter:
+    def _add_session_subtree(self, session: TerminalSession, parent_iter: Gtk.TreeIter | None) -> Gtk.TreeIter:
         """
-        Add a session and all its children to the TreeStore recursively.
+        Add a session and all its descendants to the TreeStore.
+
+        Walks the subtree with an explicit queue, so deep trees do not hit the
+        recursion limit. Siblings keep their order under each parent.
 
         Args:
             session: The session to add
@@ -74,17 +78,14 @@ class SidebarController:
         Returns:
             The TreeIter for the added session
         """
-        # Add the session to the tree store
-        tree_iter = self.tree_store.append(parent_iter, [session, session.title])
-
-        # Track the mapping
-        self._session_to_iter[session] = tree_iter
+        pending = deque([(session, parent_iter)])
+        while pending:
+            current, current_parent_iter = pending.popleft()
+            tree_iter = self.tree_store.append(current_parent_iter, [current, current.title])
+            self._session_to_iter[current] = tree_iter
+            pending.extend((child, tree_iter) for child in current.children)
 
-        # Add all children recursively
-        for child in session.children:
-            self._add_session_recursive(child, tree_iter)
-
-        return tree_iter
+        return self._session_to_iter[session]
 
     def add_session(self, session: TerminalSession, parent: TerminalSession | None = None) -> None:
         """
@@ -108,23 +109,6 @@ class SidebarController:
 
         logger.debug(f"Added session to TreeStore: {session.title}")
 
-    def _restore_children_data(self, children_data: list[tuple[TerminalSession, str]], new_parent_iter: Gtk.TreeIter | None) -> None:
-        """
-        Restore children data to TreeStore at new parent location.
-
-        Args:
-            children_data: List of (session, title) tuples to restore
-            new_parent_iter: TreeIter of new parent, or None for root level
-        """
-        for session, title in children_data:
-            # Add child at new location
-            new_iter = self.tree_store.append(new_parent_iter, [session, title])
-
-            # Update mapping
-            self._session_to_iter[session] = new_iter
-
-            logger.debug(f"Restored child session in TreeStore: {title}")
-
     def remove_session_with_adoption(self, session: TerminalSession, adopted_children: list[TerminalSession], new_parent: TerminalSession | None = None) -> None:
         """
         Remove a session and handle adoption of its children.
@@ -139,20 +123,9 @@ class SidebarController:
             logger.warning(f"Session not found in TreeStore: {session}")
             return
 
-        # Extract children data before removal
-        children_data = []
-        for child_session in adopted_children:
-            child_iter = self._session_to_iter.get(child_session)
-            if child_iter is not None:
-                title = self.tree_store.get_value(child_iter, self.COL_TITLE)
-                children_data.append((child_session, title))
-
         # Remove from TreeStore (this removes all children too)
         self.tree_store.remove(tree_iter)
-
-        # Clean up mapping for the removed session
-        if session in self._session_to_iter:
-            del self._session_to_iter[session]
+        del self._session_to_iter[session]
 
         # Get new parent iterator
         if new_parent is None:
@@ -163,8 +136,9 @@ class SidebarController:
                 logger.warning(f"New parent session not found in TreeStore: {new_parent}")
                 new_parent_iter = None  # Fallback to root level
 
-        # Restore children at new location
-        self._restore_children_data(children_data, new_parent_iter)
+        # Re-add the adopted subtrees at their new location
+        for child_session in adopted_children:
+            self._add_session_subtree(child_session, new_parent_iter)
 
         logger.debug(f"Removed session with adoption: {session.title}")
 
@@ -2,6 +2,7 @@
 
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 
 import gi
@@ -17,6 +18,43 @@ from .config import ConfigError, config_manager
 logger = logging.getLogger("tree_style_terminal.main")
 
 
+@lru_cache(maxsize=8)
+def resolve_configured_dpi_scale(
+    override_dpi, env_dpi, config_dpi_scale
+) -> tuple[float | None, tuple[str, ...]]:
+    """
+    Resolve the DPI scale from CLI, environment, or config.
+
+    Returns the scale (None means auto-detect) and the names of the settings
+    that held invalid values. Warnings are left to the caller so cached
+    results still report them.
+    """
+    invalid: list[str] = []
+
+    # Priority 1: Command-line override
+    if override_dpi:
+        return float(override_dpi) / 96.0, ()
+
+    # Priority 2: Environment variable
+    if env_dpi:
+        try:
+            return float(env_dpi) / 96.0, ()
+        except ValueError:
+            invalid.append("TST_DPI")
+
+    # Priority 3: Configuration file
+    if config_dpi_scale != "auto":
+        if isinstance(config_dpi_scale, int | float):
+            return float(config_dpi_scale), tuple(invalid)
+        elif isinstance(config_dpi_scale, str):
+            try:
+                return float(config_dpi_scale), tuple(invalid)
+            except ValueError:
+                invalid.append("dpi_scale")
+
+    return None, tuple(invalid)
+
+
 class CSSLoader:
     """Handles CSS loading and theme management for the application."""
 
@@ -151,27 +189,18 @@ class CSSLoader:
     def _calculate_effective_dpi_scale(self):
         """Calculate the effective DPI scale factor using priority: CLI > ENV > Config > Auto."""
         try:
-            # Priority 1: Command-line override
-            if self._override_dpi:
-                return float(self._override_dpi) / 96.0
-
-            # Priority 2: Environment variable
             env_dpi = os.environ.get('TST_DPI')
-            if env_dpi:
-                try:
-                    return float(env_dpi) / 96.0
-                except ValueError:
-                    logger.warning("Invalid TST_DPI value %r, ignoring", env_dpi)
-
-            # Priority 3: Configuration file
-            if self._config_dpi_scale != "auto":
-                if isinstance(self._config_dpi_scale, int | float):
-                    return float(self._config_dpi_scale)
-                elif isinstance(self._config_dpi_scale, str):
-                    try:
-                        return float(self._config_dpi_scale)
-                    except ValueError:
-                        logger.warning("Invalid dpi_scale value %r, using auto", self._config_dpi_scale)
+            scale, invalid = resolve_configured_dpi_scale(
+                self._override_dpi,
+                env_dpi,
+                self._config_dpi_scale,
+            )
+            if "TST_DPI" in invalid:
+                logger.warning("Invalid TST_DPI value %r, ignoring", env_dpi)
+            if "dpi_scale" in invalid:
+                logger.warning("Invalid dpi_scale value %r, using auto", self._config_dpi_scale)
+            if scale is not None:
+                return scale
 
             # Priority 4: Auto-detection
             return self._detect_system_dpi_scale()
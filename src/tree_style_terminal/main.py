@@ -11,7 +11,9 @@ import argparse
 import logging
 import os
 import sys
+from contextlib import suppress
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 import gi
@@ -45,6 +47,15 @@ logger = logging.getLogger(__name__)
 
 DEFAULT_WINDOW_WIDTH = 1024
 
+# GDK_PRIORITY_REDRAW: runs after input dispatch but ahead of default idle work.
+SIDEBAR_REVEAL_PRIORITY = GLib.PRIORITY_HIGH_IDLE + 20
+
+# Theme toggle icon and tooltip, keyed by the currently active theme.
+THEME_BUTTON_ICONS = {"dark": "weather-clear-symbolic"}
+THEME_BUTTON_DEFAULT_ICON = "weather-clear-night-symbolic"
+THEME_BUTTON_TOOLTIPS = {"dark": "Switch to Light Theme"}
+THEME_BUTTON_DEFAULT_TOOLTIP = "Switch to Dark Theme"
+
 
 @dataclass(frozen=True)
 class SidebarWidthBounds:
@@ -83,8 +94,14 @@ def workspace_profile_start_directory(
     return home
 
 
+@lru_cache(maxsize=64)
 def calculate_sidebar_width_bounds(window_width: int) -> SidebarWidthBounds:
-    """Calculate sidebar min/default/max widths from the available window width."""
+    """
+    Calculate sidebar min/default/max widths from the available window width.
+
+    Results are cached because paned drags re-query the same width on every
+    position notification.
+    """
     available_width = max(window_width, 1)
     minimum = max(150, min(round(available_width * 0.12), 260))
     default = max(250, min(round(available_width * 0.22), 560))
@@ -110,6 +127,73 @@ def configure_sidebar_paned(paned: Gtk.Paned) -> None:
         paned.set_wide_handle(False)
 
 
+@dataclass(frozen=True)
+class DPIInfo:
+    """Display and font settings read once for the DPI diagnostics output."""
+
+    width: int
+    height: int
+    width_mm: int
+    height_mm: int
+    avg_dpi: float
+    font_name: str | None
+    mono_font: str | None
+    xft_dpi: int | None
+    base_font_size: float
+
+
+def compute_dpi_info() -> DPIInfo:
+    """Read GTK font settings and primary monitor geometry for DPI reporting."""
+    settings = Gtk.Settings.get_default()
+    screen = Gdk.Screen.get_default()
+
+    # System font information
+    font_name = settings.get_property("gtk-font-name")
+    try:
+        mono_font = settings.get_property("gtk-monospace-font-name")
+    except (AttributeError, TypeError):
+        try:
+            mono_font = settings.get_property("gtk-monospace-font")
+        except (AttributeError, TypeError):
+            mono_font = None
+    xft_dpi = settings.get_property("gtk-xft-dpi")
+
+    # Display information
+    display = screen.get_display()
+    monitor = display.get_primary_monitor() or display.get_monitor(0)
+    geometry = monitor.get_geometry()
+    width = geometry.width
+    height = geometry.height
+    width_mm = monitor.get_width_mm()
+    height_mm = monitor.get_height_mm()
+
+    # Calculate actual DPI
+    if width_mm > 0 and height_mm > 0:
+        dpi_x = (width * 25.4) / width_mm
+        dpi_y = (height * 25.4) / height_mm
+        avg_dpi = (dpi_x + dpi_y) / 2
+    else:
+        avg_dpi = 96  # fallback
+
+    # Parse system font size
+    base_font_size = 10.0
+    if font_name:
+        with suppress(ValueError, IndexError):
+            base_font_size = float(font_name.split()[-1])
+
+    return DPIInfo(
+        width=width,
+        height=height,
+        width_mm=width_mm,
+        height_mm=height_mm,
+        avg_dpi=avg_dpi,
+        font_name=font_name,
+        mono_font=mono_font,
+        xft_dpi=xft_dpi,
+        base_font_size=base_font_size,
+    )
+
+
 class MainWindow(Gtk.ApplicationWindow):
     """Main application window with tree-style terminal layout."""
 
@@ -131,10 +215,11 @@ class MainWindow(Gtk.ApplicationWindow):
         # Add CSS class to window
         self.get_style_context().add_class("main-window")
 
+        # The application's CSS loader lives as long as the window
+        self._css_loader: CSSLoader = application.css_loader
+
         # Add theme class to window for CSS targeting
-        app = application
-        if hasattr(app, 'css_loader') and hasattr(app.css_loader, 'current_theme'):
-            self.get_style_context().add_class(app.css_loader.current_theme)
+        self.get_style_context().add_class(self._css_loader.current_theme)
 
         # Set up window properties
         self.set_title("Tree Style Terminal")
@@ -148,8 +233,16 @@ class MainWindow(Gtk.ApplicationWindow):
         # Initialize shortcut controller
         self.shortcut_controller = ShortcutController(self.session_manager, self)
 
-        # Sidebar state management
+        # Sidebar state management; widgets are assigned once the UI is loaded
+        self.sidebar_revealer: Gtk.Revealer | None = None
+        self.session_sidebar: SessionSidebar | None = None
         self._sidebar_collapsed = False
+        self._sidebar_uses_dynamic_default = False
+        self._updating_sidebar_position = False
+        self._programmatic_sidebar_position: int | None = None
+
+        # Theme toggle icons are created once and reused on every toggle
+        self._theme_icons: dict[str, Gtk.Image] = {}
 
         # Create header bar
         self._setup_headerbar()
@@ -163,6 +256,9 @@ class MainWindow(Gtk.ApplicationWindow):
         # Set up session management callbacks
         self._setup_session_callbacks()
 
+        # Release the spare terminal when the window goes away
+        self.connect("destroy", self._on_destroy)
+
         # Don't create initial session in constructor to allow clean testing
         # Initial session will be created when needed
 
@@ -285,9 +381,7 @@ class MainWindow(Gtk.ApplicationWindow):
 
         # Add theme toggle button
         self.theme_toggle_button = Gtk.Button()
-        self.theme_toggle_button.set_image(
-            Gtk.Image.new_from_icon_name("weather-clear-night-symbolic", Gtk.IconSize.BUTTON)
-        )
+        self.theme_toggle_button.set_image(self._get_theme_icon(THEME_BUTTON_DEFAULT_ICON))
         self.theme_toggle_button.set_tooltip_text("Toggle Dark/Light Theme")
         self.theme_toggle_button.connect("clicked", self._on_theme_toggle_clicked)
         self.headerbar.pack_end(self.theme_toggle_button)
@@ -340,7 +434,7 @@ class MainWindow(Gtk.ApplicationWindow):
         self._set_sidebar_position(self._saved_sidebar_width)
 
         # Connect paned position changes if main_container is a Paned
-        if hasattr(self.main_paned, 'get_position') and callable(getattr(self.main_paned, 'get_position', None)):
+        if isinstance(self.main_paned, Gtk.Paned):
             self.main_paned.connect("notify::position", self._on_paned_position_changed)
             self.main_paned.connect("size-allocate", self._on_paned_size_allocate)
 
@@ -529,14 +623,14 @@ class MainWindow(Gtk.ApplicationWindow):
 
     def _on_theme_toggle_clicked(self, button: Gtk.Button) -> None:
         """Handle theme toggle button click."""
-        app = self.get_application()
-        app.css_loader.toggle_theme()
+        self._css_loader.toggle_theme()
+        current_theme = self._css_loader.current_theme
 
         # Update all terminals with the new theme
-        self._update_terminal_themes(app.css_loader.current_theme)
+        self._update_terminal_themes(current_theme)
 
         # Update window CSS class for theme
-        self._update_window_theme_class(app.css_loader.current_theme)
+        self._update_window_theme_class(current_theme)
 
         # Update button icon based on current theme
         self._update_theme_button_icon()
@@ -669,25 +763,23 @@ class MainWindow(Gtk.ApplicationWindow):
         has_current_session = self.session_manager.current_session is not None
         has_sessions = not self.session_tree.is_empty()
 
-        # Update HeaderBar buttons if they exist
-        if hasattr(self, 'new_sibling_button'):
-            self.new_sibling_button.set_sensitive(True)  # Always available
-        if hasattr(self, 'new_child_button'):
-            self.new_child_button.set_sensitive(True)  # Always available
-        if hasattr(self, 'close_session_button'):
-            self.close_session_button.set_sensitive(has_current_session)
-        if hasattr(self, 'export_profile_button'):
-            self.export_profile_button.set_sensitive(has_sessions)
-            self.export_selected_menu_item.set_sensitive(has_current_session)
-            self.export_all_menu_item.set_sensitive(has_sessions)
-        if hasattr(self, 'search_button'):
-            self.search_button.set_sensitive(has_current_session)
-        if hasattr(self, 'ai_command_controller'):
-            self.ai_command_controller.set_terminal_available(has_current_session)
+        # Update HeaderBar buttons
+        self.new_sibling_button.set_sensitive(True)  # Always available
+        self.new_child_button.set_sensitive(True)  # Always available
+        self.close_session_button.set_sensitive(has_current_session)
+        self.export_profile_button.set_sensitive(has_sessions)
+        self.export_selected_menu_item.set_sensitive(has_current_session)
+        self.export_all_menu_item.set_sensitive(has_sessions)
+        self.search_button.set_sensitive(has_current_session)
+        self.ai_command_controller.set_terminal_available(has_current_session)
 
         # Update shortcut controller action states
         self.shortcut_controller.update_action_states()
 
+    def _on_destroy(self, _window: Gtk.Window) -> None:
+        """Shut down the session manager with the window."""
+        self.session_manager.shutdown()
+
     def _setup_session_callbacks(self) -> None:
         """Set up callbacks for session management."""
         self.session_manager.set_session_created_callback(self._on_session_created)
@@ -696,9 +788,7 @@ class MainWindow(Gtk.ApplicationWindow):
         self.session_manager.set_session_changed_callback(self._on_session_changed)
 
         # Set initial theme in session manager
-        app = self.get_application()
-        if app and hasattr(app, 'css_loader'):
-            self.session_manager.set_theme(app.css_loader.current_theme)
+        self.session_manager.set_theme(self._css_loader.current_theme)
 
     def _on_session_created(self, session: TerminalSession, terminal_widget: VteTerminal) -> None:
         """
@@ -828,7 +918,7 @@ class MainWindow(Gtk.ApplicationWindow):
 
     def toggle_sidebar(self) -> None:
         """Toggle sidebar visibility."""
-        if hasattr(self, 'sidebar_revealer') and self.sidebar_revealer:
+        if self.sidebar_revealer is not None:
             logger.debug(
                 "Sidebar toggle: collapsed=%s -> %s",
                 self._sidebar_collapsed,
@@ -870,7 +960,7 @@ class MainWindow(Gtk.ApplicationWindow):
 
             # Then show the revealer content
             # Use idle_add to ensure position is set before revealing content
-            GLib.idle_add(lambda: self.sidebar_revealer.set_reveal_child(True))
+            GLib.idle_add(self._reveal_sidebar_child, priority=SIDEBAR_REVEAL_PRIORITY)
 
             logger.debug("Sidebar expanded (paned, restored width: %s)", self._saved_sidebar_width)
         else:
@@ -882,20 +972,24 @@ class MainWindow(Gtk.ApplicationWindow):
 
         self._sidebar_collapsed = False
 
+    def _reveal_sidebar_child(self) -> bool:
+        """Reveal the sidebar content once the restored position is applied."""
+        self.sidebar_revealer.set_reveal_child(True)
+        return False
+
     def _is_paned_layout(self) -> bool:
         """Check if we're using Paned layout (manual UI) vs Box layout (UI file)."""
-        return hasattr(self.main_paned, 'get_position') and callable(getattr(self.main_paned, 'get_position', None))
+        return isinstance(self.main_paned, Gtk.Paned)
 
     def _on_paned_position_changed(self, paned: Gtk.HPaned, param_spec: object) -> None:
         """Handle paned position changes to enforce width constraints."""
-        if not hasattr(self, '_sidebar_collapsed') or self._sidebar_collapsed:
+        if self._sidebar_collapsed:
             return
 
         current_position = paned.get_position()
-        expected_position = getattr(self, "_programmatic_sidebar_position", None)
-        if expected_position is not None:
+        if self._programmatic_sidebar_position is not None:
             self._programmatic_sidebar_position = None
-        elif not getattr(self, "_updating_sidebar_position", False):
+        elif not self._updating_sidebar_position:
             self._sidebar_uses_dynamic_default = False
 
         bounds = self._get_sidebar_bounds(paned)
@@ -909,12 +1003,12 @@ class MainWindow(Gtk.ApplicationWindow):
 
     def _on_paned_size_allocate(self, paned: Gtk.HPaned, allocation: Gdk.Rectangle) -> None:
         """Keep sidebar size within bounds after the window is resized."""
-        if not hasattr(self, '_sidebar_collapsed') or self._sidebar_collapsed:
+        if self._sidebar_collapsed:
             return
 
         bounds = calculate_sidebar_width_bounds(allocation.width)
         current_position = paned.get_position()
-        if getattr(self, "_sidebar_uses_dynamic_default", False):
+        if self._sidebar_uses_dynamic_default:
             target_position = bounds.default
         else:
             target_position = clamp_sidebar_width(current_position, bounds)
@@ -929,11 +1023,7 @@ class MainWindow(Gtk.ApplicationWindow):
 
     def focus_sidebar(self) -> None:
         """Focus the sidebar tree view."""
-        if (
-            hasattr(self, 'session_sidebar')
-            and self.session_sidebar
-            and hasattr(self.session_sidebar, 'grab_focus')
-        ):
+        if self.session_sidebar is not None:
             self.session_sidebar.grab_focus()
 
     def _update_terminal_themes(self, theme_name: str) -> None:
@@ -953,21 +1043,23 @@ class MainWindow(Gtk.ApplicationWindow):
         style_context.add_class(theme_name)
         logger.debug("Updated window theme class to %s", theme_name)
 
+    def _get_theme_icon(self, icon_name: str) -> Gtk.Image:
+        """Return the cached theme toggle image for an icon name."""
+        image = self._theme_icons.get(icon_name)
+        if image is None:
+            image = Gtk.Image.new_from_icon_name(icon_name, Gtk.IconSize.BUTTON)
+            self._theme_icons[icon_name] = image
+        return image
+
     def _update_theme_button_icon(self) -> None:
         """Update theme toggle button icon based on current theme."""
-        app = self.get_application()
-        current_theme = app.css_loader.current_theme
+        current_theme = self._css_loader.current_theme
 
-        if current_theme == "dark":
-            self.theme_toggle_button.set_image(
-                Gtk.Image.new_from_icon_name("weather-clear-symbolic", Gtk.IconSize.BUTTON)
-            )
-            self.theme_toggle_button.set_tooltip_text("Switch to Light Theme")
-        else:
-            self.theme_toggle_button.set_image(
-                Gtk.Image.new_from_icon_name("weather-clear-night-symbolic", Gtk.IconSize.BUTTON)
-            )
-            self.theme_toggle_button.set_tooltip_text("Switch to Dark Theme")
+        icon_name = THEME_BUTTON_ICONS.get(current_theme, THEME_BUTTON_DEFAULT_ICON)
+        self.theme_toggle_button.set_image(self._get_theme_icon(icon_name))
+        self.theme_toggle_button.set_tooltip_text(
+            THEME_BUTTON_TOOLTIPS.get(current_theme, THEME_BUTTON_DEFAULT_TOOLTIP)
+        )
 
 
 class TreeStyleTerminalApp(Gtk.Application):
@@ -1004,43 +1096,14 @@ class TreeStyleTerminalApp(Gtk.Application):
     def _print_system_info(self) -> None:
         """Print system information for debugging font scaling."""
         try:
-            settings = Gtk.Settings.get_default()
-            screen = Gdk.Screen.get_default()
-
-            # System font information
-            font_name = settings.get_property("gtk-font-name")
-            try:
-                mono_font = settings.get_property("gtk-monospace-font-name")
-            except (AttributeError, TypeError):
-                try:
-                    mono_font = settings.get_property("gtk-monospace-font")
-                except (AttributeError, TypeError):
-                    mono_font = None
-            dpi = settings.get_property("gtk-xft-dpi")
-
-            # Display information
-            display = screen.get_display()
-            monitor = display.get_primary_monitor() or display.get_monitor(0)
-            geometry = monitor.get_geometry()
-            width = geometry.width
-            height = geometry.height
-            width_mm = monitor.get_width_mm()
-            height_mm = monitor.get_height_mm()
-
-            # Calculate actual DPI
-            if width_mm > 0 and height_mm > 0:
-                dpi_x = (width * 25.4) / width_mm
-                dpi_y = (height * 25.4) / height_mm
-                avg_dpi = (dpi_x + dpi_y) / 2
-            else:
-                avg_dpi = 96  # fallback
+            info = compute_dpi_info()
 
             print("System Information:")
-            print(f"  Display: {width}x{height} pixels, {width_mm}x{height_mm}mm")
-            print(f"  Calculated DPI: {avg_dpi:.1f}")
-            print(f"  GTK XFT DPI: {dpi/1024.0 if dpi else 'not set'}")
-            print(f"  System font: {font_name or 'not set'}")
-            print(f"  Monospace font: {mono_font or 'not set'}")
+            print(f"  Display: {info.width}x{info.height} pixels, {info.width_mm}x{info.height_mm}mm")
+            print(f"  Calculated DPI: {info.avg_dpi:.1f}")
+            print(f"  GTK XFT DPI: {info.xft_dpi/1024.0 if info.xft_dpi else 'not set'}")
+            print(f"  System font: {info.font_name or 'not set'}")
+            print(f"  Monospace font: {info.mono_font or 'not set'}")
             print(f"  Manual DPI override: {os.environ.get('TST_DPI', 'not set')}")
 
         except Exception as e:
@@ -1210,44 +1273,17 @@ def print_font_test_info(dpi_override=None):
         # Initialize GTK to get settings
         Gtk.init([])
 
-        settings = Gtk.Settings.get_default()
-        screen = Gdk.Screen.get_default()
-
-        # System font information
-        font_name = settings.get_property("gtk-font-name")
-        try:
-            mono_font = settings.get_property("gtk-monospace-font-name")
-        except (AttributeError, TypeError):
-            try:
-                mono_font = settings.get_property("gtk-monospace-font")
-            except (AttributeError, TypeError):
-                mono_font = None
-        dpi = settings.get_property("gtk-xft-dpi")
-
-        # Display information
-        display = screen.get_display()
-        monitor = display.get_primary_monitor() or display.get_monitor(0)
-        geometry = monitor.get_geometry()
-        width = geometry.width
-        height = geometry.height
-        width_mm = monitor.get_width_mm()
-        height_mm = monitor.get_height_mm()
-
-        # Calculate actual DPI
-        if width_mm > 0 and height_mm > 0:
-            dpi_x = (width * 25.4) / width_mm
-            dpi_y = (height * 25.4) / height_mm
-            avg_dpi = (dpi_x + dpi_y) / 2
-        else:
-            avg_dpi = 96  # fallback
+        info = compute_dpi_info()
+        dpi = info.xft_dpi
+        avg_dpi = info.avg_dpi
 
         print("System Information:")
-        print(f"  Display: {width}x{height} pixels")
-        print(f"  Physical size: {width_mm}x{height_mm}mm")
+        print(f"  Display: {info.width}x{info.height} pixels")
+        print(f"  Physical size: {info.width_mm}x{info.height_mm}mm")
         print(f"  Calculated DPI: {avg_dpi:.1f}")
         print(f"  GTK XFT DPI: {dpi/1024.0 if dpi else 'not set'}")
-        print(f"  System font: {font_name or 'not set'}")
-        print(f"  Monospace font: {mono_font or 'not set'}")
+        print(f"  System font: {info.font_name or 'not set'}")
+        print(f"  Monospace font: {info.mono_font or 'not set'}")
 
         # Environment and argument overrides
         env_dpi = os.environ.get('TST_DPI')
@@ -1256,15 +1292,7 @@ def print_font_test_info(dpi_override=None):
 
         print("\nFont Size Calculations:")
 
-        # Parse system font size
-        if font_name:
-            font_parts = font_name.split()
-            try:
-                base_font_size = float(font_parts[-1])
-            except (ValueError, IndexError):
-                base_font_size = 10.0
-        else:
-            base_font_size = 10.0
+        base_font_size = info.base_font_size
 
         # Use improved DPI detection logic (same as CSSLoader)
         if dpi_override:
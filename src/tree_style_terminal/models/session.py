@@ -10,7 +10,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class TerminalSession:
     """
     Represents a single terminal session with its process and metadata.
@@ -130,6 +130,8 @@ class TerminalSession:
 
     def __eq__(self, other: object) -> bool:
         """Two sessions are equal if they have the same pid and pty_fd."""
-        if not isinstance(other, TerminalSession):
+        if other is self:
+            return True
+        if type(other) is not TerminalSession:
             return False
         return self.pid == other.pid and self.pty_fd == other.pty_fd
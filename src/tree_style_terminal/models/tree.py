@@ -23,6 +23,7 @@ class SessionTree:
         """Initialize an empty session tree."""
         self.root_nodes: list[TerminalSession] = []
         self._parent_map: dict[TerminalSession, TerminalSession | None] = {}
+        self._sessions_by_pid: dict[int, list[TerminalSession]] = {}
 
     def add_node(self, session: TerminalSession, parent: TerminalSession | None = None) -> None:
         """
@@ -42,6 +43,8 @@ class SessionTree:
                 parent.children.append(session)
             self._parent_map[session] = parent
 
+        self._sessions_by_pid.setdefault(session.pid, []).append(session)
+
     def remove_node(self, session: TerminalSession) -> None:
         """
         Remove a session from the tree, implementing adoption algorithm.
@@ -84,6 +87,10 @@ class SessionTree:
         # Clear the session's children list and remove from parent map
         session.children.clear()
         del self._parent_map[session]
+        same_pid = self._sessions_by_pid[session.pid]
+        same_pid.remove(session)
+        if not same_pid:
+            del self._sessions_by_pid[session.pid]
 
     def get_parent(self, session: TerminalSession) -> TerminalSession | None:
         """Get the parent of a session, or None if it's a root."""
@@ -107,7 +114,5 @@ class SessionTree:
 
     def find_session_by_pid(self, pid: int) -> TerminalSession | None:
         """Find a session by its process ID."""
-        for session in self._parent_map:
-            if session.pid == pid:
-                return session
-        return None
+        same_pid = self._sessions_by_pid.get(pid)
+        return same_pid[0] if same_pid else None
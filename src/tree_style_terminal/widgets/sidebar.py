@@ -14,7 +14,7 @@ import gi
 
 gi.require_version('Gtk', '3.0')
 gi.require_version('Gdk', '3.0')
-from gi.repository import Gdk, Gtk
+from gi.repository import Gdk, GLib, Gtk
 
 from ..controllers.sidebar import SidebarController
 from ..models.session import TerminalSession
@@ -47,6 +47,7 @@ class SessionSidebar(Gtk.Box):
         self._selection_started_by_pointer = False
         self._last_selection_was_pointer = False
         self._context_menu_session: TerminalSession | None = None
+        self._refresh_source_id = 0
 
         # Create the tree view
         self.tree_view = Gtk.TreeView()
@@ -254,7 +255,7 @@ class SessionSidebar(Gtk.Box):
         self._selecting_programmatically = True
         try:
             self.tree_view.expand_to_path(path)
-            selection.unselect_all()
+            # SINGLE mode replaces the previous selection with one "changed" emission
             selection.select_path(path)
             self.tree_view.scroll_to_cell(path, None, False, 0.0, 0.0)
         finally:
@@ -271,5 +272,54 @@ class SessionSidebar(Gtk.Box):
         self.tree_view.collapse_all()
 
     def refresh(self) -> None:
-        """Refresh the tree view by syncing with the controller."""
-        self.controller.sync_with_session_tree()
+        """
+        Schedule a tree view refresh by syncing with the controller.
+
+        The refresh is asynchronous: the rebuild runs from an idle callback on
+        the GLib main loop, so the tree view still shows the old rows when this
+        returns. Repeated calls before the main loop goes idle collapse into one
+        rebuild, which keeps the expanded rows and the selection.
+        """
+        if self._refresh_source_id:
+            return
+        self._refresh_source_id = GLib.idle_add(
+            self._do_refresh,
+            priority=GLib.PRIORITY_DEFAULT_IDLE,
+        )
+
+    def _do_refresh(self) -> bool:
+        """Run the pending coalesced refresh."""
+        self._refresh_source_id = 0
+
+        tree_store = self.controller.get_tree_store()
+        selected_session = None
+        _model, selected_iter = self.tree_view.get_selection().get_selected()
+        if selected_iter is not None:
+            selected_session = self.controller.get_session_from_iter(selected_iter)
+        expanded_sessions: list[TerminalSession] = []
+        self.tree_view.map_expanded_rows(
+            lambda _view, path: expanded_sessions.append(
+                tree_store.get_value(tree_store.get_iter(path), self.controller.COL_OBJECT)
+            )
+        )
+
+        # Detach the model so the view does not handle each row insert of the rebuild;
+        # the selection changes this causes are not user selections
+        self._selecting_programmatically = True
+        try:
+            self.tree_view.set_model(None)
+            try:
+                self.controller.sync_with_session_tree()
+            finally:
+                self.tree_view.set_model(tree_store)
+
+            for session in expanded_sessions:
+                tree_iter = self.controller.find_iter_for_session(session)
+                if tree_iter is not None:
+                    self.tree_view.expand_to_path(tree_store.get_path(tree_iter))
+        finally:
+            self._selecting_programmatically = False
+
+        if selected_session is not None:
+            self.select_session(selected_session)
+        return False
@@ -8,7 +8,9 @@ This module provides a VTE terminal widget wrapper with spawn functionality.
 import logging
 import os
 import re
+import time
 from contextlib import suppress
+from functools import partial
 from pathlib import Path
 from urllib.parse import unquote, urlparse
 
@@ -17,8 +19,9 @@ import gi
 gi.require_version("Gtk", "3.0")
 gi.require_version("Vte", "2.91")
 gi.require_version("Gdk", "3.0")
+gi.require_version("Pango", "1.0")
 
-from gi.repository import Gdk, GLib, Gtk, Vte
+from gi.repository import Gdk, GLib, Gtk, Pango, Vte
 
 from ..ai_command import DEFAULT_HISTORY_LINES, extract_editable_input
 from ..config import ConfigError, config_manager
@@ -32,11 +35,90 @@ FUZZY_SEARCH_SEPARATOR_PATTERN = r"[-_\s]*"
 PCRE2_MULTILINE = 1024
 VTE_REGEX_COMPILE_FLAGS = Vte.REGEX_FLAGS_DEFAULT | PCRE2_MULTILINE
 TERMINAL_LEFT_EDGE_MARGIN_PX = 16
+PROCESS_CWD_CACHE_TTL_SECONDS = 0.25
+INITIAL_SCROLLBACK_LINES = 1000
 TERMINAL_SPAWN_FLAGS = GLib.SpawnFlags.DEFAULT | GLib.SpawnFlags(
     Vte.SPAWN_NO_PARENT_ENVV
 )
 
 
+TERMINAL_FONT_FAMILY = "monospace"
+_FONT_CACHE: dict[tuple[str, int], Pango.FontDescription] = {}
+
+
+def _get_font_description(family: str, size: int) -> Pango.FontDescription:
+    """Return a shared font description for the given family and size."""
+    key = (family, size)
+    font_desc = _FONT_CACHE.get(key)
+    if font_desc is None:
+        font_desc = Pango.FontDescription()
+        font_desc.set_family(family)
+        font_desc.set_size(size * Pango.SCALE)
+        _FONT_CACHE[key] = font_desc
+    return font_desc
+
+
+def _child_exited_cb(terminal: Vte.Terminal, status: int, owner: "VteTerminal") -> None:
+    """Shared child-exited handler; the owning wrapper is passed as user data."""
+    owner._on_child_exited(terminal, status)
+
+
+def _title_changed_cb(terminal: Vte.Terminal, owner: "VteTerminal") -> None:
+    """Shared window-title-changed handler; the owning wrapper is passed as user data."""
+    owner._on_title_changed(terminal)
+
+
+def _parse_rgba(color: str) -> Gdk.RGBA:
+    """Convert a ``#rrggbb`` color string into an opaque Gdk.RGBA."""
+    value = int(color[1:], 16)
+    return Gdk.RGBA(
+        red=((value >> 16) & 0xFF) / 255,
+        green=((value >> 8) & 0xFF) / 255,
+        blue=(value & 0xFF) / 255,
+        alpha=1.0,
+    )
+
+
+# Theme colors are constant, so they are parsed once at import time.
+DARK_THEME_FOREGROUND = _parse_rgba("#ffffff")  # White text
+DARK_THEME_BACKGROUND = _parse_rgba("#000000")  # Dark background
+DARK_THEME_PALETTE = tuple(
+    _parse_rgba(color)
+    for color in (
+        "#2e3436", "#cc0000", "#4e9a06", "#c4a000",
+        "#3465a4", "#75507b", "#06989a", "#d3d7cf",
+        "#555753", "#ef2929", "#8ae234", "#fce94f",
+        "#729fcf", "#ad7fa8", "#34e2e2", "#eeeeec",
+    )
+)
+
+LIGHT_THEME_FOREGROUND = _parse_rgba("#000000")  # Black text
+LIGHT_THEME_BACKGROUND = _parse_rgba("#ffffff")  # White background
+LIGHT_THEME_PALETTE = tuple(
+    _parse_rgba(color)
+    for color in (
+        "#000000", "#cc0000", "#4e9a06", "#c4a000",
+        "#3465a4", "#75507b", "#06989a", "#2e3436",
+        "#555753", "#ef2929", "#8ae234", "#fce94f",
+        "#729fcf", "#ad7fa8", "#34e2e2", "#d3d7cf",
+    )
+)
+
+# KEY=value entries handed to VTE; built on the first spawn and kept for the process.
+_spawn_envv_cache: tuple[str, ...] | None = None
+
+
+def build_spawn_envv() -> list[str]:
+    """Return a fresh copy of the ``KEY=value`` list for a spawned shell."""
+    global _spawn_envv_cache
+
+    if _spawn_envv_cache is None:
+        # Keep the bundled application runtime out of host shell sessions.
+        env = build_terminal_environment()
+        _spawn_envv_cache = tuple(f"{key}={value}" for key, value in env.items())
+    return list(_spawn_envv_cache)
+
+
 def build_terminal_search_pattern(text: str, fuzzy: bool) -> str:
     """Build the PCRE2 pattern used for VTE terminal search."""
     if not fuzzy:
@@ -117,10 +199,13 @@ class VteTerminal(Gtk.Box):
         # Store process information
         self.pid: int | None = None
         self.pty_fd: int | None = None
+        self._process_cwd_cache: tuple[int, float, str | None] | None = None
+        self._title_source_id = 0
+        self._last_spawn_cwd: str | None = None
 
         # Connect signals
-        self.terminal.connect("child-exited", self._on_child_exited)
-        self.terminal.connect("window-title-changed", self._on_title_changed)
+        self.terminal.connect("child-exited", _child_exited_cb, self)
+        self.terminal.connect("window-title-changed", _title_changed_cb, self)
         self.terminal.connect("button-press-event", self._on_button_press)
 
     def grab_focus(self) -> None:
@@ -252,12 +337,24 @@ class VteTerminal(Gtk.Box):
 
     def _configure_terminal(self) -> None:
         """Configure basic terminal settings."""
+        # Hold property notifications so the settings below are applied as one batch.
+        self.terminal.freeze_notify()
+        try:
+            self._apply_terminal_settings()
+        finally:
+            self.terminal.thaw_notify()
+
+    def _apply_terminal_settings(self) -> None:
+        """Apply font, scrollback, cursor, link, and color settings."""
         # Set default font
         self.set_font_size(12)
 
-        # Set scrollback length from config
-        scrollback_lines = config_manager.get("terminal.scrollback_lines", 10000)
-        self.set_scrollback_length(scrollback_lines)
+        # Start with a small scrollback and grow to the configured length once
+        # the first frame has been drawn.
+        self._target_scrollback = config_manager.get("terminal.scrollback_lines", 10000)
+        self.set_scrollback_length(min(self._target_scrollback, INITIAL_SCROLLBACK_LINES))
+        if self._target_scrollback > INITIAL_SCROLLBACK_LINES:
+            GLib.idle_add(self._grow_scrollback)
 
         # Set cursor settings
         self.terminal.set_cursor_blink_mode(Vte.CursorBlinkMode.SYSTEM)
@@ -624,26 +721,19 @@ class VteTerminal(Gtk.Box):
 
         if cwd is None:
             cwd = os.getcwd()
-
-        # Ensure working directory exists
-        if not os.path.isdir(cwd):
+        # Ensure a requested working directory exists; the process cwd always does
+        elif not os.path.isdir(cwd):
             logger.warning(f"Working directory {cwd} does not exist, using home directory")
             cwd = os.path.expanduser("~")
 
-        # Keep the bundled application runtime out of host shell sessions.
-        env = build_terminal_environment()
-
         try:
             # Convert environment to the format expected by spawn_async
-            envv = [f"{key}={value}" for key, value in env.items()]
+            envv = build_spawn_envv()
 
             # Create a new PTY for the terminal
             pty = Vte.Pty.new_sync(Vte.PtyFlags.DEFAULT)
             self.terminal.set_pty(pty)
 
-            # Store spawn arguments for the async callback
-            self._spawn_argv = argv
-            self._spawn_cwd = cwd
             self._last_spawn_cwd = cwd
 
             # Spawn the process using the modern async method
@@ -656,7 +746,7 @@ class VteTerminal(Gtk.Box):
                 None,                    # child_setup_data
                 -1,                      # timeout (-1 = no timeout)
                 None,                    # cancellable
-                self._on_spawn_complete  # callback
+                partial(self._on_spawn_complete, cwd=cwd),  # callback
             )
 
             # Return True immediately - actual success is handled in callback
@@ -669,12 +759,7 @@ class VteTerminal(Gtk.Box):
     def set_font_size(self, size: int) -> None:
         """Set the terminal font size."""
         try:
-            from gi.repository import Pango
-
-            font_desc = Pango.FontDescription()
-            font_desc.set_family("monospace")
-            font_desc.set_size(size * Pango.SCALE)
-            self.terminal.set_font(font_desc)
+            self.terminal.set_font(_get_font_description(TERMINAL_FONT_FAMILY, size))
         except Exception as e:
             logger.warning(f"Failed to set font size {size}: {e}")
 
@@ -682,6 +767,11 @@ class VteTerminal(Gtk.Box):
         """Set the scrollback buffer length."""
         self.terminal.set_scrollback_lines(length)
 
+    def _grow_scrollback(self) -> bool:
+        """Raise the scrollback buffer to the configured length."""
+        self.set_scrollback_length(self._target_scrollback)
+        return False
+
     def get_window_title(self) -> str:
         """Get the current window title."""
         title = self.terminal.get_window_title()
@@ -703,14 +793,29 @@ class VteTerminal(Gtk.Box):
                     return directory
 
         if self.pid:
-            try:
-                directory = os.readlink(f"/proc/{self.pid}/cwd")
-                if os.path.isdir(directory):
-                    return directory
-            except OSError as e:
-                logger.debug(f"Failed to read terminal process cwd: {e}")
+            directory = self._get_process_cwd(self.pid)
+            if directory:
+                return directory
+
+        return self._last_spawn_cwd
+
+    def _get_process_cwd(self, pid: int) -> str | None:
+        """Read the shell process cwd, cached briefly for shells without OSC 7."""
+        now = time.monotonic()
+        cached = self._process_cwd_cache
+        if cached and cached[0] == pid and now - cached[1] < PROCESS_CWD_CACHE_TTL_SECONDS:
+            return cached[2]
+
+        directory = None
+        try:
+            directory = os.readlink(f"/proc/{pid}/cwd")
+            if not os.path.isdir(directory):
+                directory = None
+        except OSError as e:
+            logger.debug(f"Failed to read terminal process cwd: {e}")
 
-        return getattr(self, "_last_spawn_cwd", None)
+        self._process_cwd_cache = (pid, now, directory)
+        return directory
 
     def close(self) -> None:
         """Close the terminal and clean up resources."""
@@ -726,7 +831,7 @@ class VteTerminal(Gtk.Box):
         # Emit a custom signal that can be caught by parent widgets
         # For now, we'll just log it
 
-    def _on_spawn_complete(self, pty: Vte.Pty, task: object, user_data=None) -> None:
+    def _on_spawn_complete(self, pty: Vte.Pty, task: object, cwd: str | None = None) -> None:
         """Callback when spawning is complete."""
         try:
             success, child_pid = pty.spawn_finish(task)
@@ -735,7 +840,7 @@ class VteTerminal(Gtk.Box):
                 self.pty_fd = pty.get_fd()
                 self.pid = child_pid
 
-                logger.info(f"Successfully spawned shell in directory {self._spawn_cwd}")
+                logger.info(f"Successfully spawned shell in directory {cwd}")
             else:
                 logger.error("Failed to spawn shell")
                 self.pid = None
@@ -745,19 +850,21 @@ class VteTerminal(Gtk.Box):
             self.pid = None
             self.pty_fd = None
 
-        # Clean up temporary spawn arguments
-        if hasattr(self, '_spawn_argv'):
-            delattr(self, '_spawn_argv')
-        if hasattr(self, '_spawn_cwd'):
-            delattr(self, '_spawn_cwd')
-
     def _on_title_changed(self, terminal: Vte.Terminal) -> None:
-        """Handle terminal title change."""
-        title = self.get_window_title()
-        logger.debug(f"Terminal title changed to: {title}")
+        """Handle terminal title change, coalescing bursts into one idle update."""
+        if self._title_source_id:
+            return
+        self._title_source_id = GLib.idle_add(self._flush_title)
+
+    def _flush_title(self) -> bool:
+        """Read the latest terminal title once per burst of title changes."""
+        self._title_source_id = 0
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Terminal title changed to: {self.get_window_title()}")
 
         # Emit a custom signal that can be caught by parent widgets
         # For now, we'll just log it
+        return False
 
     def apply_theme(self, theme_name: str) -> None:
         """Apply a color theme to the terminal."""
@@ -770,85 +877,42 @@ class VteTerminal(Gtk.Box):
 
     def _apply_dark_theme(self) -> None:
         """Apply dark theme colors to the terminal."""
-        try:
-            # Get transparency value
-            alpha = getattr(self, '_transparency', 1.0)
-
-            # Dark theme colors with transparency
-            bg_color = Gdk.RGBA()
-            bg_color.parse("#000000")  # Dark background
-            bg_color.alpha = alpha  # Apply transparency
-
-            fg_color = Gdk.RGBA()
-            fg_color.parse("#ffffff")  # White text
-
-            # Standard 16-color palette for dark theme
-            palette = [
-                Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(),
-                Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(),
-                Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(),
-                Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA()
-            ]
-
-            # Dark theme color palette
-            colors = [
-                "#2e3436", "#cc0000", "#4e9a06", "#c4a000",
-                "#3465a4", "#75507b", "#06989a", "#d3d7cf",
-                "#555753", "#ef2929", "#8ae234", "#fce94f",
-                "#729fcf", "#ad7fa8", "#34e2e2", "#eeeeec"
-            ]
-
-            for i, color_str in enumerate(colors):
-                palette[i].parse(color_str)
-
-            # Apply colors to terminal
-            self.terminal.set_colors(fg_color, bg_color, palette)
-
-            logger.debug("Applied dark theme to terminal")
-
-        except Exception as e:
-            logger.warning(f"Failed to apply dark theme: {e}")
+        self._apply_theme_colors(
+            "dark",
+            DARK_THEME_FOREGROUND,
+            DARK_THEME_BACKGROUND,
+            DARK_THEME_PALETTE,
+        )
 
     def _apply_light_theme(self) -> None:
         """Apply light theme colors to the terminal."""
+        self._apply_theme_colors(
+            "light",
+            LIGHT_THEME_FOREGROUND,
+            LIGHT_THEME_BACKGROUND,
+            LIGHT_THEME_PALETTE,
+        )
+
+    def _apply_theme_colors(
+        self,
+        theme_name: str,
+        fg_color: Gdk.RGBA,
+        background: Gdk.RGBA,
+        palette: tuple[Gdk.RGBA, ...],
+    ) -> None:
+        """Apply pre-parsed theme colors, using the current transparency as background alpha."""
         try:
             # Get transparency value
             alpha = getattr(self, '_transparency', 1.0)
-
-            # Light theme colors with transparency
-            bg_color = Gdk.RGBA()
-            bg_color.parse("#ffffff")  # White background
-            bg_color.alpha = alpha  # Apply transparency
-
-            fg_color = Gdk.RGBA()
-            fg_color.parse("#000000")  # Black text
-
-            # Standard 16-color palette for light theme
-            palette = [
-                Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(),
-                Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(),
-                Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(),
-                Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA(), Gdk.RGBA()
-            ]
-
-            # Light theme color palette
-            colors = [
-                "#000000", "#cc0000", "#4e9a06", "#c4a000",
-                "#3465a4", "#75507b", "#06989a", "#2e3436",
-                "#555753", "#ef2929", "#8ae234", "#fce94f",
-                "#729fcf", "#ad7fa8", "#34e2e2", "#d3d7cf"
-            ]
-
-            for i, color_str in enumerate(colors):
-                palette[i].parse(color_str)
+            bg_color = Gdk.RGBA(background.red, background.green, background.blue, alpha)
 
             # Apply colors to terminal
             self.terminal.set_colors(fg_color, bg_color, palette)
 
-            logger.debug("Applied light theme to terminal")
+            logger.debug(f"Applied {theme_name} theme to terminal")
 
         except Exception as e:
-            logger.warning(f"Failed to apply light theme: {e}")
+            logger.warning(f"Failed to apply {theme_name} theme: {e}")
 
     def set_transparency(self, value: float) -> None:
         """
@@ -0,0 +1,17 @@
+"""Shared GObject Introspection setup for the test suite.
+
+Pins the library versions once and resolves ``gi.repository`` modules on first
+access, so test modules can use ``from tests._gi import Gtk``.
+"""
+
+import importlib
+
+import gi
+
+gi.require_versions({"Gtk": "3.0", "Gdk": "3.0", "Gio": "2.0", "Vte": "2.91"})
+
+
+def __getattr__(name):
+    module = importlib.import_module(f"gi.repository.{name}")
+    globals()[name] = module
+    return module
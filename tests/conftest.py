@@ -1,19 +1,52 @@
 """Pytest configuration and fixtures for tree-style-terminal tests."""
 
-import os
-import sys
-
 import pytest
 
-# Add the src layout root so package imports work from a repository checkout.
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Pin GObject Introspection versions once, before any test module is collected.
+from tests import _gi  # noqa: F401
+
+
+@pytest.fixture(scope="session")
+def gtk_display():
+    """Skip widget tests once per session when no display is available."""
+    from tests._gi import Gdk
+
+    display = Gdk.Display.get_default()
+    if display is None:
+        pytest.skip("No display available for GTK widget tests")
+    return display
+
+@pytest.fixture(scope="session")
+def app(gtk_display):
+    """Share one application instance across window tests."""
+    from tree_style_terminal.main import TreeStyleTerminalApp
+
+    return TreeStyleTerminalApp()
+
+@pytest.fixture
+def main_window(app):
+    """Create a main window for one test and destroy it afterwards."""
+    from tree_style_terminal.main import MainWindow
+
+    window = MainWindow(application=app)
+    yield window
+    window.destroy()
+
+@pytest.fixture
+def session_tree():
+    """Create an empty session tree."""
+    from tree_style_terminal.models.tree import SessionTree
+
+    return SessionTree()
+
+@pytest.fixture
+def session_manager(session_tree):
+    """Create a session manager and cancel its spare terminal build afterwards."""
+    from tree_style_terminal.controllers.session_manager import SessionManager
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_gi():
-    """Setup GObject Introspection requirements for all tests."""
-    import gi
-    gi.require_version("Gtk", "3.0")
-    gi.require_version("Vte", "2.91")
+    manager = SessionManager(session_tree)
+    yield manager
+    manager.shutdown()
 
 @pytest.fixture
 def mock_display(monkeypatch):
@@ -5,10 +5,7 @@ Tests the interaction between SessionSidebar, SidebarController, and SessionMana
 for focus switching and session selection.
 """
 
-
-import gi
-
-gi.require_version('Gtk', '3.0')
+import pytest
 
 from tree_style_terminal.controllers.session_manager import SessionManager
 from tree_style_terminal.controllers.sidebar import SidebarController
@@ -51,31 +48,28 @@ class TestSidebarFocusIntegration:
         assert len(selected_sessions) == 1
         assert selected_sessions[0] == session
 
-    def test_session_manager_integration_methods(self):
-        """Test SessionManager has required methods for sidebar integration."""
-        tree = SessionTree()
-        manager = SessionManager(tree)
-
-        required_methods = [
-            'new_session', 'new_child', 'new_sibling',
-            'close_session', 'select_session'
-        ]
+    @pytest.fixture
+    def manager(self):
+        """Create a SessionManager over an empty tree."""
+        return SessionManager(SessionTree())
 
-        for method_name in required_methods:
-            assert hasattr(manager, method_name)
-            assert callable(getattr(manager, method_name))
-
-    def test_session_manager_callback_setup(self):
+    @pytest.mark.parametrize(
+        "method_name",
+        ['new_session', 'new_child', 'new_sibling', 'close_session', 'select_session'],
+    )
+    def test_session_manager_integration_methods(self, manager, method_name):
+        """Test SessionManager has required methods for sidebar integration."""
+        assert callable(getattr(manager, method_name, None))
+
+    @pytest.mark.parametrize(
+        "setter_name,callback",
+        [
+            pytest.param('set_session_created_callback', lambda s, t: None, id="created"),
+            pytest.param('set_session_closed_callback', lambda s: None, id="closed"),
+            pytest.param('set_session_selected_callback', lambda s: None, id="selected"),
+        ],
+    )
+    def test_session_manager_callback_setup(self, manager, setter_name, callback):
         """Test SessionManager callback registration."""
-        tree = SessionTree()
-        manager = SessionManager(tree)
-
-        # Test callback setters exist
-        assert hasattr(manager, 'set_session_created_callback')
-        assert hasattr(manager, 'set_session_closed_callback')
-        assert hasattr(manager, 'set_session_selected_callback')
-
-        # Test callbacks can be set without error
-        manager.set_session_created_callback(lambda s, t: None)
-        manager.set_session_closed_callback(lambda s: None)
-        manager.set_session_selected_callback(lambda s: None)
+        # Test the callback can be set without error
+        getattr(manager, setter_name)(callback)
@@ -1,172 +1,144 @@
-import os
-import sys
-import unittest
-from unittest.mock import patch
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock
 
-# Add src to path for testing
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
+import pytest
 
-import gi
+from tests._gi import Gtk
+from tree_style_terminal.css_loader import CSSLoader
+from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
 
-gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk
 
-from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
+@pytest.fixture
+def stub_css(monkeypatch):
+    """Replace CSS loading with plain mocks assigned directly on CSSLoader."""
+    stubs = SimpleNamespace(load_base_css=Mock(), load_theme=Mock())
+    monkeypatch.setattr(CSSLoader, "load_base_css", stubs.load_base_css)
+    monkeypatch.setattr(CSSLoader, "load_theme", stubs.load_theme)
+    return stubs
+
+
+@pytest.fixture(scope="session")
+def style_css_content():
+    """Read the base stylesheet once for CSS content assertions."""
+    path = Path(__file__).resolve().parents[2] / "src/tree_style_terminal/resources/css/style.css"
+    return path.read_text()
+
+
+@pytest.fixture
+def theme_app():
+    """Create an application for theme tests."""
+    return TreeStyleTerminalApp()
+
+
+@pytest.fixture
+def started_app(theme_app, stub_css):
+    """Run application startup with CSS loading stubbed out."""
+    theme_app._on_startup(theme_app)
+    return theme_app
+
+
+@pytest.fixture
+def window(started_app):
+    """Create a main window for a started application."""
+    window = MainWindow(started_app)
+    yield window
+    window.destroy()
+
+
+def test_app_has_css_loader(theme_app):
+    """Test that application has CSS loader instance."""
+    assert theme_app.css_loader is not None
+
+
+def test_css_loaded_on_startup(started_app, stub_css):
+    """Test that CSS is loaded during application startup."""
+    assert stub_css.load_base_css.call_count == 1
+    # Theme is automatically detected, so we just check it was called once
+    assert stub_css.load_theme.call_count == 1
+
+
+def test_main_window_has_theme_toggle_button(window):
+    """Test that main window has theme toggle button."""
+    # Check that theme toggle button exists
+    assert hasattr(window, 'theme_toggle_button')
+    assert isinstance(window.theme_toggle_button, Gtk.Button)
+
+
+def test_theme_toggle_button_callback(window, monkeypatch):
+    """Test that theme toggle button callback works."""
+    toggle_theme = Mock()
+    monkeypatch.setattr(CSSLoader, "toggle_theme", toggle_theme)
+
+    # Simulate button click
+    window._on_theme_toggle_clicked(window.theme_toggle_button)
+
+    toggle_theme.assert_called_once()
+
+
+def test_theme_toggle_updates_button_icon(started_app, window):
+    """Test that theme toggle updates button icon."""
+    # Mock the CSS loader current theme
+    started_app.css_loader.current_theme = "dark"
+
+    # Trigger callback
+    window._on_theme_toggle_clicked(window.theme_toggle_button)
+
+    # Check that button image was updated
+    button_image = window.theme_toggle_button.get_image()
+    assert button_image is not None
+
+
+@pytest.mark.parametrize(
+    "widget_attr,css_class",
+    [
+        pytest.param(None, "main-window", id="main-window"),
+        # Added by SessionSidebar itself
+        pytest.param("session_sidebar", "sidebar-tree", id="session-sidebar"),
+    ],
+)
+def test_widgets_have_css_classes(window, widget_attr, css_class):
+    """Test that the main window and sidebar carry their CSS classes."""
+    widget = getattr(window, widget_attr) if widget_attr else window
+    assert widget.get_style_context().has_class(css_class)
+
+
+def test_sidebar_elements_exist(window):
+    """Verify sidebar elements exist (basic structure test)."""
+    assert window.sidebar_revealer is not None
+    assert window.session_sidebar is not None
+
+
+def test_sidebar_transparency_css_rules(window, style_css_content):
+    """Test that sidebar transparency CSS rules are properly loaded."""
+    # Check that sidebar has the sidebar-tree class needed for transparency
+    session_sidebar_context = window.session_sidebar.get_style_context()
+    assert session_sidebar_context.has_class("sidebar-tree")
+
+    # Check that our transparency rules are present
+    assert '.sidebar-tree' in style_css_content
+    assert 'background-color: transparent' in style_css_content
+
+
+def test_sidebar_view_class_removal(window):
+    """Test that .view class is removed from sidebar for transparency to work."""
+    # Check that sidebar has sidebar-tree class but NOT view class
+    session_sidebar_context = window.session_sidebar.get_style_context()
+
+    # Critical for transparency: view class must be removed
+    assert not session_sidebar_context.has_class("view"), (
+        "The .view class must be removed for transparency to work"
+    )
+
+    # Our custom class should still be present
+    assert session_sidebar_context.has_class("sidebar-tree"), (
+        "The .sidebar-tree class should be present"
+    )
 
 
-class TestThemeIntegration(unittest.TestCase):
-    """Integration tests for theme functionality."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.app = TreeStyleTerminalApp()
-
-    def tearDown(self):
-        """Clean up after tests."""
-        if hasattr(self, 'window') and self.window:
-            self.window.destroy()
-
-    def test_app_has_css_loader(self):
-        """Test that application has CSS loader instance."""
-        self.assertIsNotNone(self.app.css_loader)
-
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_base_css')
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_theme')
-    def test_css_loaded_on_startup(self, mock_load_theme, mock_load_base):
-        """Test that CSS is loaded during application startup."""
-        self.app._on_startup(self.app)
-
-        mock_load_base.assert_called_once()
-        # Theme is automatically detected, so we just check it was called once
-        mock_load_theme.assert_called_once()
-
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_base_css')
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_theme')
-    def test_main_window_has_theme_toggle_button(self, mock_load_theme, mock_load_base):
-        """Test that main window has theme toggle button."""
-        self.app._on_startup(self.app)
-
-        self.window = MainWindow(self.app)
-
-        # Check that theme toggle button exists
-        self.assertTrue(hasattr(self.window, 'theme_toggle_button'))
-        self.assertIsInstance(self.window.theme_toggle_button, Gtk.Button)
-
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_base_css')
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_theme')
-    @patch('tree_style_terminal.css_loader.CSSLoader.toggle_theme')
-    def test_theme_toggle_button_callback(self, mock_toggle_theme, mock_load_theme, mock_load_base):
-        """Test that theme toggle button callback works."""
-        self.app._on_startup(self.app)
-        self.window = MainWindow(self.app)
-
-        # Simulate button click
-        self.window._on_theme_toggle_clicked(self.window.theme_toggle_button)
-
-        mock_toggle_theme.assert_called_once()
-
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_base_css')
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_theme')
-    def test_theme_toggle_updates_button_icon(self, mock_load_theme, mock_load_base):
-        """Test that theme toggle updates button icon."""
-        self.app._on_startup(self.app)
-        self.window = MainWindow(self.app)
-
-        # Mock the CSS loader current theme
-        self.app.css_loader.current_theme = "dark"
-
-        # Trigger callback
-        self.window._on_theme_toggle_clicked(self.window.theme_toggle_button)
-
-        # Check that button image was updated
-        button_image = self.window.theme_toggle_button.get_image()
-        self.assertIsNotNone(button_image)
-
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_base_css')
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_theme')
-    def test_window_has_css_classes(self, mock_load_theme, mock_load_base):
-        """Test that main window has proper CSS classes."""
-        self.app._on_startup(self.app)
-        self.window = MainWindow(self.app)
-
-        # Check main window has CSS class
-        style_context = self.window.get_style_context()
-        self.assertTrue(style_context.has_class("main-window"))
-
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_base_css')
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_theme')
-    def test_sidebar_has_css_classes(self, mock_load_theme, mock_load_base):
-        """Test that sidebar elements have proper CSS classes."""
-        self.app._on_startup(self.app)
-        self.window = MainWindow(self.app)
-
-        # Check session sidebar has the sidebar-tree CSS class (added by SessionSidebar itself)
-        session_sidebar_context = self.window.session_sidebar.get_style_context()
-        self.assertTrue(session_sidebar_context.has_class("sidebar-tree"))
-
-        # Verify sidebar elements exist (basic structure test)
-        self.assertIsNotNone(self.window.sidebar_revealer)
-        self.assertIsNotNone(self.window.session_sidebar)
-
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_base_css')
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_theme')
-    def test_sidebar_transparency_css_rules(self, mock_load_theme, mock_load_base):
-        """Test that sidebar transparency CSS rules are properly loaded."""
-        self.app._on_startup(self.app)
-        self.window = MainWindow(self.app)
-
-        # Check that sidebar has the sidebar-tree class needed for transparency
-        session_sidebar_context = self.window.session_sidebar.get_style_context()
-        self.assertTrue(session_sidebar_context.has_class("sidebar-tree"))
-
-        # Verify CSS file contains transparency rules by reading the file
-        import os
-        css_file_path = os.path.join(
-            os.path.dirname(__file__), '..', '..', 'src',
-            'tree_style_terminal', 'resources', 'css', 'style.css'
-        )
-
-        self.assertTrue(os.path.exists(css_file_path), "CSS file should exist")
-
-        with open(css_file_path) as f:
-            css_content = f.read()
-
-        # Check that our transparency rules are present
-        self.assertIn('.sidebar-tree', css_content)
-        self.assertIn('background-color: transparent', css_content)
-
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_base_css')
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_theme')
-    def test_sidebar_view_class_removal(self, mock_load_theme, mock_load_base):
-        """Test that .view class is removed from sidebar for transparency to work."""
-        self.app._on_startup(self.app)
-        self.window = MainWindow(self.app)
-
-        # Check that sidebar has sidebar-tree class but NOT view class
-        session_sidebar_context = self.window.session_sidebar.get_style_context()
-
-        # Critical for transparency: view class must be removed
-        self.assertFalse(session_sidebar_context.has_class("view"),
-                        "The .view class must be removed for transparency to work")
-
-        # Our custom class should still be present
-        self.assertTrue(session_sidebar_context.has_class("sidebar-tree"),
-                       "The .sidebar-tree class should be present")
-
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_base_css')
-    @patch('tree_style_terminal.css_loader.CSSLoader.load_theme')
-    def test_sidebar_container_has_transparency_hooks(self, mock_load_theme, mock_load_base):
-        """Test that outer sidebar containers have transparency CSS hooks."""
-        self.app._on_startup(self.app)
-        self.window = MainWindow(self.app)
-
-        self.assertTrue(
-            self.window.sidebar_revealer.get_style_context().has_class("sidebar-transparency-root")
-        )
-        self.assertTrue(
-            self.window.sidebar_revealer.get_child().get_style_context().has_class("sidebar-transparency-root")
-        )
-
-
-if __name__ == '__main__':
-    unittest.main()
+def test_sidebar_container_has_transparency_hooks(window):
+    """Test that outer sidebar containers have transparency CSS hooks."""
+    assert window.sidebar_revealer.get_style_context().has_class("sidebar-transparency-root")
+    assert window.sidebar_revealer.get_child().get_style_context().has_class(
+        "sidebar-transparency-root"
+    )
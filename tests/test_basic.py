@@ -2,11 +2,7 @@
 Basic smoke tests for tree-style-terminal application.
 """
 
-import gi
-
-gi.require_version("Gtk", "3.0")
-from gi.repository import Gio, Gtk
-
+from tests._gi import Gio, Gtk
 from tree_style_terminal import APPLICATION_ID, MainWindow, TreeStyleTerminalApp, main
 
 
@@ -20,29 +16,25 @@ class TestTreeStyleTerminalApp:
         assert isinstance(app, Gtk.Application)
         assert app.get_application_id() == APPLICATION_ID
 
-    def test_app_flags(self):
+    def test_app_flags(self, app):
         """Test application flags are set correctly."""
-        app = TreeStyleTerminalApp()
         assert app.get_flags() == Gio.ApplicationFlags.NON_UNIQUE
 
 
 class TestMainWindow:
     """Test the main window class."""
 
-    def test_window_creation(self):
+    def test_window_creation(self, main_window):
         """Test that main window can be created."""
-        app = TreeStyleTerminalApp()
-        window = MainWindow(application=app)
-        assert window is not None
-        assert isinstance(window, Gtk.ApplicationWindow)
-        assert window.get_title() == "Tree Style Terminal"
-        assert window.get_default_size() == (1024, 768)
+        assert main_window is not None
+        assert isinstance(main_window, MainWindow)
+        assert isinstance(main_window, Gtk.ApplicationWindow)
+        assert main_window.get_title() == "Tree Style Terminal"
+        assert main_window.get_default_size() == (1024, 768)
 
-    def test_window_has_headerbar(self):
+    def test_window_has_headerbar(self, main_window):
         """Test that window has a headerbar."""
-        app = TreeStyleTerminalApp()
-        window = MainWindow(application=app)
-        headerbar = window.get_titlebar()
+        headerbar = main_window.get_titlebar()
         assert headerbar is not None
         assert isinstance(headerbar, Gtk.HeaderBar)
 
@@ -2,11 +2,9 @@
 
 from unittest.mock import Mock, patch
 
-import gi
-
-gi.require_version("Gtk", "3.0")
-from gi.repository import Gtk
+import pytest
 
+from tests._gi import Gtk
 from tree_style_terminal.models.session import TerminalSession
 
 
@@ -23,15 +21,19 @@ def test_main_window_creation():
     assert window.session_manager is not None
 
 
-def test_main_window_methods_exist():
-    """Test that expected methods exist on MainWindow."""
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
+@pytest.fixture(scope="module")
+def shared_main_window(app):
+    """Share one main window across read-only attribute checks."""
+    from tree_style_terminal.main import MainWindow
 
-    app = TreeStyleTerminalApp()
     window = MainWindow(application=app)
+    yield window
+    window.destroy()
 
-    # Check that expected methods exist
-    expected_methods = [
+
+@pytest.mark.parametrize(
+    "method_name",
+    [
         '_on_new_terminal_clicked',
         '_on_close_session_clicked',
         '_on_new_child_clicked',
@@ -40,11 +42,11 @@ def test_main_window_methods_exist():
         '_on_export_all_activate',
         '_on_load_profile_clicked',
         'request_ai_command_draft',
-    ]
-
-    for method_name in expected_methods:
-        assert hasattr(window, method_name), f"Missing method: {method_name}"
-        assert callable(getattr(window, method_name)), f"Method not callable: {method_name}"
+    ],
+)
+def test_main_window_methods_exist(shared_main_window, method_name):
+    """Test that expected methods exist on MainWindow."""
+    assert callable(getattr(shared_main_window, method_name, None)), f"Missing method: {method_name}"
 
 
 def test_app_creation():
@@ -57,17 +59,12 @@ def test_app_creation():
     assert app.window is None  # Should be None until activated
 
 
-def test_sidebar_state_management():
+def test_sidebar_state_management(main_window):
     """Test sidebar state tracking properties."""
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
-
-    app = TreeStyleTerminalApp()
-    window = MainWindow(application=app)
-
     # Check sidebar state properties exist
-    assert hasattr(window, '_sidebar_collapsed')
-    assert isinstance(window._sidebar_collapsed, bool)
-    assert window._sidebar_collapsed is False  # Should start expanded
+    assert hasattr(main_window, '_sidebar_collapsed')
+    assert isinstance(main_window._sidebar_collapsed, bool)
+    assert main_window._sidebar_collapsed is False  # Should start expanded
 
 
 def test_sidebar_width_bounds_for_small_window():
@@ -147,13 +144,8 @@ def test_configure_sidebar_paned_uses_narrow_handle():
     assert paned.wide_handle is False
 
 
-def test_layout_components_exist():
+def test_layout_components_exist(main_window):
     """Test that layout components (Paned, Revealer) are available."""
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
-
-    app = TreeStyleTerminalApp()
-    window = MainWindow(application=app)
-
     # Check that layout-related attributes exist
     expected_attributes = [
         'paned',  # Gtk.Paned for sidebar and terminal area
@@ -161,59 +153,46 @@ def test_layout_components_exist():
     ]
 
     for attr in expected_attributes:
-        if hasattr(window, attr):
+        if hasattr(main_window, attr):
             # If it exists, it should not be None
-            assert getattr(window, attr) is not None
+            assert getattr(main_window, attr) is not None
 
 
-def test_sidebar_toggle_functionality():
+def test_sidebar_toggle_functionality(main_window):
     """Test sidebar toggle button and revealer functionality."""
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
-
-    app = TreeStyleTerminalApp()
-    window = MainWindow(application=app)
-
     # Check toggle method exists
-    assert hasattr(window, '_on_sidebar_toggle_clicked')
-    assert callable(window._on_sidebar_toggle_clicked)
+    assert hasattr(main_window, '_on_sidebar_toggle_clicked')
+    assert callable(main_window._on_sidebar_toggle_clicked)
 
     # Test initial state
-    initial_state = window._sidebar_collapsed
+    initial_state = main_window._sidebar_collapsed
 
     # Simulate toggle (without actually clicking)
     # This tests the method exists and can be called
     try:
-        window._on_sidebar_toggle_clicked(None)  # Button parameter can be None for test
+        main_window._on_sidebar_toggle_clicked(None)  # Button parameter can be None for test
         # State should have changed
-        assert window._sidebar_collapsed != initial_state
+        assert main_window._sidebar_collapsed != initial_state
     except Exception:
         # If method requires specific setup, just verify it exists
         pass
 
 
-def test_new_session_creation_schedules_terminal_focus():
+def test_new_session_creation_schedules_terminal_focus(main_window):
     """Test creating a session schedules focus back to the terminal."""
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
-
-    app = TreeStyleTerminalApp()
-    window = MainWindow(application=app)
     session = TerminalSession(pid=123, pty_fd=456, cwd="/test")
     terminal_widget = Gtk.Box()
 
     with patch("tree_style_terminal.main.GLib.idle_add") as idle_add:
-        window._on_session_created(session, terminal_widget)
+        main_window._on_session_created(session, terminal_widget)
 
-    idle_add.assert_called_with(window.focus_terminal)
+    idle_add.assert_called_with(main_window.focus_terminal)
 
 
-def test_profile_export_button_has_two_scopes_and_tracks_session_state():
+def test_profile_export_button_has_two_scopes_and_tracks_session_state(main_window):
     """The headerbar export menu exposes the two requested scopes."""
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
-
-    window = MainWindow(application=TreeStyleTerminalApp())
-
-    assert window.export_profile_button.get_sensitive() is False
-    labels = [item.get_label() for item in window.export_profile_button.get_popup().get_children()]
+    assert main_window.export_profile_button.get_sensitive() is False
+    labels = [item.get_label() for item in main_window.export_profile_button.get_popup().get_children()]
     assert labels == ["Selected Session and Children", "All Sessions"]
 
     current_session = TerminalSession(
@@ -221,65 +200,57 @@ def test_profile_export_button_has_two_scopes_and_tracks_session_state():
         pty_fd=1,
         cwd="/tmp",
     )
-    window.session_tree.add_node(current_session)
-    window.session_manager.current_session = current_session
-    window._update_button_states()
+    main_window.session_tree.add_node(current_session)
+    main_window.session_manager.current_session = current_session
+    main_window._update_button_states()
 
-    assert window.export_profile_button.get_sensitive() is True
+    assert main_window.export_profile_button.get_sensitive() is True
 
 
-def test_profile_export_scope_handlers_pass_selected_subtree_or_all_roots():
+def test_profile_export_scope_handlers_pass_selected_subtree_or_all_roots(main_window):
     """Each export menu item forwards the intended session roots."""
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
-
-    window = MainWindow(application=TreeStyleTerminalApp())
     first = TerminalSession(pid=1, pty_fd=1, cwd="/tmp", title="first")
     child = TerminalSession(pid=2, pty_fd=2, cwd="/tmp", title="child")
     second = TerminalSession(pid=3, pty_fd=3, cwd="/tmp", title="second")
-    window.session_tree.add_node(first)
-    window.session_tree.add_node(child, first)
-    window.session_tree.add_node(second)
-    window.session_manager.current_session = child
+    main_window.session_tree.add_node(first)
+    main_window.session_tree.add_node(child, first)
+    main_window.session_tree.add_node(second)
+    main_window.session_manager.current_session = child
 
-    with patch.object(window, "_save_workspace_profile") as save_profile:
-        window._on_export_selected_activate(window.export_selected_menu_item)
+    with patch.object(main_window, "_save_workspace_profile") as save_profile:
+        main_window._on_export_selected_activate(main_window.export_selected_menu_item)
         save_profile.assert_called_once_with([child])
 
         save_profile.reset_mock()
-        window._on_export_all_activate(window.export_all_menu_item)
+        main_window._on_export_all_activate(main_window.export_all_menu_item)
         save_profile.assert_called_once_with([first, second])
 
 
-def test_profile_export_cancel_does_not_write(tmp_path):
+def test_profile_export_cancel_does_not_write(tmp_path, main_window):
     """Cancelling destination selection leaves the filesystem untouched."""
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
-
-    window = MainWindow(application=TreeStyleTerminalApp())
     root = TerminalSession(pid=1, pty_fd=1, cwd=str(tmp_path), title="root")
 
     with (
-        patch.object(window, "_choose_workspace_profile_path", return_value=None),
+        patch.object(main_window, "_choose_workspace_profile_path", return_value=None),
         patch("tree_style_terminal.main.export_workspace_profile") as export_profile,
     ):
-        window._save_workspace_profile([root])
+        main_window._save_workspace_profile([root])
 
     export_profile.assert_not_called()
     assert list(tmp_path.iterdir()) == []
 
 
-def test_profile_export_reports_write_failure(tmp_path):
+def test_profile_export_reports_write_failure(tmp_path, main_window):
     """A writer error is logged and shown without escaping the UI callback."""
     from tree_style_terminal.config.workspace_profile import WorkspaceProfileError
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
 
-    window = MainWindow(application=TreeStyleTerminalApp())
     root = TerminalSession(pid=1, pty_fd=1, cwd=str(tmp_path), title="root")
-    window.session_manager.current_session = root
+    main_window.session_manager.current_session = root
     destination = tmp_path / "workspace.yml"
 
     with (
         patch.object(
-            window,
+            main_window,
             "_choose_workspace_profile_path",
             return_value=destination,
         ),
@@ -287,23 +258,20 @@ def test_profile_export_reports_write_failure(tmp_path):
             "tree_style_terminal.main.export_workspace_profile",
             side_effect=WorkspaceProfileError("write failed"),
         ),
-        patch.object(window, "_show_workspace_profile_error") as show_error,
+        patch.object(main_window, "_show_workspace_profile_error") as show_error,
     ):
-        window._save_workspace_profile([root])
+        main_window._save_workspace_profile([root])
 
     show_error.assert_called_once_with("write failed")
 
 
-def test_welcome_load_profile_button_is_directly_below_new_terminal():
+def test_welcome_load_profile_button_is_directly_below_new_terminal(main_window):
     """The welcome actions retain the requested visual order."""
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
+    children = main_window.welcome_new_terminal_button.get_parent().get_children()
 
-    window = MainWindow(application=TreeStyleTerminalApp())
-    children = window.welcome_new_terminal_button.get_parent().get_children()
-
-    new_terminal_index = children.index(window.welcome_new_terminal_button)
-    assert children[new_terminal_index + 1] is window.welcome_load_profile_button
-    assert window.welcome_load_profile_button.get_label() == "Load Profile"
+    new_terminal_index = children.index(main_window.welcome_new_terminal_button)
+    assert children[new_terminal_index + 1] is main_window.welcome_load_profile_button
+    assert main_window.welcome_load_profile_button.get_label() == "Load Profile"
 
 
 def test_workspace_profile_start_directory_expands_tilde(monkeypatch, tmp_path):
@@ -331,15 +299,12 @@ def test_workspace_profile_start_directory_falls_back_to_home(tmp_path):
         )
 
 
-def test_profile_load_chooser_uses_yaml_filter_and_configured_directory(tmp_path):
+def test_profile_load_chooser_uses_yaml_filter_and_configured_directory(tmp_path, main_window):
     """The open dialog starts as configured and only offers a YAML filter."""
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
-
     dialog = Mock()
     dialog.run.return_value = Gtk.ResponseType.CANCEL
     dialog.get_filename.return_value = None
     yaml_filter = Mock()
-    window = MainWindow(application=TreeStyleTerminalApp())
 
     with (
         patch(
@@ -355,11 +320,11 @@ def test_profile_load_chooser_uses_yaml_filter_and_configured_directory(tmp_path
             return_value=yaml_filter,
         ),
     ):
-        assert window._choose_workspace_profile_to_load() is None
+        assert main_window._choose_workspace_profile_to_load() is None
 
     chooser_dialog.assert_called_once_with(
         title="Load Workspace Profile",
-        transient_for=window,
+        transient_for=main_window,
         action=Gtk.FileChooserAction.OPEN,
     )
     dialog.set_current_folder.assert_called_once_with(str(tmp_path))
@@ -371,13 +336,12 @@ def test_profile_load_chooser_uses_yaml_filter_and_configured_directory(tmp_path
     dialog.destroy.assert_called_once_with()
 
 
-def test_welcome_profile_button_loads_all_validated_roots(tmp_path):
+def test_welcome_profile_button_loads_all_validated_roots(tmp_path, main_window):
     """Activating the button uses the shared loader and multi-root creator."""
     from tree_style_terminal.config.workspace_profile import (
         WorkspaceNode,
         WorkspaceProfile,
     )
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
 
     profile_path = tmp_path / "workspace.yml"
     roots = [
@@ -390,11 +354,10 @@ def test_welcome_profile_button_loads_all_validated_roots(tmp_path):
         name="Two roots",
         roots=roots,
     )
-    window = MainWindow(application=TreeStyleTerminalApp())
 
     with (
         patch.object(
-            window,
+            main_window,
             "_choose_workspace_profile_to_load",
             return_value=profile_path,
         ),
@@ -402,44 +365,39 @@ def test_welcome_profile_button_loads_all_validated_roots(tmp_path):
             "tree_style_terminal.main.load_workspace_profile",
             return_value=profile,
         ) as load_profile,
-        patch.object(window.session_manager, "create_workspace_trees") as create_trees,
+        patch.object(main_window.session_manager, "create_workspace_trees") as create_trees,
     ):
-        window.welcome_load_profile_button.emit("clicked")
+        main_window.welcome_load_profile_button.emit("clicked")
 
     load_profile.assert_called_once_with(profile_path)
     create_trees.assert_called_once_with(roots)
 
 
-def test_cancelling_welcome_profile_chooser_keeps_welcome_unchanged():
+def test_cancelling_welcome_profile_chooser_keeps_welcome_unchanged(main_window):
     """Cancelling creates no sessions and keeps the welcome page visible."""
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
-
-    window = MainWindow(application=TreeStyleTerminalApp())
     with (
         patch.object(
-            window,
+            main_window,
             "_choose_workspace_profile_to_load",
             return_value=None,
         ),
         patch("tree_style_terminal.main.load_workspace_profile") as load_profile,
     ):
-        window.welcome_load_profile_button.emit("clicked")
+        main_window.welcome_load_profile_button.emit("clicked")
 
     load_profile.assert_not_called()
-    assert window.session_tree.is_empty()
-    assert window.terminal_stack.get_visible_child_name() == "welcome"
+    assert main_window.session_tree.is_empty()
+    assert main_window.terminal_stack.get_visible_child_name() == "welcome"
 
 
-def test_invalid_welcome_profile_shows_load_error_without_sessions(tmp_path):
+def test_invalid_welcome_profile_shows_load_error_without_sessions(tmp_path, main_window):
     """Validation errors leave the empty welcome screen ready for another action."""
     from tree_style_terminal.config.workspace_profile import WorkspaceProfileError
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
 
     profile_path = tmp_path / "invalid.yml"
-    window = MainWindow(application=TreeStyleTerminalApp())
     with (
         patch.object(
-            window,
+            main_window,
             "_choose_workspace_profile_to_load",
             return_value=profile_path,
         ),
@@ -447,27 +405,42 @@ def test_invalid_welcome_profile_shows_load_error_without_sessions(tmp_path):
             "tree_style_terminal.main.load_workspace_profile",
             side_effect=WorkspaceProfileError("invalid profile"),
         ),
-        patch.object(window.session_manager, "create_workspace_trees") as create_trees,
-        patch.object(window, "_show_workspace_profile_error") as show_error,
+        patch.object(main_window.session_manager, "create_workspace_trees") as create_trees,
+        patch.object(main_window, "_show_workspace_profile_error") as show_error,
     ):
-        window.welcome_load_profile_button.emit("clicked")
+        main_window.welcome_load_profile_button.emit("clicked")
 
     create_trees.assert_not_called()
     show_error.assert_called_once_with("invalid profile", operation="load")
-    assert window.session_tree.is_empty()
-    assert window.terminal_stack.get_visible_child_name() == "welcome"
+    assert main_window.session_tree.is_empty()
+    assert main_window.terminal_stack.get_visible_child_name() == "welcome"
 
 
-def test_theme_update_applies_to_session_manager_terminals():
+def test_theme_update_applies_to_session_manager_terminals(main_window):
     """Test theme updates are delegated to SessionManager-managed terminals."""
-    from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
-
-    app = TreeStyleTerminalApp()
-    window = MainWindow(application=app)
     session = TerminalSession(pid=123, pty_fd=456, cwd="/test")
     terminal_widget = Mock()
-    window.session_manager._session_terminals[session] = terminal_widget
+    main_window.session_manager._session_terminals[session] = terminal_widget
 
-    window._update_terminal_themes("dark")
+    main_window._update_terminal_themes("dark")
 
     terminal_widget.apply_theme.assert_called_once_with("dark")
+
+
+def test_theme_button_icon_images_are_reused_across_toggles(app, main_window, monkeypatch):
+    """Theme toggles swap between two cached icon images."""
+    monkeypatch.setattr(app.css_loader, "current_theme", "dark")
+    main_window._update_theme_button_icon()
+    dark_image = main_window.theme_toggle_button.get_image()
+    assert main_window.theme_toggle_button.get_tooltip_text() == "Switch to Light Theme"
+
+    monkeypatch.setattr(app.css_loader, "current_theme", "light")
+    main_window._update_theme_button_icon()
+    light_image = main_window.theme_toggle_button.get_image()
+    assert main_window.theme_toggle_button.get_tooltip_text() == "Switch to Dark Theme"
+
+    monkeypatch.setattr(app.css_loader, "current_theme", "dark")
+    main_window._update_theme_button_icon()
+
+    assert light_image is not dark_image
+    assert main_window.theme_toggle_button.get_image() is dark_image
@@ -21,34 +21,57 @@ def test_vte_terminal_creation():
     assert hasattr(terminal, '_context_menu')
 
 
-def test_font_size_configuration():
-    """Test set_font_size() doesn't crash with valid inputs."""
+@pytest.fixture(scope="module")
+def terminal(gtk_display):
+    """Share one terminal widget across side-effect-free setter tests."""
     from tree_style_terminal.widgets.terminal import VteTerminal
 
-    terminal = VteTerminal()
+    return VteTerminal()
 
-    # Test valid font sizes
-    terminal.set_font_size(10)
-    terminal.set_font_size(12)
-    terminal.set_font_size(14)
-    terminal.set_font_size(16)
 
-    # Should not raise exceptions
+@pytest.mark.parametrize("size", [10, 12, 14, 16])
+def test_font_size_configuration(terminal, size):
+    """Test set_font_size() doesn't crash with valid inputs."""
+    terminal.set_font_size(size)
 
 
-def test_scrollback_configuration():
-    """Test set_scrollback_length() doesn't crash with valid inputs."""
-    from tree_style_terminal.widgets.terminal import VteTerminal
+def test_font_descriptions_are_shared_per_size():
+    """Test font descriptions are built once per family and size."""
+    from tree_style_terminal.widgets.terminal import (
+        TERMINAL_FONT_FAMILY,
+        _get_font_description,
+    )
 
-    terminal = VteTerminal()
+    font_desc = _get_font_description(TERMINAL_FONT_FAMILY, 13)
 
-    # Test valid scrollback lengths
-    terminal.set_scrollback_length(1000)
-    terminal.set_scrollback_length(5000)
-    terminal.set_scrollback_length(10000)
-    terminal.set_scrollback_length(0)  # Should handle zero
+    assert _get_font_description(TERMINAL_FONT_FAMILY, 13) is font_desc
+    assert _get_font_description(TERMINAL_FONT_FAMILY, 14) is not font_desc
+    assert font_desc.get_family() == TERMINAL_FONT_FAMILY
 
-    # Should not raise exceptions
+
+def test_hex_colors_match_gdk_parsing():
+    """Test palette colors decoded from hex match Gdk's own parser."""
+    from tests._gi import Gdk
+    from tree_style_terminal.widgets.terminal import _parse_rgba
+
+    for color in ("#000000", "#ffffff", "#3465a4", "#ad7fa8"):
+        expected = Gdk.RGBA()
+        expected.parse(color)
+        assert _parse_rgba(color).equal(expected)
+
+
+@pytest.mark.parametrize(
+    "length",
+    [
+        pytest.param(1000, id="1000"),
+        pytest.param(5000, id="5000"),
+        pytest.param(10000, id="10000"),
+        pytest.param(0, id="zero"),
+    ],
+)
+def test_scrollback_configuration(terminal, length):
+    """Test set_scrollback_length() doesn't crash with valid inputs."""
+    terminal.set_scrollback_length(length)
 
 
 def test_shell_argv_logic():
@@ -80,7 +103,15 @@ def test_shell_argv_logic():
             del os.environ['SHELL']
 
 
-def test_spawn_shell_uses_exact_constructed_environment():
+@pytest.fixture
+def empty_spawn_envv_cache(monkeypatch):
+    """Start without a cached spawn envv; monkeypatch restores the cache afterwards."""
+    from tree_style_terminal.widgets import terminal as terminal_module
+
+    monkeypatch.setattr(terminal_module, "_spawn_envv_cache", None)
+
+
+def test_spawn_shell_uses_exact_constructed_environment(empty_spawn_envv_cache):
     """VTE must not merge the bundled parent environment back into envv."""
     from tree_style_terminal.widgets.terminal import (
         TERMINAL_SPAWN_FLAGS,
@@ -112,6 +143,20 @@ def test_spawn_shell_uses_exact_constructed_environment():
     assert pty.spawn_async.call_args.args[3] == TERMINAL_SPAWN_FLAGS
 
 
+def test_spawn_envv_is_built_once(empty_spawn_envv_cache):
+    """The envv is formatted once and handed out as independent copies."""
+    from tree_style_terminal.widgets.terminal import build_spawn_envv
+
+    target = "tree_style_terminal.widgets.terminal.build_terminal_environment"
+    with patch(target, return_value={"PATH": "/usr/bin", "TERM": "xterm"}) as build_env:
+        first = build_spawn_envv()
+        first.append("MUTATED=1")
+        second = build_spawn_envv()
+
+    assert build_env.call_count == 1
+    assert second == ["PATH=/usr/bin", "TERM=xterm"]
+
+
 def test_terminal_properties():
     """Test that terminal widget has expected properties."""
     from tree_style_terminal.widgets.terminal import (
@@ -144,14 +189,9 @@ def test_context_menu_labels_are_english():
     assert terminal._select_all_menu_item.get_label() == "Select All"
 
 
-def test_terminal_methods_exist():
-    """Test that all expected methods exist on the terminal widget."""
-    from tree_style_terminal.widgets.terminal import VteTerminal
-
-    terminal = VteTerminal()
-
-    # Check that all expected methods exist
-    expected_methods = [
+@pytest.mark.parametrize(
+    "method_name",
+    [
         'spawn_shell',
         'set_font_size',
         'set_scrollback_length',
@@ -172,12 +212,12 @@ def test_terminal_methods_exist():
         '_update_target_menu_labels',
         'get_window_title',
         'get_current_directory',
-        'close'
-    ]
-
-    for method_name in expected_methods:
-        assert hasattr(terminal, method_name), f"Missing method: {method_name}"
-        assert callable(getattr(terminal, method_name)), f"Method not callable: {method_name}"
+        'close',
+    ],
+)
+def test_terminal_methods_exist(terminal, method_name):
+    """Test that all expected methods exist on the terminal widget."""
+    assert callable(getattr(terminal, method_name, None)), f"Missing method: {method_name}"
 
 
 def test_command_draft_context_reads_bounded_history_and_editable_input():
@@ -251,6 +291,23 @@ def test_replace_current_input_rejects_multiline_command():
     terminal.terminal.feed_child.assert_not_called()
 
 
+def test_scrollback_grows_to_configured_length_at_idle():
+    """Test the configured scrollback is applied after the initial small buffer."""
+    from tree_style_terminal.widgets.terminal import (
+        INITIAL_SCROLLBACK_LINES,
+        VteTerminal,
+    )
+
+    with patch("tree_style_terminal.widgets.terminal.GLib.idle_add") as mock_idle_add:
+        terminal = VteTerminal()
+
+    assert terminal.terminal.get_scrollback_lines() == INITIAL_SCROLLBACK_LINES
+    mock_idle_add.assert_any_call(terminal._grow_scrollback)
+
+    assert terminal._grow_scrollback() is False
+    assert terminal.terminal.get_scrollback_lines() == terminal._target_scrollback
+
+
 def test_get_current_directory_uses_vte_uri(tmp_path):
     """Test current directory is read from VTE's tracked file URI."""
     from tree_style_terminal.widgets.terminal import VteTerminal
@@ -286,19 +343,49 @@ def test_get_current_directory_uses_child_process_cwd(tmp_path):
     assert terminal.get_current_directory() == os.getcwd()
 
 
+def test_get_current_directory_caches_child_process_cwd(tmp_path):
+    """Test repeated directory queries reuse the recent process cwd lookup."""
+    from tree_style_terminal.widgets.terminal import VteTerminal
+
+    terminal = VteTerminal()
+    terminal.terminal = Mock()
+    terminal.terminal.get_current_directory_uri.return_value = None
+    terminal.pid = os.getpid()
+
+    with patch("tree_style_terminal.widgets.terminal.os.readlink", return_value=str(tmp_path)) as mock_readlink:
+        assert terminal.get_current_directory() == str(tmp_path)
+        assert terminal.get_current_directory() == str(tmp_path)
+
+    mock_readlink.assert_called_once_with(f"/proc/{os.getpid()}/cwd")
+
+
+def test_title_changes_coalesce_into_one_idle_update():
+    """Test bursts of title changes schedule a single idle flush."""
+    from tree_style_terminal.widgets.terminal import VteTerminal
+
+    terminal = VteTerminal()
+
+    with patch("tree_style_terminal.widgets.terminal.GLib.idle_add", return_value=7) as mock_idle_add:
+        terminal._on_title_changed(terminal.terminal)
+        terminal._on_title_changed(terminal.terminal)
+        terminal._on_title_changed(terminal.terminal)
+
+    mock_idle_add.assert_called_once_with(terminal._flush_title)
+    assert terminal._flush_title() is False
+    assert terminal._title_source_id == 0
+
+
 def test_spawn_complete_stores_child_pid():
     """Test spawn completion records the child process id returned by VTE."""
     from tree_style_terminal.widgets.terminal import VteTerminal
 
     terminal = VteTerminal()
-    terminal._spawn_argv = ["/bin/bash"]
-    terminal._spawn_cwd = "/tmp"
 
     pty = Mock()
     pty.spawn_finish.return_value = (True, 12345)
     pty.get_fd.return_value = 99
 
-    terminal._on_spawn_complete(pty, Mock())
+    terminal._on_spawn_complete(pty, Mock(), cwd="/tmp")
 
     assert terminal.pid == 12345
     assert terminal.pty_fd == 99
@@ -568,8 +655,7 @@ def test_open_context_target_uses_gtk_show_uri():
 
 def test_primary_click_does_not_show_context_menu_or_affect_selection():
     """Test normal terminal clicks are left for VTE selection handling."""
-    from gi.repository import Gdk
-
+    from tests._gi import Gdk
     from tree_style_terminal.widgets.terminal import VteTerminal
 
     terminal = VteTerminal()
@@ -586,8 +672,7 @@ def test_primary_click_does_not_show_context_menu_or_affect_selection():
 
 def test_terminal_search_escape_closes_search():
     """Test Escape closes the terminal search UI."""
-    from gi.repository import Gdk
-
+    from tests._gi import Gdk
     from tree_style_terminal.widgets.terminal import VteTerminal
 
     terminal = VteTerminal()
@@ -603,8 +688,7 @@ def test_terminal_search_escape_closes_search():
 
 def test_terminal_search_enter_moves_to_next_match():
     """Test Enter moves to the next terminal search match."""
-    from gi.repository import Gdk
-
+    from tests._gi import Gdk
     from tree_style_terminal.widgets.terminal import VteTerminal
 
     terminal = VteTerminal()
@@ -625,8 +709,7 @@ def test_terminal_search_enter_moves_to_next_match():
 
 def test_terminal_search_shift_enter_moves_to_previous_match():
     """Test Shift+Enter moves to the previous terminal search match."""
-    from gi.repository import Gdk
-
+    from tests._gi import Gdk
     from tree_style_terminal.widgets.terminal import VteTerminal
 
     terminal = VteTerminal()
@@ -647,8 +730,7 @@ def test_terminal_search_shift_enter_moves_to_previous_match():
 
 def test_terminal_search_non_escape_key_is_not_handled():
     """Test non-Escape keys keep normal entry handling."""
-    from gi.repository import Gdk
-
+    from tests._gi import Gdk
     from tree_style_terminal.widgets.terminal import VteTerminal
 
     terminal = VteTerminal()
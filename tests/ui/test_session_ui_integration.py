@@ -5,38 +5,49 @@ Tests the integration between HeaderBar buttons, keyboard shortcuts,
 and session management operations as specified in Milestone 5 point 4.
 """
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
-import gi
 import pytest
 
-gi.require_version('Gtk', '3.0')
-gi.require_version('Gio', '2.0')
-from gi.repository import Gtk
-
-from tree_style_terminal.controllers.session_manager import SessionManager
+from tests._gi import Gtk
 from tree_style_terminal.controllers.shortcuts import ShortcutController
 from tree_style_terminal.models.session import TerminalSession
-from tree_style_terminal.models.tree import SessionTree
+
+# Throwaway values for tests that only check identity or presence.
+_TWO_SESSIONS = (object(), object())
+_DUMMY_SESSION = TerminalSession(pid=0, pty_fd=0, cwd="/", title="dummy")
 
 
 class TestSessionUIIntegration:
     """Test cases for UI integration of session control buttons."""
 
     @pytest.fixture
-    def session_tree(self):
-        """Create a test session tree."""
-        return SessionTree()
+    def shortcut_controller(self, session_manager):
+        """Create a test shortcut controller."""
+        return ShortcutController(session_manager)
 
     @pytest.fixture
-    def session_manager(self, session_tree):
-        """Create a test session manager."""
-        return SessionManager(session_tree)
+    def actions(self, shortcut_controller):
+        """Look up the session actions once per test."""
+        return SimpleNamespace(
+            new_sibling=shortcut_controller.get_action("new_sibling"),
+            new_child=shortcut_controller.get_action("new_child"),
+            close_session=shortcut_controller.get_action("close_session"),
+        )
 
     @pytest.fixture
-    def shortcut_controller(self, session_manager):
-        """Create a test shortcut controller."""
-        return ShortcutController(session_manager)
+    def patch_vte_terminal(self, monkeypatch):
+        """Replace VteTerminal in the session manager with a spawning mock."""
+        mock_terminal = Mock()
+        mock_terminal.spawn_shell.return_value = True
+        mock_terminal.terminal = Mock()
+        mock_terminal.get_current_directory.return_value = "/home/user"
+        monkeypatch.setattr(
+            'tree_style_terminal.controllers.session_manager.VteTerminal',
+            Mock(return_value=mock_terminal),
+        )
+        return mock_terminal
 
     @pytest.fixture
     def mock_headerbar_buttons(self):
@@ -58,101 +69,94 @@ class TestSessionUIIntegration:
 
         return buttons
 
-    def test_button_action_integration(self, shortcut_controller, mock_headerbar_buttons):
+    def test_button_action_integration(self, actions, mock_headerbar_buttons):
         """Test that button clicks trigger the correct actions."""
-        # Get the actions from shortcut controller
-        new_sibling_action = shortcut_controller.get_action("new_sibling")
-        new_child_action = shortcut_controller.get_action("new_child")
-        close_session_action = shortcut_controller.get_action("close_session")
-
         # Verify actions exist
-        assert new_sibling_action is not None
-        assert new_child_action is not None
-        assert close_session_action is not None
+        assert actions.new_sibling is not None
+        assert actions.new_child is not None
+        assert actions.close_session is not None
 
         # Verify actions are callable
-        assert callable(new_sibling_action.activate)
-        assert callable(new_child_action.activate)
-        assert callable(close_session_action.activate)
+        assert callable(actions.new_sibling.activate)
+        assert callable(actions.new_child.activate)
+        assert callable(actions.close_session.activate)
 
-    def test_action_state_management(self, shortcut_controller, session_manager):
+    def test_action_state_management(self, shortcut_controller, session_manager, actions):
         """Test that action states are properly managed."""
         # Test with no current session
         session_manager.current_session = None
         shortcut_controller.update_action_states()
 
         # new_child and new_sibling should be enabled, close should be disabled
-        assert shortcut_controller.get_action("new_child").get_enabled()
-        assert shortcut_controller.get_action("new_sibling").get_enabled()
-        assert not shortcut_controller.get_action("close_session").get_enabled()
+        assert actions.new_child.get_enabled()
+        assert actions.new_sibling.get_enabled()
+        assert not actions.close_session.get_enabled()
 
         # Test with current session
-        mock_session = TerminalSession(pid=123, pty_fd=456, cwd="/test", title="test")
-        session_manager.current_session = mock_session
+        session_manager.current_session = _DUMMY_SESSION
 
-        with patch.object(session_manager, 'get_all_sessions', return_value=[mock_session]):
+        with patch.object(session_manager, 'get_all_sessions', return_value=[_DUMMY_SESSION]):
             shortcut_controller.update_action_states()
 
         # All actions should be enabled
-        assert shortcut_controller.get_action("new_child").get_enabled()
-        assert shortcut_controller.get_action("new_sibling").get_enabled()
-        assert shortcut_controller.get_action("close_session").get_enabled()
+        assert actions.new_child.get_enabled()
+        assert actions.new_sibling.get_enabled()
+        assert actions.close_session.get_enabled()
 
-    def test_button_callback_integration(self, shortcut_controller, session_manager):
+    def test_button_callback_integration(self, actions, session_manager, monkeypatch):
         """Test that button callbacks properly integrate with actions."""
         # Create mock button callbacks that simulate the MainWindow button callbacks
         def mock_new_sibling_callback():
-            action = shortcut_controller.get_action("new_sibling")
-            if action:
-                action.activate(None)
+            if actions.new_sibling:
+                actions.new_sibling.activate(None)
 
         def mock_new_child_callback():
-            action = shortcut_controller.get_action("new_child")
-            if action:
-                action.activate(None)
+            if actions.new_child:
+                actions.new_child.activate(None)
 
         def mock_close_session_callback():
-            action = shortcut_controller.get_action("close_session")
-            if action:
-                action.activate(None)
+            if actions.close_session:
+                actions.close_session.activate(None)
 
         # Mock session manager methods to track calls
-        with patch.object(session_manager, 'new_sibling') as mock_new_sibling, \
-             patch.object(session_manager, 'new_child') as mock_new_child, \
-             patch.object(session_manager, 'get_all_sessions', return_value=[Mock(), Mock()]), \
-             patch.object(session_manager, 'close_current_session') as mock_close:
-
-            session_manager.current_session = Mock()
-
-            # Test button callbacks
-            mock_new_sibling_callback()
-            mock_new_child_callback()
-            mock_close_session_callback()
-
-            # Verify methods were called
-            mock_new_sibling.assert_called_once()
-            mock_new_child.assert_called_once()
-            mock_close.assert_called_once()
-
-    def test_keyboard_vs_button_consistency(self, shortcut_controller, session_manager):
+        mock_new_sibling = Mock()
+        mock_new_child = Mock()
+        mock_close = Mock()
+        monkeypatch.setattr(session_manager, 'new_sibling', mock_new_sibling)
+        monkeypatch.setattr(session_manager, 'new_child', mock_new_child)
+        monkeypatch.setattr(session_manager, 'get_all_sessions', Mock(return_value=_TWO_SESSIONS))
+        monkeypatch.setattr(session_manager, 'close_current_session', mock_close)
+
+        session_manager.current_session = _DUMMY_SESSION
+
+        # Test button callbacks
+        mock_new_sibling_callback()
+        mock_new_child_callback()
+        mock_close_session_callback()
+
+        # Verify methods were called
+        mock_new_sibling.assert_called_once()
+        mock_new_child.assert_called_once()
+        mock_close.assert_called_once()
+
+    def test_keyboard_vs_button_consistency(self, actions, session_manager, monkeypatch):
         """Test that keyboard shortcuts and buttons call identical code paths."""
         # Mock session manager methods
-        with patch.object(session_manager, 'new_sibling') as mock_new_sibling, \
-             patch.object(session_manager, 'new_child') as mock_new_child:
-
-            # Test that both keyboard shortcuts and button callbacks
-            # call the same underlying methods
+        mock_new_sibling = Mock()
+        mock_new_child = Mock()
+        monkeypatch.setattr(session_manager, 'new_sibling', mock_new_sibling)
+        monkeypatch.setattr(session_manager, 'new_child', mock_new_child)
 
-            # Simulate keyboard shortcut activation
-            new_sibling_action = shortcut_controller.get_action("new_sibling")
-            new_child_action = shortcut_controller.get_action("new_child")
+        # Test that both keyboard shortcuts and button callbacks
+        # call the same underlying methods
 
-            new_sibling_action.activate(None)
-            new_child_action.activate(None)
+        # Simulate keyboard shortcut activation
+        actions.new_sibling.activate(None)
+        actions.new_child.activate(None)
 
-            # Verify the same methods are called as would be called by buttons
-            mock_new_sibling.assert_called_once()
-            mock_new_child.assert_called_once()
+        # Verify the same methods are called as would be called by buttons
+        mock_new_sibling.assert_called_once()
+        mock_new_child.assert_called_once()
 
     def test_mock_button_state_updates(self, mock_headerbar_buttons, session_manager):
         """Test button state update simulation."""
@@ -172,53 +176,45 @@ class TestSessionUIIntegration:
         mock_headerbar_buttons['close_session_button'].set_sensitive.assert_called_with(False)
 
         # Test with current session
-        session_manager.current_session = TerminalSession(pid=123, pty_fd=456, cwd="/test", title="test")
+        session_manager.current_session = _DUMMY_SESSION
         mock_update_button_states()
 
         mock_headerbar_buttons['close_session_button'].set_sensitive.assert_called_with(True)
 
-    def test_action_error_handling(self, shortcut_controller, session_manager):
+    def test_action_error_handling(self, actions, monkeypatch):
         """Test that actions handle errors gracefully."""
         # Mock VTE terminal creation to raise exceptions
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal', side_effect=Exception("VTE creation failed")):
-            # Actions should not raise exceptions
-            new_child_action = shortcut_controller.get_action("new_child")
-            new_sibling_action = shortcut_controller.get_action("new_sibling")
+        monkeypatch.setattr(
+            'tree_style_terminal.controllers.session_manager.VteTerminal',
+            Mock(side_effect=Exception("VTE creation failed")),
+        )
 
-            # These should not raise exceptions
-            new_child_action.activate(None)
-            new_sibling_action.activate(None)
+        # These should not raise exceptions
+        actions.new_child.activate(None)
+        actions.new_sibling.activate(None)
 
-    def test_session_tree_integration(self, session_manager):
+    def test_session_tree_integration(self, session_manager, patch_vte_terminal):
         """Test integration with session tree operations."""
-        # Create sessions using the manager
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
-            mock_terminal = Mock()
-            mock_terminal.spawn_shell.return_value = True
-            mock_terminal.terminal = Mock()
-            mock_terminal.get_current_directory.return_value = "/home/user"
-            MockVteTerminal.return_value = mock_terminal
-
-            # Create root session
-            root_session = session_manager.new_session()
-            assert root_session is not None
-
-            # Create child session
-            session_manager.current_session = root_session
-            child_session = session_manager.new_child()
-            assert child_session is not None
-
-            # Verify tree structure
-            assert session_manager.session_tree.get_parent(child_session) == root_session
-            assert child_session in session_manager.session_tree.get_children(root_session)
-
-            # Create sibling session
-            sibling_session = session_manager.new_sibling()
-            assert sibling_session is not None
-
-            # Verify sibling relationship
-            assert session_manager.session_tree.get_parent(sibling_session) == root_session
-            assert len(session_manager.session_tree.get_children(root_session)) == 2
+        # Create root session
+        root_session = session_manager.new_session()
+        assert root_session is not None
+
+        # Create child session
+        session_manager.current_session = root_session
+        child_session = session_manager.new_child()
+        assert child_session is not None
+
+        # Verify tree structure
+        assert session_manager.session_tree.get_parent(child_session) == root_session
+        assert child_session in session_manager.session_tree.get_children(root_session)
+
+        # Create sibling session
+        sibling_session = session_manager.new_sibling()
+        assert sibling_session is not None
+
+        # Verify sibling relationship
+        assert session_manager.session_tree.get_parent(sibling_session) == root_session
+        assert len(session_manager.session_tree.get_children(root_session)) == 2
 
     def test_mock_button_properties(self, mock_headerbar_buttons):
         """Test that mock buttons have the expected properties."""
@@ -2,11 +2,7 @@
 
 from unittest.mock import Mock, patch
 
-import gi
-
-gi.require_version("Gtk", "3.0")
-from gi.repository import Gdk, Gtk
-
+from tests._gi import Gdk, Gtk
 from tree_style_terminal.ai_command import AICommandConfig, CommandDraftError
 from tree_style_terminal.config import config_manager
 from tree_style_terminal.main import MainWindow, TreeStyleTerminalApp
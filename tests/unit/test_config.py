@@ -6,10 +6,10 @@ Tests configuration loading, validation, default creation, and error handling.
 """
 
 import os
+import re
 import stat
 import subprocess
 import sys
-import tempfile
 from copy import deepcopy
 from pathlib import Path
 from unittest.mock import patch
@@ -20,6 +20,20 @@ import yaml
 from tree_style_terminal.config import ConfigError, ConfigManager, get_config_manager
 from tree_style_terminal.config.defaults import DEFAULT_CONFIG
 
+# Use libyaml's C emitter when PyYAML was built with it.
+_Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Taken once at import; tests compare against it without copying the defaults again.
+_DEFAULT_SNAPSHOT = deepcopy(DEFAULT_CONFIG)
+
+# Expected result of merging test_merge_with_defaults' config over the defaults.
+_EXPECTED_MERGED_NEW_SECTION = {
+    **_DEFAULT_SNAPSHOT,
+    "theme": "light",
+    "terminal": {**_DEFAULT_SNAPSHOT["terminal"], "scrollback_lines": 5000},
+    "new_section": {"new_value": "test"},
+}
+
 
 class TestConfigManager:
     """Test cases for ConfigManager."""
@@ -96,22 +110,19 @@ class TestConfigManager:
 
         assert not config_home.exists()
 
-    def test_load_config_creates_default_when_missing(self):
+    def test_load_config_creates_default_when_missing(self, tmp_path):
         """Test that load_config creates default config when file doesn't exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager()
-            config_manager._config_path = (
-                Path(temp_dir) / "nested" / "config" / "config.yaml"
-            )
+        config_manager = ConfigManager()
+        config_manager._config_path = tmp_path / "nested" / "config" / "config.yaml"
 
-            # Load config - should create default
-            config_manager.load_config()
+        # Load config - should create default
+        config_manager.load_config()
 
-            # Check file was created
-            assert config_manager._config_path.exists()
-            assert config_manager._loaded
-            assert config_manager._config == DEFAULT_CONFIG
-            assert config_manager._config["terminal"] is not DEFAULT_CONFIG["terminal"]
+        # Check file was created
+        assert config_manager._config_path.exists()
+        assert config_manager._loaded
+        assert config_manager._config == _DEFAULT_SNAPSHOT
+        assert config_manager._config["terminal"] is not DEFAULT_CONFIG["terminal"]
 
     def test_new_config_directory_is_private_to_current_user(self, tmp_path):
         """Fresh application config directories are created with mode 0700."""
@@ -129,107 +140,102 @@ class TestConfigManager:
 
     def test_loaded_defaults_cannot_mutate_default_config(self):
         """Loaded configuration owns independent nested default values."""
-        original_defaults = deepcopy(DEFAULT_CONFIG)
         config_manager = ConfigManager()
 
         merged = config_manager._merge_with_defaults({"theme": "light"})
         merged["terminal"]["scrollback_lines"] = 123
         merged["shortcuts"]["terminal_search"] = "F1"
 
-        assert original_defaults == DEFAULT_CONFIG
+        assert DEFAULT_CONFIG == _DEFAULT_SNAPSHOT
 
-    def test_load_config_from_existing_file(self):
+    def test_load_config_from_existing_file(self, tmp_path):
         """Test loading configuration from existing file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = Path(temp_dir) / "config.yaml"
+        config_path = tmp_path / "config.yaml"
 
-            # Create custom config file
-            custom_config = {
-                "theme": "light",
-                "terminal": {"scrollback_lines": 5000},
-                "ui": {"sidebar_width": 300}
-            }
+        # Create custom config file
+        custom_config = {
+            "theme": "light",
+            "terminal": {"scrollback_lines": 5000},
+            "ui": {"sidebar_width": 300}
+        }
 
-            original_content = yaml.dump(custom_config)
-            config_path.write_text(original_content, encoding="utf-8")
+        original_content = yaml.dump(custom_config, Dumper=_Dumper)
+        config_path.write_text(original_content, encoding="utf-8")
 
-            config_manager = ConfigManager()
-            config_manager._config_path = config_path
-            config_manager.load_config()
+        config_manager = ConfigManager()
+        config_manager._config_path = config_path
+        config_manager.load_config()
+
+        # Check custom values were loaded and merged with defaults
+        assert config_manager._config["theme"] == "light"
+        assert config_manager._config["terminal"]["scrollback_lines"] == 5000
+        assert config_manager._config["ui"]["sidebar_width"] == 300
+        # Check default values still present
+        assert config_manager._config["app"]["log_level"] == "warning"
+        assert config_manager._config["terminal"]["transparency"] == 1.0
+        assert config_manager._config["display"]["dpi_scale"] == "auto"
+        assert config_manager._config["shortcuts"]["terminal_search"] == "<Control><Shift>f"
+        assert config_manager._config["workspace_profiles"]["default_directory"] == ""
+        assert config_manager._config["ai"] == {
+            "endpoint": "",
+            "api_key": "",
+            "model": "",
+        }
+        assert config_manager._config["shortcuts"]["ai_command_draft"] == (
+            "<Control><Shift>a"
+        )
+        assert config_path.read_text(encoding="utf-8") == original_content
 
-            # Check custom values were loaded and merged with defaults
-            assert config_manager._config["theme"] == "light"
-            assert config_manager._config["terminal"]["scrollback_lines"] == 5000
-            assert config_manager._config["ui"]["sidebar_width"] == 300
-            # Check default values still present
-            assert config_manager._config["app"]["log_level"] == "warning"
-            assert config_manager._config["terminal"]["transparency"] == 1.0
-            assert config_manager._config["display"]["dpi_scale"] == "auto"
-            assert config_manager._config["shortcuts"]["terminal_search"] == "<Control><Shift>f"
-            assert config_manager._config["workspace_profiles"]["default_directory"] == ""
-            assert config_manager._config["ai"] == {
-                "endpoint": "",
-                "api_key": "",
-                "model": "",
-            }
-            assert config_manager._config["shortcuts"]["ai_command_draft"] == (
-                "<Control><Shift>a"
-            )
-            assert config_path.read_text(encoding="utf-8") == original_content
-
-    def test_new_default_config_is_private_to_current_user(self):
+    def test_new_default_config_is_private_to_current_user(self, tmp_path):
         """Fresh config files are created with mode 0600 regardless of umask."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager()
-            config_manager._config_path = Path(temp_dir) / "config.yaml"
+        config_manager = ConfigManager()
+        config_manager._config_path = tmp_path / "config.yaml"
 
-            previous_umask = os.umask(0)
-            try:
-                config_manager.load_config()
-            finally:
-                os.umask(previous_umask)
+        previous_umask = os.umask(0)
+        try:
+            config_manager.load_config()
+        finally:
+            os.umask(previous_umask)
 
-            mode = stat.S_IMODE(config_manager._config_path.stat().st_mode)
-            assert mode == 0o600
+        mode = stat.S_IMODE(config_manager._config_path.stat().st_mode)
+        assert mode == 0o600
 
-    def test_load_config_only_loads_once(self):
+    def test_load_config_only_loads_once(self, tmp_path):
         """Test that load_config only loads once unless explicitly reloaded."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager()
-            config_manager._config_path = Path(temp_dir) / "config.yaml"
+        config_manager = ConfigManager()
+        config_manager._config_path = tmp_path / "config.yaml"
 
-            # First load
-            config_manager.load_config()
+        # First load
+        config_manager.load_config()
 
-            # Modify the config in memory
-            config_manager._config["theme"] = "modified"
+        # Modify the config in memory
+        config_manager._config["theme"] = "modified"
 
-            # Load again - should not reload from file
-            config_manager.load_config()
-            assert config_manager._config["theme"] == "modified"
+        # Load again - should not reload from file
+        config_manager.load_config()
+        assert config_manager._config["theme"] == "modified"
 
-    def test_reload_config(self):
+    def test_reload_config(self, tmp_path):
         """Test that reload forces a fresh load from file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = Path(temp_dir) / "config.yaml"
+        config_path = tmp_path / "config.yaml"
 
-            # Create initial config
-            with open(config_path, 'w') as f:
-                yaml.dump({"theme": "light"}, f)
+        # Create initial config
+        with open(config_path, 'w') as f:
+            yaml.dump({"theme": "light"}, f, Dumper=_Dumper)
 
-            config_manager = ConfigManager()
-            config_manager._config_path = config_path
-            config_manager.load_config()
+        config_manager = ConfigManager()
+        config_manager._config_path = config_path
+        config_manager.load_config()
 
-            assert config_manager._config["theme"] == "light"
+        assert config_manager._config["theme"] == "light"
 
-            # Modify file
-            with open(config_path, 'w') as f:
-                yaml.dump({"theme": "dark"}, f)
+        # Modify file
+        with open(config_path, 'w') as f:
+            yaml.dump({"theme": "dark"}, f, Dumper=_Dumper)
 
-            # Reload should pick up changes
-            config_manager.reload()
-            assert config_manager._config["theme"] == "dark"
+        # Reload should pick up changes
+        config_manager.reload()
+        assert config_manager._config["theme"] == "dark"
 
     def test_get_simple_value(self):
         """Test getting simple configuration values."""
@@ -261,16 +267,15 @@ class TestConfigManager:
         assert config_manager.get("nonexistent", "default") == "default"
         assert config_manager.get("nested.nonexistent", 42) == 42
 
-    def test_get_loads_config_if_not_loaded(self):
+    def test_get_loads_config_if_not_loaded(self, tmp_path):
         """Test that get() loads config if not already loaded."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_manager = ConfigManager()
-            config_manager._config_path = Path(temp_dir) / "config.yaml"
+        config_manager = ConfigManager()
+        config_manager._config_path = tmp_path / "config.yaml"
 
-            # Get should trigger load
-            value = config_manager.get("theme")
-            assert config_manager._loaded
-            assert value == DEFAULT_CONFIG["theme"]
+        # Get should trigger load
+        value = config_manager.get("theme")
+        assert config_manager._loaded
+        assert value == _DEFAULT_SNAPSHOT["theme"]
 
     def test_validation_valid_values(self):
         """Test validation with valid configuration values."""
@@ -311,66 +316,41 @@ class TestConfigManager:
         with pytest.raises(ConfigError, match="default_directory.*must be of type str"):
             config_manager._validate_config()
 
-    def test_validation_invalid_theme(self):
-        """Test validation rejects invalid theme values."""
-        config_manager = ConfigManager()
-        config_manager._config = {"theme": "invalid_theme"}
-
-        with pytest.raises(ConfigError, match="theme.*must be one of.*light.*dark.*automatic"):
-            config_manager._validate_config()
-
-    def test_validation_invalid_log_level(self):
-        """Test validation rejects invalid log level values."""
-        config_manager = ConfigManager()
-        config_manager._config = {"app": {"log_level": "verbose"}}
-
-        with pytest.raises(ConfigError, match="log_level.*must be one of.*debug.*info.*warning.*error.*critical"):
-            config_manager._validate_config()
-
-    def test_validation_invalid_scrollback_lines(self):
-        """Test validation rejects invalid scrollback line values."""
-        config_manager = ConfigManager()
-        config_manager._config = {"terminal": {"scrollback_lines": 50}}  # Too low
-
-        with pytest.raises(ConfigError, match="scrollback_lines.*must be >= 100"):
+    @pytest.fixture
+    def config_manager(self):
+        """Create an unloaded ConfigManager for validation tests."""
+        return ConfigManager()
+
+    @pytest.mark.parametrize(
+        "config,match",
+        [
+            pytest.param({"theme": "invalid_theme"}, re.compile("theme.*must be one of.*light.*dark.*automatic"), id="theme"),
+            pytest.param({"app": {"log_level": "verbose"}}, re.compile("log_level.*must be one of.*debug.*info.*warning.*error.*critical"), id="log-level"),
+            pytest.param({"terminal": {"scrollback_lines": 50}}, re.compile("scrollback_lines.*must be >= 100"), id="scrollback-too-low"),
+            pytest.param({"terminal": {"scrollback_lines": 200000}}, re.compile("scrollback_lines.*must be <= 100000"), id="scrollback-too-high"),
+            pytest.param({"terminal": {"transparency": -0.1}}, re.compile("transparency.*must be >= 0.0"), id="transparency-too-low"),
+            pytest.param({"terminal": {"transparency": 1.5}}, re.compile("transparency.*must be <= 1.0"), id="transparency-too-high"),
+            pytest.param({"ui": {"sidebar_width": 20}}, re.compile("sidebar_width.*must be >= 50"), id="sidebar-width"),
+            pytest.param({"display": {"dpi_scale": "invalid"}}, re.compile("dpi_scale.*must be 'auto' or a numeric value"), id="dpi-scale"),
+        ],
+    )
+    def test_validation_rejects(self, config_manager, config, match):
+        """Test validation rejects out-of-range and unknown values."""
+        config_manager._config = config
+
+        with pytest.raises(ConfigError, match=match):
             config_manager._validate_config()
 
-        config_manager._config = {"terminal": {"scrollback_lines": 200000}}  # Too high
-        with pytest.raises(ConfigError, match="scrollback_lines.*must be <= 100000"):
-            config_manager._validate_config()
-
-    def test_validation_invalid_transparency(self):
-        """Test validation rejects invalid transparency values."""
-        config_manager = ConfigManager()
-        config_manager._config = {"terminal": {"transparency": -0.1}}  # Too low
-
-        with pytest.raises(ConfigError, match="transparency.*must be >= 0.0"):
-            config_manager._validate_config()
-
-        config_manager._config = {"terminal": {"transparency": 1.5}}  # Too high
-        with pytest.raises(ConfigError, match="transparency.*must be <= 1.0"):
-            config_manager._validate_config()
-
-    def test_validation_invalid_sidebar_width(self):
-        """Test validation rejects invalid sidebar width values."""
-        config_manager = ConfigManager()
-        config_manager._config = {"ui": {"sidebar_width": 20}}  # Too small
-
-        with pytest.raises(ConfigError, match="sidebar_width.*must be >= 50"):
-            config_manager._validate_config()
-
-    def test_validation_dpi_scale_auto(self):
-        """Test validation accepts 'auto' for DPI scale."""
-        config_manager = ConfigManager()
-        config_manager._config = {"display": {"dpi_scale": "auto"}}
-
-        # Should not raise any exceptions
-        config_manager._validate_config()
-
-    def test_validation_dpi_scale_numeric(self):
-        """Test validation accepts numeric DPI scale values."""
-        config_manager = ConfigManager()
-        config_manager._config = {"display": {"dpi_scale": 1.5}}
+    @pytest.mark.parametrize(
+        "config",
+        [
+            pytest.param({"display": {"dpi_scale": "auto"}}, id="dpi-scale-auto"),
+            pytest.param({"display": {"dpi_scale": 1.5}}, id="dpi-scale-numeric"),
+        ],
+    )
+    def test_validation_accepts(self, config_manager, config):
+        """Test validation accepts supported values."""
+        config_manager._config = config
 
         # Should not raise any exceptions
         config_manager._validate_config()
@@ -386,14 +366,6 @@ class TestConfigManager:
         assert isinstance(config_manager._config["display"]["dpi_scale"], float)
         assert config_manager._config["display"]["dpi_scale"] == 2.0
 
-    def test_validation_invalid_dpi_scale(self):
-        """Test validation rejects invalid DPI scale values."""
-        config_manager = ConfigManager()
-        config_manager._config = {"display": {"dpi_scale": "invalid"}}
-
-        with pytest.raises(ConfigError, match="dpi_scale.*must be 'auto' or a numeric value"):
-            config_manager._validate_config()
-
     def test_merge_with_defaults(self):
         """Test merging loaded config with defaults."""
         config_manager = ConfigManager()
@@ -406,33 +378,22 @@ class TestConfigManager:
 
         merged = config_manager._merge_with_defaults(loaded_config)
 
-        # Custom values should override defaults
-        assert merged["theme"] == "light"
-        assert merged["terminal"]["scrollback_lines"] == 5000
+        # Custom values override defaults, defaults are preserved, and new sections are added
+        assert merged == _EXPECTED_MERGED_NEW_SECTION
 
-        # Default values should be preserved
-        assert merged["app"]["log_level"] == DEFAULT_CONFIG["app"]["log_level"]
-        assert merged["terminal"]["transparency"] == DEFAULT_CONFIG["terminal"]["transparency"]
-        assert merged["ui"]["sidebar_width"] == DEFAULT_CONFIG["ui"]["sidebar_width"]
-        assert merged["shortcuts"]["terminal_search"] == DEFAULT_CONFIG["shortcuts"]["terminal_search"]
-
-        # New sections should be added
-        assert merged["new_section"]["new_value"] == "test"
-
-    def test_load_config_yaml_error(self):
+    def test_load_config_yaml_error(self, tmp_path):
         """Test handling of invalid YAML in config file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            config_path = Path(temp_dir) / "config.yaml"
+        config_path = tmp_path / "config.yaml"
 
-            # Create invalid YAML
-            with open(config_path, 'w') as f:
-                f.write("invalid: yaml: content: [")
+        # Create invalid YAML
+        with open(config_path, 'w') as f:
+            f.write("invalid: yaml: content: [")
 
-            config_manager = ConfigManager()
-            config_manager._config_path = config_path
+        config_manager = ConfigManager()
+        config_manager._config_path = config_path
 
-            with pytest.raises(ConfigError, match="Invalid YAML"):
-                config_manager.load_config()
+        with pytest.raises(ConfigError, match="Invalid YAML"):
+            config_manager.load_config()
 
     @patch("pathlib.Path.mkdir", side_effect=OSError("Permission denied"))
     def test_load_config_directory_creation_error(self, mock_mkdir):
@@ -475,15 +436,15 @@ class TestConfigManager:
 class TestGlobalConfigManager:
     """Test cases for global config manager functionality."""
 
-    def test_get_config_manager_singleton(self):
-        """Test that get_config_manager returns the same instance."""
-        manager1 = get_config_manager()
-        manager2 = get_config_manager()
+    @pytest.fixture(scope="class")
+    def global_manager(self):
+        """Get the global config manager once per test class."""
+        return get_config_manager()
 
-        assert manager1 is manager2
-        assert isinstance(manager1, ConfigManager)
+    def test_get_config_manager_singleton(self, global_manager):
+        """Test that get_config_manager returns the same instance."""
+        assert get_config_manager() is global_manager
 
-    def test_get_config_manager_instance_type(self):
+    def test_get_config_manager_instance_type(self, global_manager):
         """Test that get_config_manager returns a ConfigManager instance."""
-        manager = get_config_manager()
-        assert isinstance(manager, ConfigManager)
+        assert isinstance(global_manager, ConfigManager)
@@ -3,262 +3,244 @@
 Unit tests for DPI scaling functionality in CSSLoader.
 """
 
-import os
-import unittest
+import logging
 from unittest.mock import MagicMock, patch
 
-from tree_style_terminal.css_loader import CSSLoader
+import pytest
 
+from tree_style_terminal.css_loader import CSSLoader, resolve_configured_dpi_scale
 
-class TestDPIScaling(unittest.TestCase):
-    """Test DPI scaling configuration and CSS generation."""
 
-    def setUp(self):
-        """Set up test environment."""
-        # Clear environment variables
-        if 'TST_DPI' in os.environ:
-            del os.environ['TST_DPI']
-
-    def tearDown(self):
-        """Clean up test environment."""
-        if 'TST_DPI' in os.environ:
-            del os.environ['TST_DPI']
-
-    @patch('tree_style_terminal.css_loader.config_manager')
-    @patch('tree_style_terminal.css_loader.Gtk')
-    def test_config_dpi_scale_numeric(self, mock_gtk, mock_config):
-        """Test that numeric dpi_scale from config is used."""
-        mock_config.load_config.return_value = None
-        mock_config.get.side_effect = lambda key, default: {
-            "theme": "dark",
-            "display.dpi_scale": 1.5
-        }.get(key, default)
-
-        css_loader = CSSLoader()
-        scale = css_loader._calculate_effective_dpi_scale()
-
-        self.assertEqual(scale, 1.5)
-
-    @patch('tree_style_terminal.css_loader.config_manager')
-    @patch('tree_style_terminal.css_loader.Gtk')
-    def test_config_dpi_scale_string_numeric(self, mock_gtk, mock_config):
-        """Test that string numeric dpi_scale from config is converted."""
-        mock_config.load_config.return_value = None
-        mock_config.get.side_effect = lambda key, default: {
-            "theme": "dark",
-            "display.dpi_scale": "2.0"
-        }.get(key, default)
-
-        css_loader = CSSLoader()
-        scale = css_loader._calculate_effective_dpi_scale()
-
-        self.assertEqual(scale, 2.0)
-
-    @patch('tree_style_terminal.css_loader.config_manager')
-    @patch('tree_style_terminal.css_loader.Gtk')
-    def test_cli_override_priority(self, mock_gtk, mock_config):
-        """Test that CLI DPI override has highest priority."""
+@pytest.fixture(autouse=True)
+def gtk_and_config(monkeypatch):
+    """Patch the CSS loader's Gtk and config manager and clear TST_DPI for each test."""
+    monkeypatch.delenv('TST_DPI', raising=False)
+    resolve_configured_dpi_scale.cache_clear()
+    with patch('tree_style_terminal.css_loader.config_manager') as mock_config, \
+            patch('tree_style_terminal.css_loader.Gtk') as mock_gtk:
         mock_config.load_config.return_value = None
-        mock_config.get.side_effect = lambda key, default: {
-            "theme": "dark",
-            "display.dpi_scale": 1.5
-        }.get(key, default)
-
-        # Set environment variable (should be ignored)
-        os.environ['TST_DPI'] = '144'
-
-        css_loader = CSSLoader(override_dpi=192)
-        scale = css_loader._calculate_effective_dpi_scale()
-
-        # 192 DPI / 96 = 2.0 scale
-        self.assertEqual(scale, 2.0)
-
-    @patch('tree_style_terminal.css_loader.config_manager')
-    @patch('tree_style_terminal.css_loader.Gtk')
-    def test_env_override_priority(self, mock_gtk, mock_config):
-        """Test that environment variable overrides config."""
-        mock_config.load_config.return_value = None
-        mock_config.get.side_effect = lambda key, default: {
-            "theme": "dark",
-            "display.dpi_scale": 1.5
-        }.get(key, default)
-
-        os.environ['TST_DPI'] = '144'
-
-        css_loader = CSSLoader()
-        scale = css_loader._calculate_effective_dpi_scale()
-
-        # 144 DPI / 96 = 1.5 scale
-        self.assertEqual(scale, 1.5)
-
-    @patch('tree_style_terminal.css_loader.Gdk')
-    @patch('tree_style_terminal.css_loader.config_manager')
-    @patch('tree_style_terminal.css_loader.Gtk')
-    def test_auto_detection_fallback(self, mock_gtk, mock_config, mock_gdk):
-        """Test auto-detection when config is 'auto'."""
-        mock_config.load_config.return_value = None
-        mock_config.get.side_effect = lambda key, default: {
-            "theme": "dark",
-            "display.dpi_scale": "auto"
-        }.get(key, default)
-
-        # Mock GTK settings
-        mock_settings = MagicMock()
-        mock_settings.get_property.return_value = 96 * 1024  # 96 DPI
-        mock_gtk.Settings.get_default.return_value = mock_settings
-        mock_gdk.Screen.get_default.return_value = None
-
-        css_loader = CSSLoader()
-        scale = css_loader._calculate_effective_dpi_scale()
-
-        self.assertEqual(scale, 1.0)
-
-    @patch('tree_style_terminal.css_loader.config_manager')
-    @patch('tree_style_terminal.css_loader.Gtk')
-    def test_css_generation_with_scaling(self, mock_gtk, mock_config):
-        """Test CSS generation includes scaled font sizes."""
-        mock_config.load_config.return_value = None
-        mock_config.get.side_effect = lambda key, default: {
-            "theme": "dark",
-            "display.dpi_scale": 1.5
-        }.get(key, default)
-
-        # Mock GTK settings
-        mock_settings = MagicMock()
-        mock_settings.get_property.return_value = "Sans 10"  # Base font
-        mock_gtk.Settings.get_default.return_value = mock_settings
-
-        css_loader = CSSLoader()
-        css_content = css_loader._generate_scaled_css(1.5)
-
-        # Should contain scaled font sizes
+        yield mock_gtk, mock_config
+
+
+@pytest.fixture
+def make_settings():
+    """Build mock Gtk settings that report the given Xft DPI and font name."""
+    def _make_settings(xft_dpi, font_name):
+        settings = MagicMock()
+        settings.get_property.side_effect = {
+            "gtk-xft-dpi": xft_dpi * 1024,
+            "gtk-font-name": font_name,
+        }.get
+        return settings
+    return _make_settings
+
+
+@pytest.mark.parametrize(
+    "dpi_scale,expected",
+    [
+        pytest.param(1.5, 1.5, id="numeric"),
+        pytest.param("2.0", 2.0, id="string-numeric"),
+    ],
+)
+def test_config_dpi_scale(gtk_and_config, dpi_scale, expected):
+    """Test that numeric and numeric-string dpi_scale values from config are used."""
+    mock_gtk, mock_config = gtk_and_config
+    mock_config.get.side_effect = lambda key, default: {
+        "theme": "dark",
+        "display.dpi_scale": dpi_scale
+    }.get(key, default)
+
+    css_loader = CSSLoader()
+    scale = css_loader._calculate_effective_dpi_scale()
+
+    assert scale == pytest.approx(expected)
+
+
+def test_cli_override_priority(gtk_and_config, monkeypatch):
+    """Test that CLI DPI override has highest priority."""
+    mock_gtk, mock_config = gtk_and_config
+    mock_config.get.side_effect = lambda key, default: {
+        "theme": "dark",
+        "display.dpi_scale": 1.5
+    }.get(key, default)
+
+    # Set environment variable (should be ignored)
+    monkeypatch.setenv('TST_DPI', '144')
+
+    css_loader = CSSLoader(override_dpi=192)
+    scale = css_loader._calculate_effective_dpi_scale()
+
+    # 192 DPI / 96 = 2.0 scale
+    assert scale == pytest.approx(2.0)
+
+
+def test_env_override_priority(gtk_and_config, monkeypatch):
+    """Test that environment variable overrides config."""
+    mock_gtk, mock_config = gtk_and_config
+    mock_config.get.side_effect = lambda key, default: {
+        "theme": "dark",
+        "display.dpi_scale": 1.5
+    }.get(key, default)
+
+    monkeypatch.setenv('TST_DPI', '144')
+
+    css_loader = CSSLoader()
+    scale = css_loader._calculate_effective_dpi_scale()
+
+    # 144 DPI / 96 = 1.5 scale
+    assert scale == pytest.approx(1.5)
+
+
+@pytest.mark.parametrize(
+    "override_dpi,env_dpi,config_dpi_scale,expected",
+    [
+        pytest.param(192, "144", 1.25, (2.0, ()), id="override-wins"),
+        pytest.param(None, "144", 1.25, (1.5, ()), id="env-over-config"),
+        pytest.param(None, None, 1.25, (1.25, ()), id="config"),
+        pytest.param(None, None, "auto", (None, ()), id="auto"),
+        pytest.param(None, "bad", 1.25, (1.25, ("TST_DPI",)), id="invalid-env-falls-back"),
+        pytest.param(None, None, "bad", (None, ("dpi_scale",)), id="invalid-config-is-auto"),
+    ],
+)
+def test_resolve_configured_dpi_scale_precedence(override_dpi, env_dpi, config_dpi_scale, expected):
+    """Test the resolver uses override, then env, then config, then auto."""
+    assert resolve_configured_dpi_scale(override_dpi, env_dpi, config_dpi_scale) == expected
+
+
+def test_invalid_dpi_warning_repeats_for_cached_values(gtk_and_config, monkeypatch, caplog):
+    """Test an invalid TST_DPI is reported on every calculation, not only the first."""
+    mock_gtk, mock_config = gtk_and_config
+    mock_config.get.side_effect = lambda key, default: {
+        "theme": "dark",
+        "display.dpi_scale": 1.5
+    }.get(key, default)
+    monkeypatch.setenv('TST_DPI', 'bad')
+
+    css_loader = CSSLoader()
+    with caplog.at_level(logging.WARNING):
+        assert css_loader._calculate_effective_dpi_scale() == pytest.approx(1.5)
+        assert css_loader._calculate_effective_dpi_scale() == pytest.approx(1.5)
+
+    assert caplog.text.count("Invalid TST_DPI value") == 2
+
+
+@patch('tree_style_terminal.css_loader.Gdk')
+def test_auto_detection_fallback(mock_gdk, gtk_and_config):
+    """Test auto-detection when config is 'auto'."""
+    mock_gtk, mock_config = gtk_and_config
+    mock_config.get.side_effect = lambda key, default: {
+        "theme": "dark",
+        "display.dpi_scale": "auto"
+    }.get(key, default)
+
+    # Mock GTK settings
+    mock_settings = MagicMock()
+    mock_settings.get_property.return_value = 96 * 1024  # 96 DPI
+    mock_gtk.Settings.get_default.return_value = mock_settings
+    mock_gdk.Screen.get_default.return_value = None
+
+    css_loader = CSSLoader()
+    scale = css_loader._calculate_effective_dpi_scale()
+
+    assert scale == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    "font_name,scale,expect_ui,expect_term",
+    [
         # Base 10 * 1.5 = 15px for UI, (10+1) * 1.5 = 16px for terminal (rounded)
-        self.assertIn("font-size: 15px", css_content)
-        self.assertIn("font-size: 16px", css_content)
-
-    @patch('tree_style_terminal.css_loader.config_manager')
-    @patch('tree_style_terminal.css_loader.Gtk')
-    def test_minimum_font_sizes_enforced(self, mock_gtk, mock_config):
-        """Test that minimum font sizes are enforced for readability."""
-        mock_config.load_config.return_value = None
-        mock_config.get.side_effect = lambda key, default: {
-            "theme": "dark",
-            "display.dpi_scale": 0.8  # Very small scale
-        }.get(key, default)
-
-        # Mock GTK settings with small font
-        mock_settings = MagicMock()
-        mock_settings.get_property.return_value = "Sans 8"
-        mock_gtk.Settings.get_default.return_value = mock_settings
-
-        css_loader = CSSLoader()
-        css_content = css_loader._generate_scaled_css(0.8)
-
-        # Should enforce minimum sizes (10px UI, 11px terminal)
-        self.assertIn("font-size: 10px", css_content)
-        self.assertIn("font-size: 11px", css_content)
-
-    @patch('tree_style_terminal.css_loader.config_manager')
-    @patch('tree_style_terminal.css_loader.Gtk')
-    def test_high_dpi_minimum_sizes(self, mock_gtk, mock_config):
-        """Test higher minimum font sizes for high-DPI displays."""
-        mock_config.load_config.return_value = None
-        mock_config.get.side_effect = lambda key, default: {
-            "theme": "dark",
-            "display.dpi_scale": 2.0  # High DPI
-        }.get(key, default)
-
-        # Mock GTK settings with small font
-        mock_settings = MagicMock()
-        mock_settings.get_property.return_value = "Sans 6"  # Very small
-        mock_gtk.Settings.get_default.return_value = mock_settings
-
-        css_loader = CSSLoader()
-        css_content = css_loader._generate_scaled_css(2.0)
-
-        # Should enforce high-DPI minimums (14px UI, 15px terminal)
-        self.assertIn("font-size: 14px", css_content)
-        self.assertIn("font-size: 15px", css_content)
-
-    @patch('tree_style_terminal.css_loader.config_manager')
-    @patch('tree_style_terminal.css_loader.Gtk')
-    def test_improved_auto_detection_comfort_scaling(self, mock_gtk, mock_config):
-        """Test improved auto-detection with comfort scaling for high-DPI displays."""
-        mock_config.load_config.return_value = None
-        mock_config.get.side_effect = lambda key, default: {
-            "theme": "dark",
-            "display.dpi_scale": "auto"
-        }.get(key, default)
-
-        # Mock GTK settings with conservative system DPI
-        mock_settings = MagicMock()
-        mock_settings.get_property.side_effect = lambda prop: {
-            "gtk-xft-dpi": 142 * 1024,  # Conservative 142 DPI
-            "gtk-font-name": "Sans 10"
-        }.get(prop)
-
-        # Mock screen with high monitor DPI - ensure values are integers, not mocks
-        mock_screen = MagicMock()
-        mock_screen.get_width_mm.return_value = 289
-        mock_screen.get_height_mm.return_value = 186
-        mock_screen.get_width.return_value = 2880
-        mock_screen.get_height.return_value = 1800
-
-        # Verify mock values work correctly
-        width_mm = mock_screen.get_width_mm()
-        height_mm = mock_screen.get_height_mm()
-        width_px = mock_screen.get_width()
-        height_px = mock_screen.get_height()
-
-        # Manually verify the calculation would work
-        diagonal_mm = (width_mm ** 2 + height_mm ** 2) ** 0.5
-        diagonal_px = (width_px ** 2 + height_px ** 2) ** 0.5
-        expected_monitor_dpi = diagonal_px / (diagonal_mm / 25.4)
-        assert expected_monitor_dpi > 240
-
-        mock_gtk.Settings.get_default.return_value = mock_settings
-        mock_gtk.Screen.get_default.return_value = mock_screen
-
-        css_loader = CSSLoader()
-        scale = css_loader._detect_system_dpi_scale()
-
-        # With expected monitor DPI ~249.5, should get ~2.6x scaling due to comfort scaling
-        # But test the actual logic: if monitor DPI calculation fails, it should still
-        # apply comfort scaling to the system DPI (142), which at minimum should be 1.25x
-        self.assertGreaterEqual(scale, 1.25)
-
-    @patch('tree_style_terminal.css_loader.config_manager')
-    @patch('tree_style_terminal.css_loader.Gtk')
-    def test_medium_dpi_comfort_scaling(self, mock_gtk, mock_config):
-        """Test comfort scaling ensures minimum 1.25x for medium-DPI displays."""
-        mock_config.load_config.return_value = None
-        mock_config.get.side_effect = lambda key, default: {
-            "theme": "dark",
-            "display.dpi_scale": "auto"
-        }.get(key, default)
-
-        # Mock settings with medium DPI (120)
-        mock_settings = MagicMock()
-        mock_settings.get_property.side_effect = lambda prop: {
-            "gtk-xft-dpi": 120 * 1024,
-            "gtk-font-name": "Sans 10"
-        }.get(prop)
-
-        mock_screen = MagicMock()
-        mock_screen.get_width_mm.return_value = 400
-        mock_screen.get_height_mm.return_value = 300
-        mock_screen.get_width.return_value = 1920
-        mock_screen.get_height.return_value = 1440
-
-        mock_gtk.Settings.get_default.return_value = mock_settings
-        mock_gtk.Screen.get_default.return_value = mock_screen
-
-        css_loader = CSSLoader()
-        scale = css_loader._detect_system_dpi_scale()
-
-        # Should ensure at least 1.25x scaling for medium-DPI displays
-        self.assertGreaterEqual(scale, 1.25)
-
+        pytest.param("Sans 10", 1.5, 15, 16, id="scaled"),
+        # Minimum sizes are enforced for readability
+        pytest.param("Sans 8", 0.8, 10, 11, id="minimum"),
+        # Higher minimums apply on high-DPI displays
+        pytest.param("Sans 6", 2.0, 14, 15, id="high-dpi-minimum"),
+    ],
+)
+def test_scaled_css_font_sizes(gtk_and_config, font_name, scale, expect_ui, expect_term):
+    """Test CSS generation scales font sizes and enforces minimums."""
+    mock_gtk, mock_config = gtk_and_config
+    mock_config.get.side_effect = lambda key, default: {
+        "theme": "dark",
+        "display.dpi_scale": scale
+    }.get(key, default)
+
+    # Mock GTK settings
+    mock_settings = MagicMock()
+    mock_settings.get_property.return_value = font_name
+    mock_gtk.Settings.get_default.return_value = mock_settings
+
+    css_loader = CSSLoader()
+    css_content = css_loader._generate_scaled_css(scale)
+
+    assert f"font-size: {expect_ui}px" in css_content
+    assert f"font-size: {expect_term}px" in css_content
+
+
+def test_improved_auto_detection_comfort_scaling(gtk_and_config, make_settings):
+    """Test improved auto-detection with comfort scaling for high-DPI displays."""
+    mock_gtk, mock_config = gtk_and_config
+    mock_config.get.side_effect = lambda key, default: {
+        "theme": "dark",
+        "display.dpi_scale": "auto"
+    }.get(key, default)
+
+    # Mock GTK settings with conservative system DPI
+    mock_settings = make_settings(142, "Sans 10")
+
+    # Mock screen with high monitor DPI - ensure values are integers, not mocks
+    mock_screen = MagicMock()
+    mock_screen.get_width_mm.return_value = 289
+    mock_screen.get_height_mm.return_value = 186
+    mock_screen.get_width.return_value = 2880
+    mock_screen.get_height.return_value = 1800
+
+    # Verify mock values work correctly
+    width_mm = mock_screen.get_width_mm()
+    height_mm = mock_screen.get_height_mm()
+    width_px = mock_screen.get_width()
+    height_px = mock_screen.get_height()
+
+    # Manually verify the calculation would work
+    diagonal_mm = (width_mm ** 2 + height_mm ** 2) ** 0.5
+    diagonal_px = (width_px ** 2 + height_px ** 2) ** 0.5
+    expected_monitor_dpi = diagonal_px / (diagonal_mm / 25.4)
+    assert expected_monitor_dpi > 240
+
+    mock_gtk.Settings.get_default.return_value = mock_settings
+    mock_gtk.Screen.get_default.return_value = mock_screen
+
+    css_loader = CSSLoader()
+    scale = css_loader._detect_system_dpi_scale()
+
+    # With expected monitor DPI ~249.5, should get ~2.6x scaling due to comfort scaling
+    # But test the actual logic: if monitor DPI calculation fails, it should still
+    # apply comfort scaling to the system DPI (142), which at minimum should be 1.25x
+    assert scale >= 1.25
+
+
+def test_medium_dpi_comfort_scaling(gtk_and_config, make_settings):
+    """Test comfort scaling ensures minimum 1.25x for medium-DPI displays."""
+    mock_gtk, mock_config = gtk_and_config
+    mock_config.get.side_effect = lambda key, default: {
+        "theme": "dark",
+        "display.dpi_scale": "auto"
+    }.get(key, default)
+
+    # Mock settings with medium DPI (120)
+    mock_settings = make_settings(120, "Sans 10")
+
+    mock_screen = MagicMock()
+    mock_screen.get_width_mm.return_value = 400
+    mock_screen.get_height_mm.return_value = 300
+    mock_screen.get_width.return_value = 1920
+    mock_screen.get_height.return_value = 1440
+
+    mock_gtk.Settings.get_default.return_value = mock_settings
+    mock_gtk.Screen.get_default.return_value = mock_screen
+
+    css_loader = CSSLoader()
+    scale = css_loader._detect_system_dpi_scale()
+
+    # Should ensure at least 1.25x scaling for medium-DPI displays
+    assert scale >= 1.25
 
-if __name__ == '__main__':
-    unittest.main()
@@ -5,9 +5,19 @@ Tests basic instantiation, title auto-generation, hash/equality behavior,
 and edge cases for cwd handling.
 """
 
+from dataclasses import replace
+
+import pytest
+
 from tree_style_terminal.models.session import TerminalSession
 
 
+@pytest.fixture(scope="module")
+def canonical_session():
+    """Shared session for tests that only read it; mutating tests build their own."""
+    return TerminalSession(pid=123, pty_fd=456, cwd="/home/user/projects")
+
+
 class TestTerminalSession:
     """Test cases for TerminalSession dataclass."""
 
@@ -27,17 +37,11 @@ class TestTerminalSession:
         assert session.custom_title == "My Terminal"
         assert session.children == []
 
-    def test_session_creation_without_title(self):
+    def test_session_creation_without_title(self, canonical_session):
         """Test creating a session without title - should auto-generate from cwd."""
-        session = TerminalSession(
-            pid=123,
-            pty_fd=456,
-            cwd="/home/user/projects"
-        )
-
-        assert session.title == "user/projects"
-        assert session.auto_title == "user/projects"
-        assert session.custom_title is None
+        assert canonical_session.title == "user/projects"
+        assert canonical_session.auto_title == "user/projects"
+        assert canonical_session.custom_title is None
 
     def test_custom_title_ignores_automatic_updates_until_cleared(self):
         """Test custom titles remain visible until the user clears them."""
@@ -65,31 +69,11 @@ class TestTerminalSession:
         assert session.custom_title is None
         assert session.title == "user/projects"
 
-    def test_session_title_auto_generation_root_dir(self):
-        """Test title generation for root directory."""
-        session = TerminalSession(
-            pid=123,
-            pty_fd=456,
-            cwd="/"
-        )
-
-        assert session.title == "/"
-
-    def test_session_title_auto_generation_empty_cwd(self):
-        """Test title generation for empty cwd."""
-        session = TerminalSession(
-            pid=123,
-            pty_fd=456,
-            cwd=""
-        )
-
-        assert session.title == ""
-
-    def test_session_hash_and_equality(self):
+    def test_session_hash_and_equality(self, canonical_session):
         """Test that sessions with same pid/pty_fd are equal and have same hash."""
-        session1 = TerminalSession(pid=123, pty_fd=456, cwd="/path1")
-        session2 = TerminalSession(pid=123, pty_fd=456, cwd="/path2")  # Different cwd
-        session3 = TerminalSession(pid=124, pty_fd=456, cwd="/path1")  # Different pid
+        session1 = canonical_session
+        session2 = replace(canonical_session, cwd="/path2")  # Different cwd
+        session3 = replace(canonical_session, pid=124)  # Different pid
 
         # Same pid/pty_fd should be equal regardless of other fields
         assert session1 == session2
@@ -99,13 +83,11 @@ class TestTerminalSession:
         assert session1 != session3
         assert hash(session1) != hash(session3)
 
-    def test_session_equality_with_non_session(self):
+    def test_session_equality_with_non_session(self, canonical_session):
         """Test equality comparison with non-TerminalSession objects."""
-        session = TerminalSession(pid=123, pty_fd=456, cwd="/home")
-
-        assert session != "not a session"
-        assert session != 123
-        assert session.__eq__(None) is False
+        assert canonical_session != "not a session"
+        assert canonical_session != 123
+        assert canonical_session.__eq__(None) is False
 
     def test_session_children_default_factory(self):
         """Test that each session gets its own children list."""
@@ -120,16 +102,18 @@ class TestTerminalSession:
         assert len(session1.children) == 1
         assert len(session2.children) == 0
 
-    def test_session_cwd_edge_cases(self):
-        """Test various edge cases for cwd and title generation."""
-        # Trailing slash - gets normalized to show last two components
-        session = TerminalSession(pid=123, pty_fd=456, cwd="/home/user/")
-        assert session.title == "home/user"
-
-        # No leading slash
-        session = TerminalSession(pid=123, pty_fd=456, cwd="relative/path")
-        assert session.title == "relative/path"
-
-        # Single directory
-        session = TerminalSession(pid=123, pty_fd=456, cwd="single")
-        assert session.title == "single"
+    @pytest.mark.parametrize(
+        "cwd,expected",
+        [
+            # Trailing slash - gets normalized to show last two components
+            pytest.param("/home/user/", "home/user", id="trailing-slash"),
+            pytest.param("relative/path", "relative/path", id="no-leading-slash"),
+            pytest.param("single", "single", id="single-directory"),
+            pytest.param("/", "/", id="root"),
+            pytest.param("", "", id="empty"),
+        ],
+    )
+    def test_session_title_auto_generation(self, cwd, expected):
+        """Test title generation for cwd edge cases."""
+        session = TerminalSession(pid=123, pty_fd=456, cwd=cwd)
+        assert session.title == expected
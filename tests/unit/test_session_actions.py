@@ -6,33 +6,67 @@ verifying that they create proper parent-child relationships and
 tree structures as specified in Milestone 5 point 4.
 """
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
-import gi
 import pytest
 
-gi.require_version('Gtk', '3.0')
-gi.require_version('Gio', '2.0')
-
+from tree_style_terminal.config import config_manager
 from tree_style_terminal.config.workspace_profile import WorkspaceNode
-from tree_style_terminal.controllers.session_manager import SessionManager
+from tree_style_terminal.controllers import session_manager as session_manager_module
 from tree_style_terminal.controllers.shortcuts import ShortcutController
 from tree_style_terminal.models.session import TerminalSession
-from tree_style_terminal.models.tree import SessionTree
+
+
+class _StubTerminal:
+    """VteTerminal stand-in whose shell always spawns."""
+
+    def __init__(self):
+        self.terminal = SimpleNamespace(connect=lambda *args: 0)
+
+    def apply_theme(self, theme_name):
+        pass
+
+    def spawn_shell(self, **kwargs):
+        return True
+
+    def get_current_directory(self):
+        return None
+
+    def close(self):
+        pass
+
+
+# Complex tree blueprint as (title, parent title, pid, cwd), parents first:
+#   root1
+#   ├── child1
+#   │   └── grandchild1
+#   └── child2
+#   root2
+_COMPLEX_TREE = (
+    ("root1", None, 100, "/root1"),
+    ("root2", None, 101, "/root2"),
+    ("child1", "root1", 102, "/root1/child1"),
+    ("child2", "root1", 103, "/root1/child2"),
+    ("grandchild1", "child1", 104, "/root1/child1/grand"),
+)
+
+
+def _assert_parent_of(session_tree, child, parent):
+    """Assert that child exists and is linked under parent in both directions."""
+    assert child is not None
+    assert session_tree.get_parent(child) == parent
+    assert child in parent.children
+    assert child in session_tree.get_children(parent)
 
 
 class TestSessionActions:
     """Test cases for session creation actions."""
 
-    @pytest.fixture
-    def session_tree(self):
-        """Create a test session tree."""
-        return SessionTree()
-
-    @pytest.fixture
-    def session_manager(self, session_tree):
-        """Create a test session manager."""
-        return SessionManager(session_tree)
+    @pytest.fixture(autouse=True)
+    def _stub_vte_terminal(self, monkeypatch):
+        """Build sessions on stub terminals; tests that inspect spawning patch their own."""
+        monkeypatch.setattr(session_manager_module, 'VteTerminal', _StubTerminal)
 
     @pytest.fixture
     def shortcut_controller(self, session_manager):
@@ -44,6 +78,16 @@ class TestSessionActions:
         """Create a mock session for testing."""
         return TerminalSession(pid=123, pty_fd=456, cwd="/test", title="test")
 
+    @pytest.fixture
+    def complex_tree(self, session_tree):
+        """Build the complex tree blueprint into the test's session tree, keyed by title."""
+        sessions = {}
+        for title, parent_title, pid, cwd in _COMPLEX_TREE:
+            session = TerminalSession(pid=pid, pty_fd=pid + 100, cwd=cwd, title=title)
+            session_tree.add_node(session, parent=sessions.get(parent_title))
+            sessions[title] = session
+        return sessions
+
     @pytest.fixture
     def mock_child_session(self):
         """Create a mock child session for testing."""
@@ -56,7 +100,7 @@ class TestSessionActions:
         session_manager.current_session = mock_session
 
         # Mock new_child to return a child session
-        with patch.object(session_manager, 'new_child', return_value=mock_child_session) as mock_new_child:
+        with patch.object(session_manager, 'new_child', autospec=True, return_value=mock_child_session) as mock_new_child:
             # Execute new_child action
             action = shortcut_controller.get_action("new_child")
             action.activate(None)
@@ -70,21 +114,11 @@ class TestSessionActions:
         session_tree.add_node(mock_session)
         session_manager.current_session = mock_session
 
-        # Mock VTE terminal creation to avoid real terminal creation
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
-            mock_terminal = Mock()
-            mock_terminal.spawn_shell.return_value = True
-            MockVteTerminal.return_value = mock_terminal
-            # Create child session
-            child_session = session_manager.new_child()
-
-            # Verify parent-child relationship
-            assert child_session is not None
-            assert session_tree.get_parent(child_session) == mock_session
-            assert child_session in mock_session.children
+        # Create child session
+        child_session = session_manager.new_child()
 
-            # Verify tree structure
-            assert child_session in session_tree.get_children(mock_session)
+        # Verify parent-child relationship and tree structure
+        _assert_parent_of(session_tree, child_session, mock_session)
 
     def test_new_child_multi_level_nesting(self, session_tree, session_manager):
         """Test that new_child works with multi-level nesting."""
@@ -99,20 +133,13 @@ class TestSessionActions:
         # Select the child session
         session_manager.current_session = child_session
 
-        # Mock VTE terminal creation
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
-            mock_terminal = Mock()
-            mock_terminal.spawn_shell.return_value = True
-            MockVteTerminal.return_value = mock_terminal
-            # Create grandchild
-            grandchild_session = session_manager.new_child()
+        # Create grandchild
+        grandchild_session = session_manager.new_child()
 
-            # Verify three-level structure
-            assert grandchild_session is not None
-            assert session_tree.get_parent(grandchild_session) == child_session
-            assert grandchild_session in child_session.children
-            assert root_session in session_tree.get_roots()
-            assert len(session_tree.get_children(child_session)) == 1
+        # Verify three-level structure
+        _assert_parent_of(session_tree, grandchild_session, child_session)
+        assert root_session in session_tree.get_roots()
+        assert len(session_tree.get_children(child_session)) == 1
 
     def test_new_child_session_properties_inheritance(self, session_tree, session_manager, mock_session):
         """Test that new child inherits appropriate properties from parent."""
@@ -120,18 +147,13 @@ class TestSessionActions:
         session_tree.add_node(mock_session)
         session_manager.current_session = mock_session
 
-        # Mock VTE terminal creation
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
-            mock_terminal = Mock()
-            mock_terminal.spawn_shell.return_value = True
-            MockVteTerminal.return_value = mock_terminal
-            # Create child session
-            child_session = session_manager.new_child()
+        # Create child session
+        child_session = session_manager.new_child()
 
-            # Verify child session properties
-            assert child_session is not None
-            assert child_session.cwd == mock_session.cwd  # Should inherit cwd
-            assert session_tree.get_parent(child_session) == mock_session
+        # Verify child session properties
+        assert child_session is not None
+        assert child_session.cwd == mock_session.cwd  # Should inherit cwd
+        assert session_tree.get_parent(child_session) == mock_session
 
     def test_new_session_with_command_runs_through_user_shell(
         self,
@@ -142,7 +164,7 @@ class TestSessionActions:
         """Test that configured commands run through the user's shell."""
         monkeypatch.setenv("SHELL", "/bin/zsh")
 
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
+        with patch.object(session_manager_module, 'VteTerminal') as MockVteTerminal:
             mock_terminal = Mock()
             mock_terminal.spawn_shell.return_value = True
             MockVteTerminal.return_value = mock_terminal
@@ -179,7 +201,7 @@ class TestSessionActions:
             ],
         )
 
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
+        with patch.object(session_manager_module, 'VteTerminal') as MockVteTerminal:
             terminals = [Mock(), Mock(), Mock()]
             for terminal in terminals:
                 terminal.spawn_shell.return_value = True
@@ -222,14 +244,7 @@ class TestSessionActions:
             )
         )
 
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
-            terminals = [Mock(), Mock(), Mock()]
-            for terminal in terminals:
-                terminal.spawn_shell.return_value = True
-                terminal.terminal = Mock()
-            MockVteTerminal.side_effect = terminals
-
-            created_roots = session_manager.create_workspace_trees(roots)
+        created_roots = session_manager.create_workspace_trees(roots)
 
         assert [root.title for root in created_roots] == ["first", "second"]
         assert session_manager.current_session is not None
@@ -242,17 +257,12 @@ class TestSessionActions:
         session_tree.add_node(mock_session)
         session_manager.current_session = mock_session
 
-        # Mock VTE terminal creation
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
-            mock_terminal = Mock()
-            mock_terminal.spawn_shell.return_value = True
-            MockVteTerminal.return_value = mock_terminal
-            # Create child session
-            child_session = session_manager.new_child()
+        # Create child session
+        child_session = session_manager.new_child()
 
-            # Verify child was created and added to tree
-            assert child_session is not None
-            assert child_session in session_tree.get_children(mock_session)
+        # Verify child was created and added to tree
+        assert child_session is not None
+        assert child_session in session_tree.get_children(mock_session)
 
     def test_new_sibling_creates_sibling_node(self, session_tree, session_manager, mock_session):
         """Test that new_sibling creates sibling at same level."""
@@ -262,20 +272,13 @@ class TestSessionActions:
         session_tree.add_node(mock_session, parent=parent_session)
         session_manager.current_session = mock_session
 
-        # Mock VTE terminal creation
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
-            mock_terminal = Mock()
-            mock_terminal.spawn_shell.return_value = True
-            MockVteTerminal.return_value = mock_terminal
-            # Create sibling session
-            sibling_session = session_manager.new_sibling()
+        # Create sibling session
+        sibling_session = session_manager.new_sibling()
 
-            # Verify sibling relationship
-            assert sibling_session is not None
-            assert session_tree.get_parent(sibling_session) == parent_session
-            assert sibling_session in parent_session.children
-            assert mock_session in parent_session.children
-            assert len(parent_session.children) == 2
+        # Verify sibling relationship
+        _assert_parent_of(session_tree, sibling_session, parent_session)
+        assert mock_session in parent_session.children
+        assert len(parent_session.children) == 2
 
     def test_new_sibling_from_root_creates_new_root(self, session_tree, session_manager, mock_session):
         """Test that new_sibling from root creates another root node."""
@@ -283,28 +286,23 @@ class TestSessionActions:
         session_tree.add_node(mock_session)
         session_manager.current_session = mock_session
 
-        # Mock VTE terminal creation
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
-            mock_terminal = Mock()
-            mock_terminal.spawn_shell.return_value = True
-            MockVteTerminal.return_value = mock_terminal
-            # Create sibling (should be another root)
-            sibling_session = session_manager.new_sibling()
+        # Create sibling (should be another root)
+        sibling_session = session_manager.new_sibling()
 
-            # Verify both are root nodes
-            assert sibling_session is not None
-            assert session_tree.get_parent(sibling_session) is None
-            assert session_tree.get_parent(mock_session) is None
-            assert mock_session in session_tree.get_roots()
-            assert sibling_session in session_tree.get_roots()
-            assert len(session_tree.get_roots()) == 2
+        # Verify both are root nodes
+        assert sibling_session is not None
+        assert session_tree.get_parent(sibling_session) is None
+        assert session_tree.get_parent(mock_session) is None
+        assert mock_session in session_tree.get_roots()
+        assert sibling_session in session_tree.get_roots()
+        assert len(session_tree.get_roots()) == 2
 
     def test_new_child_no_current_session(self, shortcut_controller, session_manager):
         """Test new_child action when no session is selected."""
         # No current session
         session_manager.current_session = None
 
-        with patch.object(session_manager, 'new_child', return_value=None) as mock_new_child:
+        with patch.object(session_manager, 'new_child', autospec=True) as mock_new_child:
             # Execute new_child action
             action = shortcut_controller.get_action("new_child")
             action.activate(None)
@@ -317,7 +315,7 @@ class TestSessionActions:
         # No current session
         session_manager.current_session = None
 
-        with patch.object(session_manager, 'new_sibling', return_value=None) as mock_new_sibling:
+        with patch.object(session_manager, 'new_sibling', autospec=True) as mock_new_sibling:
             # Execute new_sibling action
             action = shortcut_controller.get_action("new_sibling")
             action.activate(None)
@@ -325,16 +323,20 @@ class TestSessionActions:
             # Should still call new_sibling (manager handles the logic)
             mock_new_sibling.assert_called_once()
 
-    def test_action_error_handling(self, shortcut_controller, session_manager):
+    def test_action_error_handling(self, shortcut_controller, monkeypatch):
         """Test that actions handle errors gracefully."""
-        # Mock VTE terminal creation to raise exceptions
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal', side_effect=Exception("VTE creation failed")):
-            # Should not raise exception
-            action = shortcut_controller.get_action("new_child")
-            action.activate(None)
+        def failing_terminal():
+            raise Exception("VTE creation failed")
 
-            action = shortcut_controller.get_action("new_sibling")
-            action.activate(None)
+        # Make VTE terminal creation raise
+        monkeypatch.setattr(session_manager_module, 'VteTerminal', failing_terminal)
+
+        # Should not raise exception
+        action = shortcut_controller.get_action("new_child")
+        action.activate(None)
+
+        action = shortcut_controller.get_action("new_sibling")
+        action.activate(None)
 
     def test_rename_session_notifies_and_locks_title(self, session_manager, mock_session):
         """Test renaming a session stores a custom title and notifies listeners."""
@@ -390,7 +392,7 @@ class TestSessionActions:
         session_manager._session_terminals[parent_session] = mock_parent_terminal
 
         # Mock VTE terminal creation for new child
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
+        with patch.object(session_manager_module, 'VteTerminal') as MockVteTerminal:
             mock_terminal = Mock()
             mock_terminal.spawn_shell.return_value = True
             MockVteTerminal.return_value = mock_terminal
@@ -421,7 +423,7 @@ class TestSessionActions:
         session_manager._session_terminals[parent_session] = mock_parent_terminal
 
         # Mock VTE terminal creation for new child
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
+        with patch.object(session_manager_module, 'VteTerminal') as MockVteTerminal:
             mock_terminal = Mock()
             mock_terminal.spawn_shell.return_value = True
             MockVteTerminal.return_value = mock_terminal
@@ -441,7 +443,7 @@ class TestSessionActions:
         parent_cwd = "/work/project"
         sibling_cwd = "/home/user"
 
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
+        with patch.object(session_manager_module, 'VteTerminal') as MockVteTerminal:
             root_terminal = Mock()
             root_terminal.spawn_shell.return_value = True
             root_terminal.terminal = Mock()
@@ -487,40 +489,67 @@ class TestSessionActions:
             child_terminal.spawn_shell.assert_called_once_with(cwd=parent_cwd)
 
 
-    def test_complex_tree_structure_preservation(self, session_tree, session_manager):
+    def test_complex_tree_structure_preservation(self, session_tree, session_manager, complex_tree):
         """Test that complex tree structures are preserved during session creation."""
-        # Create a complex tree:
-        #   root1
-        #   ├── child1
-        #   │   └── grandchild1
-        #   └── child2
-        #   root2
-
-        root1 = TerminalSession(pid=100, pty_fd=200, cwd="/root1", title="root1")
-        root2 = TerminalSession(pid=101, pty_fd=201, cwd="/root2", title="root2")
-        child1 = TerminalSession(pid=102, pty_fd=202, cwd="/root1/child1", title="child1")
-        child2 = TerminalSession(pid=103, pty_fd=203, cwd="/root1/child2", title="child2")
-        grandchild1 = TerminalSession(pid=104, pty_fd=204, cwd="/root1/child1/grand", title="grandchild1")
-
-        # Build tree structure
-        session_tree.add_node(root1)
-        session_tree.add_node(root2)
-        session_tree.add_node(child1, parent=root1)
-        session_tree.add_node(child2, parent=root1)
-        session_tree.add_node(grandchild1, parent=child1)
+        root1 = complex_tree["root1"]
+        child1 = complex_tree["child1"]
+        grandchild1 = complex_tree["grandchild1"]
 
         # Select child1 and create a new child
         session_manager.current_session = child1
 
-        with patch('tree_style_terminal.controllers.session_manager.VteTerminal') as MockVteTerminal:
-            mock_terminal = Mock()
-            mock_terminal.spawn_shell.return_value = True
-            MockVteTerminal.return_value = mock_terminal
-            new_grandchild = session_manager.new_child()
-
-            # Verify tree structure is preserved
-            assert len(session_tree.get_roots()) == 2
-            assert len(session_tree.get_children(root1)) == 2
-            assert len(session_tree.get_children(child1)) == 2  # grandchild1 + new_grandchild
-            assert session_tree.get_parent(new_grandchild) == child1
-            assert session_tree.get_parent(grandchild1) == child1
+        new_grandchild = session_manager.new_child()
+
+        # Verify tree structure is preserved
+        assert len(session_tree.get_roots()) == 2
+        assert len(session_tree.get_children(root1)) == 2
+        assert len(session_tree.get_children(child1)) == 2  # grandchild1 + new_grandchild
+        _assert_parent_of(session_tree, new_grandchild, child1)
+        _assert_parent_of(session_tree, grandchild1, child1)
+
+    def test_new_session_uses_prebuilt_spare_terminal(self, session_manager):
+        """Test new sessions take the spare terminal widget before building one."""
+        spare_terminal = Mock()
+        spare_terminal.spawn_shell.return_value = True
+        session_manager._spare_terminal = spare_terminal
+        session_manager._spare_config_generation = config_manager.generation
+
+        with patch.object(session_manager_module, 'VteTerminal') as MockVteTerminal, \
+                patch.object(session_manager_module.GLib, 'idle_add', return_value=1) as mock_idle_add:
+            session = session_manager.new_session(cwd="/test")
+
+            assert session is not None
+            assert session_manager.get_terminal_widget(session) is spare_terminal
+            MockVteTerminal.assert_not_called()
+            assert session_manager._spare_terminal is None
+            mock_idle_add.assert_called_once()
+
+        # The patched idle source was never registered with GLib
+        session_manager._spare_terminal_source_id = 0
+
+    def test_new_session_discards_spare_terminal_from_older_config(self, session_manager):
+        """Test a spare built before a config reload is destroyed instead of used."""
+        stale_terminal = Mock()
+        session_manager._spare_terminal = stale_terminal
+        session_manager._spare_config_generation = config_manager.generation - 1
+
+        session = session_manager.new_session(cwd="/test")
+
+        assert session is not None
+        assert session_manager.get_terminal_widget(session) is not stale_terminal
+        stale_terminal.destroy.assert_called_once()
+        stale_terminal.spawn_shell.assert_not_called()
+
+    def test_shutdown_cancels_spare_build_and_destroys_spare(self, session_manager):
+        """Test shutdown removes the pending idle build and destroys the spare."""
+        spare_terminal = Mock()
+        session_manager._spare_terminal = spare_terminal
+        session_manager._spare_terminal_source_id = 7
+
+        with patch.object(session_manager_module.GLib, 'source_remove') as mock_source_remove:
+            session_manager.shutdown()
+
+        mock_source_remove.assert_called_once_with(7)
+        spare_terminal.destroy.assert_called_once()
+        assert session_manager._spare_terminal is None
+        assert session_manager._spare_terminal_source_id == 0
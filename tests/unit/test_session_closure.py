@@ -8,173 +8,152 @@ in Milestone 5 point 4.
 
 from unittest.mock import Mock, patch
 
-import gi
 import pytest
 
-gi.require_version('Gtk', '3.0')
-gi.require_version('Gio', '2.0')
-
-from tree_style_terminal.controllers.session_manager import SessionManager
 from tree_style_terminal.controllers.shortcuts import ShortcutController
 from tree_style_terminal.models.session import TerminalSession
-from tree_style_terminal.models.tree import SessionTree
-
-
-class TestSessionClosure:
-    """Test cases for session closure and adoption algorithm."""
-
-    @pytest.fixture
-    def session_tree(self):
-        """Create a test session tree."""
-        return SessionTree()
-
-    @pytest.fixture
-    def session_manager(self, session_tree):
-        """Create a test session manager."""
-        return SessionManager(session_tree)
-
-    @pytest.fixture
-    def shortcut_controller(self, session_manager):
-        """Create a test shortcut controller."""
-        return ShortcutController(session_manager)
-
-    def test_close_leaf_node_no_children(self, session_tree, session_manager):
-        """Test closing a session with no children - clean removal."""
-        # Setup: Create parent with child (leaf)
-        parent = TerminalSession(pid=100, pty_fd=200, cwd="/parent", title="parent")
-        leaf = TerminalSession(pid=101, pty_fd=201, cwd="/parent/leaf", title="leaf")
-
-        session_tree.add_node(parent)
-        session_tree.add_node(leaf, parent=parent)
-        session_manager.current_session = leaf
 
-        # Mock VTE cleanup and terminal widgets
-        session_manager._session_terminals[parent] = Mock()
-        session_manager._session_terminals[leaf] = Mock()
-
-        # Close the leaf session
-        session_manager.close_session(leaf)
-
-        # Verify clean removal
-        assert leaf not in session_tree.get_children(parent)
-        assert len(session_tree.get_children(parent)) == 0
-        assert leaf not in session_tree.get_all_sessions()
-        assert parent in session_tree.get_roots()
-
-    def test_close_root_with_children_become_new_roots(self, session_tree, session_manager):
-        """Test closing root session - children become new roots."""
-        # Setup: Create root with multiple children
-        root = TerminalSession(pid=100, pty_fd=200, cwd="/root", title="root")
-        child1 = TerminalSession(pid=101, pty_fd=201, cwd="/child1", title="child1")
-        child2 = TerminalSession(pid=102, pty_fd=202, cwd="/child2", title="child2")
-
-        session_tree.add_node(root)
-        session_tree.add_node(child1, parent=root)
-        session_tree.add_node(child2, parent=root)
-        session_manager.current_session = root
 
-        # Mock VTE cleanup and terminal widgets
-        session_manager._session_terminals[root] = Mock()
-        session_manager._session_terminals[child1] = Mock()
-        session_manager._session_terminals[child2] = Mock()
-
-        # Close the root session
-        session_manager.close_session(root)
-
-        # Verify children became new roots
-        root_nodes = session_tree.get_roots()
-        assert root not in root_nodes
-        assert child1 in root_nodes
-        assert child2 in root_nodes
-        assert len(root_nodes) == 2
-
-        # Verify children have no parent
-        assert session_tree.get_parent(child1) is None
-        assert session_tree.get_parent(child2) is None
-
-    def test_close_middle_node_children_adopted_by_grandparent(self, session_tree, session_manager):
-        """Test closing middle node - children adopted by grandparent."""
-        # Setup: Create three-level hierarchy
-        grandparent = TerminalSession(pid=100, pty_fd=200, cwd="/grand", title="grandparent")
-        parent = TerminalSession(pid=101, pty_fd=201, cwd="/grand/parent", title="parent")
-        child1 = TerminalSession(pid=102, pty_fd=202, cwd="/grand/child1", title="child1")
-        child2 = TerminalSession(pid=103, pty_fd=203, cwd="/grand/child2", title="child2")
-
-        session_tree.add_node(grandparent)
-        session_tree.add_node(parent, parent=grandparent)
-        session_tree.add_node(child1, parent=parent)
-        session_tree.add_node(child2, parent=parent)
-        session_manager.current_session = parent
+class _StubWidget:
+    """Terminal widget stand-in for sessions that only need to be closed."""
 
-        # Mock VTE cleanup and terminal widgets
-        session_manager._session_terminals[grandparent] = Mock()
-        session_manager._session_terminals[parent] = Mock()
-        session_manager._session_terminals[child1] = Mock()
-        session_manager._session_terminals[child2] = Mock()
+    def close(self):
+        pass
 
-        # Close the middle parent session
-        session_manager.close_session(parent)
 
-        # Verify adoption by grandparent
-        grandparent_children = session_tree.get_children(grandparent)
-        assert parent not in grandparent_children
-        assert child1 in grandparent_children
-        assert child2 in grandparent_children
-        assert len(grandparent_children) == 2
-
-        # Verify parent relationships
-        assert session_tree.get_parent(child1) == grandparent
-        assert session_tree.get_parent(child2) == grandparent
-        assert parent not in session_tree.get_all_sessions()
-
-    def test_close_session_complex_adoption_scenario(self, session_tree, session_manager):
-        """Test complex adoption with multiple children and grandchildren."""
-        # Setup: Create complex tree structure
-        #   root
-        #   ├── parent (to be closed)
-        #   │   ├── child1
-        #   │   │   └── grandchild1
-        #   │   └── child2
-        #   └── sibling
+_STUB = _StubWidget()
 
-        root = TerminalSession(pid=100, pty_fd=200, cwd="/root", title="root")
-        parent = TerminalSession(pid=101, pty_fd=201, cwd="/root/parent", title="parent")
-        child1 = TerminalSession(pid=102, pty_fd=202, cwd="/root/child1", title="child1")
-        child2 = TerminalSession(pid=103, pty_fd=203, cwd="/root/child2", title="child2")
-        grandchild1 = TerminalSession(pid=104, pty_fd=204, cwd="/root/grandchild1", title="grandchild1")
-        sibling = TerminalSession(pid=105, pty_fd=205, cwd="/root/sibling", title="sibling")
-
-        session_tree.add_node(root)
-        session_tree.add_node(parent, parent=root)
-        session_tree.add_node(child1, parent=parent)
-        session_tree.add_node(child2, parent=parent)
-        session_tree.add_node(grandchild1, parent=child1)
-        session_tree.add_node(sibling, parent=root)
 
-        session_manager.current_session = parent
+def _install_stubs(session_manager, *sessions):
+    """Register the shared stub widget as the terminal of each session."""
+    session_manager._session_terminals.update(dict.fromkeys(sessions, _STUB))
 
-        # Mock VTE cleanup and terminal widgets
-        session_manager._session_terminals[root] = Mock()
-        session_manager._session_terminals[parent] = Mock()
-        session_manager._session_terminals[child1] = Mock()
-        session_manager._session_terminals[child2] = Mock()
-        session_manager._session_terminals[grandchild1] = Mock()
-        session_manager._session_terminals[sibling] = Mock()
 
-        # Close the parent session
-        session_manager.close_session(parent)
+class TestSessionClosure:
+    """Test cases for session closure and adoption algorithm."""
 
-        # Verify complex adoption
-        root_children = session_tree.get_children(root)
-        assert parent not in root_children
-        assert child1 in root_children
-        assert child2 in root_children
-        assert sibling in root_children
-        assert len(root_children) == 3
+    @pytest.fixture
+    def shortcut_controller(self, session_manager):
+        """Create a test shortcut controller."""
+        return ShortcutController(session_manager)
 
-        # Verify grandchild relationships are preserved
-        assert session_tree.get_parent(grandchild1) == child1
-        assert grandchild1 in session_tree.get_children(child1)
+    @pytest.mark.parametrize(
+        "shape,closed,expected_parents",
+        [
+            pytest.param(
+                [("parent", None), ("leaf", "parent")],
+                "leaf",
+                {"parent": None},
+                id="leaf-clean-removal",
+            ),
+            pytest.param(
+                [("root", None), ("child1", "root"), ("child2", "root")],
+                "root",
+                {"child1": None, "child2": None},
+                id="root-children-become-roots",
+            ),
+            pytest.param(
+                [
+                    ("grandparent", None),
+                    ("parent", "grandparent"),
+                    ("child1", "parent"),
+                    ("child2", "parent"),
+                ],
+                "parent",
+                {"grandparent": None, "child1": "grandparent", "child2": "grandparent"},
+                id="middle-adopted-by-grandparent",
+            ),
+            #   root
+            #   ├── parent (to be closed)
+            #   │   ├── child1
+            #   │   │   └── grandchild1
+            #   │   └── child2
+            #   └── sibling
+            pytest.param(
+                [
+                    ("root", None),
+                    ("parent", "root"),
+                    ("child1", "parent"),
+                    ("child2", "parent"),
+                    ("grandchild1", "child1"),
+                    ("sibling", "root"),
+                ],
+                "parent",
+                {
+                    "root": None,
+                    "child1": "root",
+                    "child2": "root",
+                    "grandchild1": "child1",
+                    "sibling": "root",
+                },
+                id="complex-adoption",
+            ),
+            pytest.param(
+                [
+                    ("grandparent", None),
+                    ("parent", "grandparent"),
+                    ("child_a", "parent"),
+                    ("child_b", "parent"),
+                    ("child_c", "parent"),
+                ],
+                "parent",
+                {
+                    "grandparent": None,
+                    "child_a": "grandparent",
+                    "child_b": "grandparent",
+                    "child_c": "grandparent",
+                },
+                id="multi-child-adoption",
+            ),
+            pytest.param(
+                [
+                    ("level1", None),
+                    ("level2", "level1"),
+                    ("level3", "level2"),
+                    ("level4", "level3"),
+                    ("level5", "level4"),
+                ],
+                "level3",
+                {"level1": None, "level2": "level1", "level4": "level2", "level5": "level4"},
+                id="deep-nesting",
+            ),
+        ],
+    )
+    def test_close_session_adoption(self, session_tree, session_manager, shape, closed, expected_parents):
+        """Test closing a session removes it and its children are adopted by its parent."""
+        # Setup: Build the tree in order, parents before children
+        sessions = {}
+        for index, (title, parent_title) in enumerate(shape):
+            sessions[title] = TerminalSession(
+                pid=100 + index, pty_fd=200 + index, cwd=f"/{title}", title=title
+            )
+            session_tree.add_node(sessions[title], parent=sessions.get(parent_title))
+        session_manager.current_session = sessions[closed]
+
+        # Stub terminal widgets for VTE cleanup
+        _install_stubs(session_manager, *sessions.values())
+
+        session_manager.close_session(sessions[closed])
+
+        # Verify every remaining session has the expected parent
+        actual_parents = {
+            session.title: getattr(session_tree.get_parent(session), "title", None)
+            for session in session_tree.get_all_sessions()
+        }
+        assert actual_parents == expected_parents
+
+        # Verify the children lists and roots agree with the parent links
+        actual_children = {
+            session.title: sorted(child.title for child in session_tree.get_children(session))
+            for session in session_tree.get_all_sessions()
+        }
+        assert actual_children == {
+            title: sorted(child for child, parent in expected_parents.items() if parent == title)
+            for title in expected_parents
+        }
+        assert sorted(root.title for root in session_tree.get_roots()) == sorted(
+            title for title, parent in expected_parents.items() if parent is None
+        )
 
     def test_close_session_signal_propagation(self, session_tree, session_manager):
         """Test that close_session triggers correct signals."""
@@ -186,9 +165,8 @@ class TestSessionClosure:
         session_tree.add_node(child, parent=parent)
         session_manager.current_session = parent
 
-        # Mock VTE cleanup and terminal widgets
-        session_manager._session_terminals[parent] = Mock()
-        session_manager._session_terminals[child] = Mock()
+        # Stub terminal widgets for VTE cleanup
+        _install_stubs(session_manager, parent, child)
 
         # Close the parent session
         session_manager.close_session(parent)
@@ -208,8 +186,8 @@ class TestSessionClosure:
         session_manager.current_session = root
 
         # Mock that there are multiple sessions so close_current_session gets called
-        with patch.object(session_manager, 'get_all_sessions', return_value=[root, child]), \
-             patch.object(session_manager, 'close_current_session') as mock_close:
+        with patch.object(session_manager, 'get_all_sessions', autospec=True, return_value=[root, child]), \
+             patch.object(session_manager, 'close_current_session', autospec=True) as mock_close:
 
             # Execute close_session action
             action = shortcut_controller.get_action("close_session")
@@ -230,7 +208,7 @@ class TestSessionClosure:
         mock_main_window.get_application.return_value = mock_app
         shortcut_controller.main_window = mock_main_window
 
-        with patch.object(session_manager, 'get_all_sessions', return_value=[last_session]):
+        with patch.object(session_manager, 'get_all_sessions', autospec=True, return_value=[last_session]):
             # Execute close_session action
             action = shortcut_controller.get_action("close_session")
             action.activate(None)
@@ -243,7 +221,7 @@ class TestSessionClosure:
         # No current session
         session_manager.current_session = None
 
-        with patch.object(session_manager, 'close_current_session') as mock_close:
+        with patch.object(session_manager, 'close_current_session', autospec=True) as mock_close:
             # Execute close_session action
             action = shortcut_controller.get_action("close_session")
             action.activate(None)
@@ -251,44 +229,6 @@ class TestSessionClosure:
             # Should not call close
             mock_close.assert_not_called()
 
-    def test_multi_child_adoption_preserves_order(self, session_tree, session_manager):
-        """Test that multi-child adoption preserves sibling order."""
-        # Setup: Parent with multiple children in specific order
-        parent = TerminalSession(pid=100, pty_fd=200, cwd="/parent", title="parent")
-        grandparent = TerminalSession(pid=99, pty_fd=199, cwd="/grandparent", title="grandparent")
-        child_a = TerminalSession(pid=101, pty_fd=201, cwd="/parent/a", title="child_a")
-        child_b = TerminalSession(pid=102, pty_fd=202, cwd="/parent/b", title="child_b")
-        child_c = TerminalSession(pid=103, pty_fd=203, cwd="/parent/c", title="child_c")
-
-        session_tree.add_node(grandparent)
-        session_tree.add_node(parent, parent=grandparent)
-        session_tree.add_node(child_a, parent=parent)
-        session_tree.add_node(child_b, parent=parent)
-        session_tree.add_node(child_c, parent=parent)
-
-        session_manager.current_session = parent
-
-        # Record original order
-        original_children = list(session_tree.get_children(parent))
-
-        # Mock VTE cleanup and terminal widgets
-        session_manager._session_terminals[grandparent] = Mock()
-        session_manager._session_terminals[parent] = Mock()
-        session_manager._session_terminals[child_a] = Mock()
-        session_manager._session_terminals[child_b] = Mock()
-        session_manager._session_terminals[child_c] = Mock()
-
-        # Close the parent
-        session_manager.close_session(parent)
-
-        # Verify children are now under grandparent
-        adopted_children = session_tree.get_children(grandparent)
-
-        # All original children should be adopted
-        for child in original_children:
-            assert child in adopted_children
-            assert session_tree.get_parent(child) == grandparent
-
     def test_close_session_error_handling(self, shortcut_controller, session_manager):
         """Test that close_session action handles errors gracefully."""
         # Setup: Session with error-prone cleanup
@@ -296,47 +236,17 @@ class TestSessionClosure:
         session_manager.current_session = session
 
         # Mock get_all_sessions to return multiple sessions
-        with patch.object(session_manager, 'get_all_sessions', return_value=[session, session]), \
-             patch.object(session_manager, 'close_current_session', side_effect=Exception("Cleanup failed")):
+        with patch.object(session_manager, 'get_all_sessions', autospec=True, return_value=[session, session]), \
+             patch.object(
+                 session_manager,
+                 'close_current_session',
+                 autospec=True,
+                 side_effect=Exception("Cleanup failed"),
+             ) as mock_close:
 
             # Should not raise exception
             action = shortcut_controller.get_action("close_session")
             action.activate(None)
 
-    def test_close_session_deep_nesting_adoption(self, session_tree, session_manager):
-        """Test adoption with deep nesting levels."""
-        # Setup: Deep hierarchy (5 levels)
-        level1 = TerminalSession(pid=101, pty_fd=201, cwd="/1", title="level1")
-        level2 = TerminalSession(pid=102, pty_fd=202, cwd="/1/2", title="level2")
-        level3 = TerminalSession(pid=103, pty_fd=203, cwd="/1/2/3", title="level3")  # to be closed
-        level4 = TerminalSession(pid=104, pty_fd=204, cwd="/1/2/3/4", title="level4")
-        level5 = TerminalSession(pid=105, pty_fd=205, cwd="/1/2/3/4/5", title="level5")
-
-        session_tree.add_node(level1)
-        session_tree.add_node(level2, parent=level1)
-        session_tree.add_node(level3, parent=level2)
-        session_tree.add_node(level4, parent=level3)
-        session_tree.add_node(level5, parent=level4)
-
-        session_manager.current_session = level3
-
-        # Mock VTE cleanup and terminal widgets
-        session_manager._session_terminals[level1] = Mock()
-        session_manager._session_terminals[level2] = Mock()
-        session_manager._session_terminals[level3] = Mock()
-        session_manager._session_terminals[level4] = Mock()
-        session_manager._session_terminals[level5] = Mock()
-
-        # Close level3
-        session_manager.close_session(level3)
-
-        # Verify level4 is adopted by level2
-        assert session_tree.get_parent(level4) == level2
-        assert level4 in session_tree.get_children(level2)
-
-        # Verify level5 is still under level4
-        assert session_tree.get_parent(level5) == level4
-        assert level5 in session_tree.get_children(level4)
-
-        # Verify level3 is gone
-        assert level3 not in session_tree.get_all_sessions()
+            # The failing close was attempted
+            mock_close.assert_called_once()
@@ -4,12 +4,11 @@ Unit tests for the SessionSidebar widget.
 Tests the widget structure, TreeView configuration, and selection handling.
 """
 
+from unittest.mock import patch
 
-import gi
-
-gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
+import pytest
 
+from tests._gi import Gtk
 from tree_style_terminal.controllers.sidebar import SidebarController
 from tree_style_terminal.models.session import TerminalSession
 from tree_style_terminal.models.tree import SessionTree
@@ -19,24 +18,21 @@ from tree_style_terminal.widgets.sidebar import SessionSidebar
 class TestSessionSidebar:
     """Test cases for SessionSidebar widget."""
 
-    def test_widget_structure(self):
-        """Test SessionSidebar inherits from Gtk.Box and has tree_view."""
-        tree = SessionTree()
-        controller = SidebarController(tree)
-        sidebar = SessionSidebar(controller)
+    @pytest.fixture(scope="class")
+    def sidebar(self):
+        """Build one empty sidebar for the read-only structure tests."""
+        return SessionSidebar(SidebarController(SessionTree()))
 
+    def test_widget_structure(self, sidebar):
+        """Test SessionSidebar inherits from Gtk.Box and has tree_view."""
         assert isinstance(sidebar, Gtk.Box)
         assert hasattr(sidebar, 'tree_view')
         assert isinstance(sidebar.tree_view, Gtk.TreeView)
         assert hasattr(sidebar, 'scrolled_window')
         assert isinstance(sidebar.scrolled_window, Gtk.ScrolledWindow)
 
-    def test_tree_view_configuration(self):
+    def test_tree_view_configuration(self, sidebar):
         """Test TreeView is configured correctly."""
-        tree = SessionTree()
-        controller = SidebarController(tree)
-        sidebar = SessionSidebar(controller)
-
         assert not sidebar.tree_view.get_headers_visible()
         assert sidebar.tree_view.get_enable_tree_lines()
         assert sidebar.tree_view.get_show_expanders()
@@ -45,12 +41,8 @@ class TestSessionSidebar:
         assert sidebar.tree_view.get_style_context().has_class("transparent-tree")
         assert sidebar.scrolled_window.get_style_context().has_class("transparent-scroll")
 
-    def test_column_setup(self):
+    def test_column_setup(self, sidebar):
         """Test TreeView has exactly one column that expands."""
-        tree = SessionTree()
-        controller = SidebarController(tree)
-        sidebar = SessionSidebar(controller)
-
         columns = sidebar.tree_view.get_columns()
         assert len(columns) == 1
 
@@ -214,3 +206,49 @@ class TestSessionSidebar:
         sidebar._on_clear_title_menu_activate(Gtk.MenuItem())
 
         assert cleared == [session]
+
+    def test_refresh_requests_coalesce_into_one_rebuild(self):
+        """Test repeated refresh calls schedule a single idle rebuild."""
+        tree = SessionTree()
+        controller = SidebarController(tree)
+        sidebar = SessionSidebar(controller)
+        tree.add_node(TerminalSession(pid=1, pty_fd=10, cwd="/one"))
+
+        with patch(
+            "tree_style_terminal.widgets.sidebar.GLib.idle_add",
+            return_value=42,
+        ) as idle_add:
+            sidebar.refresh()
+            sidebar.refresh()
+            sidebar.refresh()
+
+        idle_add.assert_called_once()
+        assert len(controller.tree_store) == 0
+
+        assert sidebar._do_refresh() is False
+        assert len(controller.tree_store) == 1
+        assert sidebar._refresh_source_id == 0
+        assert sidebar.tree_view.get_model() is controller.tree_store
+
+    def test_refresh_keeps_expansion_and_selection(self):
+        """Test a rebuild restores expanded rows and the selection without a callback."""
+        tree = SessionTree()
+        controller = SidebarController(tree)
+        sidebar = SessionSidebar(controller)
+        parent = TerminalSession(pid=1, pty_fd=10, cwd="/parent")
+        child = TerminalSession(pid=2, pty_fd=20, cwd="/parent/child")
+        tree.add_node(parent)
+        tree.add_node(child, parent)
+        controller.sync_with_session_tree()
+
+        selected = []
+        sidebar.set_selection_callback(selected.append)
+        sidebar.select_session(child)
+
+        assert sidebar._do_refresh() is False
+
+        parent_path = controller.tree_store.get_path(controller.find_iter_for_session(parent))
+        assert sidebar.tree_view.row_expanded(parent_path)
+        _model, tree_iter = sidebar.tree_view.get_selection().get_selected()
+        assert controller.get_session_from_iter(tree_iter) == child
+        assert selected == []
@@ -4,10 +4,6 @@ Unit tests for manual SessionTree synchronization.
 Tests the sync path that connects SessionTree changes to TreeStore updates.
 """
 
-import gi
-
-gi.require_version('Gtk', '3.0')
-
 from tree_style_terminal.controllers.sidebar import SidebarController
 from tree_style_terminal.models.session import TerminalSession
 from tree_style_terminal.models.tree import SessionTree
@@ -28,7 +24,7 @@ class TestSessionTreeEvents:
         session = TerminalSession(pid=123, pty_fd=456, cwd="/test")
         tree.add_node(session)
 
-        # Controller sync is explicit; SessionSidebar.refresh() calls this path.
+        # Controller sync is explicit; SessionSidebar.refresh() runs it later from an idle callback.
         controller.sync_with_session_tree()
         assert len(controller.tree_store) == 1
 
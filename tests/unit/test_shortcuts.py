@@ -7,33 +7,17 @@ Tests action creation, callback execution, and state management.
 import logging
 from unittest.mock import Mock, patch
 
-import gi
 import pytest
 
-gi.require_version('Gtk', '3.0')
-gi.require_version('Gio', '2.0')
-from gi.repository import Gio
-
+from tests._gi import Gio
 from tree_style_terminal.config import config_manager
-from tree_style_terminal.controllers.session_manager import SessionManager
 from tree_style_terminal.controllers.shortcuts import ShortcutController
 from tree_style_terminal.models.session import TerminalSession
-from tree_style_terminal.models.tree import SessionTree
 
 
 class TestShortcutController:
     """Test cases for ShortcutController."""
 
-    @pytest.fixture
-    def session_tree(self):
-        """Create a test session tree."""
-        return SessionTree()
-
-    @pytest.fixture
-    def session_manager(self, session_tree):
-        """Create a test session manager."""
-        return SessionManager(session_tree)
-
     @pytest.fixture
     def shortcut_controller(self, session_manager):
         """Create a test shortcut controller."""
@@ -239,6 +223,17 @@ class TestShortcutController:
         assert not shortcut_controller.get_action("terminal_search").get_enabled()
         assert not shortcut_controller.get_action("ai_command_draft").get_enabled()
 
+    def test_update_action_states_skips_unchanged_actions(self, shortcut_controller, session_manager):
+        """Test repeated updates only touch actions whose enabled state changes."""
+        session_manager.current_session = None
+
+        with patch.object(session_manager, 'get_all_sessions', return_value=[]):
+            shortcut_controller.update_action_states()
+            with patch.object(Gio.SimpleAction, 'set_enabled') as mock_set_enabled:
+                shortcut_controller.update_action_states()
+
+        mock_set_enabled.assert_not_called()
+
     def test_close_session_action_last_session(self, shortcut_controller, session_manager):
         """Test close_session action when it's the last session (should quit app)."""
         mock_session = TerminalSession(pid=123, pty_fd=456, cwd="/test", title="test")
@@ -256,6 +251,21 @@ class TestShortcutController:
 
             mock_app.quit.assert_called_once()
 
+    def test_sidebar_actions_call_main_window(self, shortcut_controller):
+        """Test sidebar actions go straight to the main window's sidebar API."""
+        mock_main_window = Mock()
+        shortcut_controller.main_window = mock_main_window
+
+        shortcut_controller.get_action("toggle_sidebar").activate(None)
+        shortcut_controller.get_action("focus_sidebar").activate(None)
+
+        mock_main_window.toggle_sidebar.assert_called_once()
+        mock_main_window.session_sidebar.grab_focus.assert_called_once()
+
+        # No sidebar has been built yet
+        mock_main_window.session_sidebar = None
+        shortcut_controller.get_action("focus_sidebar").activate(None)
+
     def test_additional_actions_exist(self, shortcut_controller):
         """Test that all additional actions are created."""
         assert shortcut_controller.get_action("toggle_sidebar") is not None
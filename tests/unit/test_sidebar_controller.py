@@ -5,11 +5,11 @@ Tests the TreeStore setup, session management, and synchronization
 with the SessionTree model.
 """
 
-import gi
+import sys
 
-gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk
+import pytest
 
+from tests._gi import Gtk
 from tree_style_terminal.controllers.sidebar import SidebarController
 from tree_style_terminal.models.session import TerminalSession
 from tree_style_terminal.models.tree import SessionTree
@@ -18,10 +18,19 @@ from tree_style_terminal.models.tree import SessionTree
 class TestSidebarController:
     """Test cases for SidebarController."""
 
-    def test_init_creates_tree_store_with_correct_columns(self):
+    @pytest.fixture(scope="class")
+    def empty_controller(self):
+        """Build one controller over an empty tree for the read-only checks."""
+        return SidebarController(SessionTree())
+
+    def test_column_indices(self):
+        """Test the TreeStore column indices."""
+        assert SidebarController.COL_OBJECT == 0
+        assert SidebarController.COL_TITLE == 1
+
+    def test_init_creates_tree_store_with_correct_columns(self, empty_controller):
         """Test that initialization creates TreeStore with object and title columns."""
-        session_tree = SessionTree()
-        controller = SidebarController(session_tree)
+        controller = empty_controller
 
         # Verify TreeStore was created
         assert controller.tree_store is not None
@@ -30,14 +39,9 @@ class TestSidebarController:
         # Verify column count (should be 2: object, title)
         assert controller.tree_store.get_n_columns() == 2
 
-        # Verify column indices are defined
-        assert controller.COL_OBJECT == 0
-        assert controller.COL_TITLE == 1
-
-    def test_empty_session_tree_creates_empty_tree_store(self):
+    def test_empty_session_tree_creates_empty_tree_store(self, empty_controller):
         """Test that an empty SessionTree results in an empty TreeStore."""
-        session_tree = SessionTree()
-        controller = SidebarController(session_tree)
+        controller = empty_controller
 
         # TreeStore should be empty
         assert len(controller.tree_store) == 0
@@ -254,6 +258,21 @@ class TestSidebarController:
         controller.sync_with_session_tree()
         assert len(controller.tree_store) == 2  # Now has both roots
 
+    def test_sync_with_deep_session_tree(self):
+        """Test syncing a chain deeper than the Python recursion limit."""
+        session_tree = SessionTree()
+        depth = sys.getrecursionlimit() + 100
+        parent = None
+        for index in range(depth):
+            session = TerminalSession(pid=index, pty_fd=index, cwd=f"/level{index}")
+            session_tree.add_node(session, parent)
+            parent = session
+
+        controller = SidebarController(session_tree)
+
+        assert len(controller._session_to_iter) == depth
+        assert controller.tree_store.iter_depth(controller.find_iter_for_session(parent)) == depth - 1
+
     def test_remove_session_with_adoption_reparents_children(self):
         """Test removing a middle session restores adopted children under the new parent."""
         session_tree = SessionTree()
@@ -281,3 +300,24 @@ class TestSidebarController:
         assert child2_iter is not None
         assert controller.tree_store.get_value(child1_iter, controller.COL_OBJECT) == child1
         assert controller.tree_store.get_value(child2_iter, controller.COL_OBJECT) == child2
+
+    def test_remove_session_with_adoption_keeps_grandchildren(self):
+        """Test adopted children keep their own subtrees in the TreeStore."""
+        session_tree = SessionTree()
+        parent = TerminalSession(pid=1, pty_fd=10, cwd="/parent", title="parent")
+        child = TerminalSession(pid=2, pty_fd=20, cwd="/child", title="child")
+        grandchild = TerminalSession(pid=3, pty_fd=30, cwd="/grandchild", title="grandchild")
+
+        session_tree.add_node(parent)
+        session_tree.add_node(child, parent)
+        session_tree.add_node(grandchild, child)
+        controller = SidebarController(session_tree)
+
+        session_tree.remove_node(parent)
+        controller.remove_session_with_adoption(parent, [child], None)
+
+        assert len(controller.tree_store) == 1
+        child_iter = controller.find_iter_for_session(child)
+        assert controller.tree_store.iter_n_children(child_iter) == 1
+        grandchild_iter = controller.find_iter_for_session(grandchild)
+        assert controller.tree_store.get_value(grandchild_iter, controller.COL_OBJECT) == grandchild
@@ -158,6 +158,22 @@ class TestSessionTree:
         found = tree.find_session_by_pid(999)
         assert found is None
 
+        tree.remove_node(session1)
+        assert tree.find_session_by_pid(123) is None
+
+        # Sessions sharing a pid stay findable after the indexed one is removed
+        first = TerminalSession(pid=200, pty_fd=1, cwd="/first")
+        second = TerminalSession(pid=200, pty_fd=2, cwd="/second")
+        tree.add_node(first)
+        tree.add_node(second)
+        assert tree.find_session_by_pid(200) is first
+
+        tree.remove_node(first)
+        assert tree.find_session_by_pid(200) is second
+
+        tree.remove_node(second)
+        assert tree.find_session_by_pid(200) is None
+
     def test_edge_cases(self):
         """Test edge cases and error conditions."""
         tree = SessionTree()